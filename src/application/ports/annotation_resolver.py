@@ -12,11 +12,14 @@ if TYPE_CHECKING:
     from ..ports.vector_index import VectorIndexPort
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Annotation:
     """
     Normalized PDF annotation from Zotero.
     
+    Frozen with __slots__: annotations are read-only records, and PDFs with
+    hundreds of highlights build many of them.
+    
     Attributes:
         page: Page number (1-indexed, converted from Zotero's 0-indexed)
         quote: Highlighted/quoted text
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import logging
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from ...domain.errors import HybridNotSupported, ProjectNotFound
 from ...domain.policy.retrieval_policy import RetrievalPolicy
@@ -10,6 +12,10 @@ from ..ports.embeddings import EmbeddingPort
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only default for missing payload sections, so the per-hit loop
+# does not allocate a fresh empty dict for every absent key.
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
 
 def query_chunks(
     request: QueryRequest,
@@ -98,7 +104,7 @@ def query_chunks(
     items: list[QueryResultItem] = []
     for hit in hits:
         # Extract payload (Qdrant returns payload at hit["payload"])
-        payload = hit.get("payload", {})
+        payload = hit.get("payload") or _EMPTY
         
         # Extract text and trim to max_chars_per_chunk
         text = payload.get("fulltext", hit.get("text", ""))
@@ -107,7 +113,7 @@ def query_chunks(
                 text = text[: policy.max_chars_per_chunk].rsplit(" ", 1)[0] + "..."
         
         # Extract page span from doc payload
-        doc_payload = payload.get("doc", {})
+        doc_payload = payload.get("doc") or _EMPTY
         page_span_raw = doc_payload.get("page_span", hit.get("page_span"))
         page_span: tuple[int, int] | None = None
         if page_span_raw:
@@ -119,13 +125,13 @@ def query_chunks(
         
         # Extract section information
         section_heading = doc_payload.get("section_heading", payload.get("section"))
-        section_path_raw = doc_payload.get("section_path", [])
+        section_path_raw = doc_payload.get("section_path", ())
         section_path: list[str] | None = None
         if section_path_raw and isinstance(section_path_raw, list):
             section_path = [str(s) for s in section_path_raw if s]
         
         # Extract citation metadata from zotero payload
-        zotero_payload = payload.get("zotero", {})
+        zotero_payload = payload.get("zotero") or _EMPTY
         citekey = zotero_payload.get("citekey") if zotero_payload else None
         doi = zotero_payload.get("doi") if zotero_payload else None
         url = zotero_payload.get("url") if zotero_payload else None
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -35,6 +35,8 @@ class ContentFingerprint:
     embedding_model: str
     chunking_policy_version: str
     embedding_policy_version: str
+    # (content_hash, file_mtime, file_size), precomputed so matches() is one tuple compare
+    _match_key: tuple[str, str, int] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate content fingerprint."""
@@ -52,6 +54,7 @@ class ContentFingerprint:
             raise ValueError("chunking_policy_version must be non-empty")
         if not self.embedding_policy_version:
             raise ValueError("embedding_policy_version must be non-empty")
+        object.__setattr__(self, "_match_key", (self.content_hash, self.file_mtime, self.file_size))
 
     def matches(
         self,
@@ -68,14 +71,11 @@ class ContentFingerprint:
         Returns:
             True if fingerprints match (document unchanged)
         """
-        if self.content_hash != other.content_hash:
-            return False
-
         if check_metadata:
-            if self.file_mtime != other.file_mtime or self.file_size != other.file_size:
-                return False  # Hash collision protection
+            # Hash + mtime + size must all agree (hash collision protection)
+            return self._match_key == other._match_key
 
-        return True
+        return self.content_hash == other.content_hash
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize to JSON-compatible dict."""
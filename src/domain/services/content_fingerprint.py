@@ -4,20 +4,76 @@ from __future__ import annotations
 
 import hashlib
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 from src.domain.models.content_fingerprint import ContentFingerprint
 
 
+# Preview size: first 1MB of file content for hashing
+_PREVIEW_SIZE_BYTES = 1024 * 1024  # 1 MB
+
+
+@lru_cache(maxsize=1024)
+def _preview_hasher(resolved_path: str, mtime_ns: int, file_size: int) -> Any:
+    """
+    SHA-256 state after the file-dependent prefix (preview + file_size).
+    
+    Shared by every model/policy combination for the same file version; callers
+    must copy() it before updating.
+    """
+    with open(resolved_path, "rb") as f:
+        preview = f.read(_PREVIEW_SIZE_BYTES)
+
+    hash_obj = hashlib.sha256()
+    hash_obj.update(preview)
+    hash_obj.update(str(file_size).encode("utf-8"))
+    return hash_obj
+
+
+@lru_cache(maxsize=1024)
+def _fingerprint_for(
+    resolved_path: str,
+    mtime_ns: int,
+    file_mtime: str,
+    file_size: int,
+    embedding_model: str,
+    chunking_policy_version: str,
+    embedding_policy_version: str,
+) -> ContentFingerprint:
+    """
+    Fingerprint a file once per (path, mtime, size, model, policy versions).
+    
+    mtime_ns and file_size are part of the key so an edited file is re-read;
+    a model or policy change only re-hashes the short suffix.
+    """
+    # Compute content hash: preview + file_size + embedding_model + policy versions
+    hash_obj = _preview_hasher(resolved_path, mtime_ns, file_size).copy()
+    hash_obj.update(embedding_model.encode("utf-8"))
+    hash_obj.update(chunking_policy_version.encode("utf-8"))
+    hash_obj.update(embedding_policy_version.encode("utf-8"))
+
+    return ContentFingerprint(
+        content_hash=hash_obj.hexdigest(),
+        file_mtime=file_mtime,
+        file_size=file_size,
+        embedding_model=embedding_model,
+        chunking_policy_version=chunking_policy_version,
+        embedding_policy_version=embedding_policy_version,
+    )
+
+
 class ContentFingerprintService:
     """
     Domain service for computing and comparing content fingerprints.
     
-    This service is pure (no I/O) and deterministic.
+    compute_fingerprint stats and reads the file, and keeps process-wide caches:
+    results are memoized per (path, mtime_ns, size), so a rewrite that keeps the
+    same mtime and size is served from the cache without re-reading the file.
     """
 
-    # Preview size: first 1MB of file content for hashing
-    PREVIEW_SIZE_BYTES = 1024 * 1024  # 1 MB
+    PREVIEW_SIZE_BYTES = _PREVIEW_SIZE_BYTES
 
     @staticmethod
     def compute_fingerprint(
@@ -29,6 +85,9 @@ class ContentFingerprintService:
         """
         Compute content fingerprint for a file.
         
+        Results are memoized by (resolved path, mtime, size, model, policy versions),
+        so an unchanged file is read and hashed only once per process.
+        
         Fingerprint includes:
         - Content hash: SHA256 of (first 1MB preview + file_size + embedding_model + policy versions)
         - File metadata: mtime (ISO format) + file_size for collision protection
@@ -49,31 +108,16 @@ class ContentFingerprintService:
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        # Get file metadata
+        # Stat once; repeat calls for an unchanged file reuse the cached hash
         stat = file_path.stat()
-        file_size = stat.st_size
-        file_mtime = datetime.fromtimestamp(stat.st_mtime).isoformat()
-
-        # Read file preview (first 1MB)
-        with file_path.open("rb") as f:
-            preview = f.read(ContentFingerprintService.PREVIEW_SIZE_BYTES)
-
-        # Compute content hash: preview + file_size + embedding_model + policy versions
-        hash_obj = hashlib.sha256()
-        hash_obj.update(preview)
-        hash_obj.update(str(file_size).encode("utf-8"))
-        hash_obj.update(embedding_model.encode("utf-8"))
-        hash_obj.update(chunking_policy_version.encode("utf-8"))
-        hash_obj.update(embedding_policy_version.encode("utf-8"))
-        content_hash = hash_obj.hexdigest()
-
-        return ContentFingerprint(
-            content_hash=content_hash,
-            file_mtime=file_mtime,
-            file_size=file_size,
-            embedding_model=embedding_model,
-            chunking_policy_version=chunking_policy_version,
-            embedding_policy_version=embedding_policy_version,
+        return _fingerprint_for(
+            str(file_path.resolve()),
+            stat.st_mtime_ns,
+            datetime.fromtimestamp(stat.st_mtime).isoformat(),
+            stat.st_size,
+            embedding_model,
+            chunking_policy_version,
+            embedding_policy_version,
         )
 
     @staticmethod
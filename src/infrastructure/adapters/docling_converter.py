@@ -5,6 +5,7 @@ import logging
 import re
 import sys
 import time
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from pathlib import Path
 from typing import Mapping, Any, TYPE_CHECKING
@@ -32,8 +33,11 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
-# Module-level cache for process-scoped converter instances (T004)
-_converter_cache: dict[str, "DoclingConverterAdapter"] = {}
+# Module-level cache for process-scoped converter instances (T004). Bounded LRU:
+# each converter holds its ML models, so a long-running server seeing many
+# configurations evicts the least recently used one instead of growing unboundedly
+_CONVERTER_CACHE_MAXSIZE = 8
+_converter_cache: OrderedDict[str, "DoclingConverterAdapter"] = OrderedDict()
 
 
 class TimeoutError(Exception):
@@ -288,6 +292,7 @@ class DoclingConverterAdapter:
         - Timeout enforcement: Thread-based timeout works consistently across platforms
         - Note: If conversion is already executing when timeout occurs, it may continue
           in background thread until completion, but the result will not be returned
+          (the executor is shut down without waiting, so the caller is not blocked)
         """
         def _perform_conversion(page_range: tuple[int, int] | None = None) -> Any:
             """Perform the actual conversion in a separate thread."""
@@ -298,51 +303,55 @@ class DoclingConverterAdapter:
             return self.converter.convert(source_path)
         
         # Use ThreadPoolExecutor for cross-platform timeout enforcement (T059, T060)
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(_perform_conversion, page_range)
-            try:
-                # Wait for conversion with timeout - works on all platforms
-                result = future.result(timeout=self.DOCUMENT_TIMEOUT_SECONDS)
-                return result
-            except FutureTimeoutError:
-                # Conversion exceeded timeout - cancel if possible
-                # Note: If conversion is already executing, cancellation may not interrupt it
-                # but the timeout exception will be raised
-                future.cancel()
-                timeout_error = TimeoutError(
-                    f"Document conversion exceeded {self.DOCUMENT_TIMEOUT_SECONDS}s timeout. "
-                    f"Page timeout limit: {self.PAGE_TIMEOUT_SECONDS}s per page."
-                )
-                # Enhanced diagnostic logging for timeout failures (T103)
-                logger.error(
-                    f"Document conversion timeout after {self.DOCUMENT_TIMEOUT_SECONDS}s: {source_path}",
-                    extra={
-                        "source_path": source_path,
-                        "timeout_seconds": self.DOCUMENT_TIMEOUT_SECONDS,
-                        "page_timeout_seconds": self.PAGE_TIMEOUT_SECONDS,
-                        "diagnostic": "Document-level timeout occurred. This may indicate: "
-                                      "1. Document is extremely large (>1000 pages), "
-                                      "2. Complex document structure requiring extensive processing, "
-                                      "3. Resource constraints (CPU/memory). "
-                                      "Consider splitting large documents or increasing timeout limits.",
-                    },
-                    exc_info=True,
-                )
-                raise timeout_error
-            except Exception as e:
-                # Re-raise any other exceptions from conversion
-                # T103: Enhanced diagnostic logging for conversion failures
-                logger.error(
-                    f"Document conversion failed during processing: {e}",
-                    extra={
-                        "source_path": source_path,
-                        "timeout_seconds": self.DOCUMENT_TIMEOUT_SECONDS,
-                        "diagnostic": "Conversion error occurred during document processing. "
-                                      "Check document format, corruption, or system resources.",
-                    },
-                    exc_info=True,
-                )
-                raise
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(_perform_conversion, page_range)
+        try:
+            # Wait for conversion with timeout - works on all platforms
+            result = future.result(timeout=self.DOCUMENT_TIMEOUT_SECONDS)
+            return result
+        except FutureTimeoutError:
+            # Conversion exceeded timeout - cancel if possible
+            # Note: If conversion is already executing, cancellation may not interrupt it
+            # but the timeout exception will be raised
+            future.cancel()
+            timeout_error = TimeoutError(
+                f"Document conversion exceeded {self.DOCUMENT_TIMEOUT_SECONDS}s timeout. "
+                f"Page timeout limit: {self.PAGE_TIMEOUT_SECONDS}s per page."
+            )
+            # Enhanced diagnostic logging for timeout failures (T103)
+            logger.error(
+                f"Document conversion timeout after {self.DOCUMENT_TIMEOUT_SECONDS}s: {source_path}",
+                extra={
+                    "source_path": source_path,
+                    "timeout_seconds": self.DOCUMENT_TIMEOUT_SECONDS,
+                    "page_timeout_seconds": self.PAGE_TIMEOUT_SECONDS,
+                    "diagnostic": "Document-level timeout occurred. This may indicate: "
+                                  "1. Document is extremely large (>1000 pages), "
+                                  "2. Complex document structure requiring extensive processing, "
+                                  "3. Resource constraints (CPU/memory). "
+                                  "Consider splitting large documents or increasing timeout limits.",
+                },
+                exc_info=True,
+            )
+            raise timeout_error
+        except Exception as e:
+            # Re-raise any other exceptions from conversion
+            # T103: Enhanced diagnostic logging for conversion failures
+            logger.error(
+                f"Document conversion failed during processing: {e}",
+                extra={
+                    "source_path": source_path,
+                    "timeout_seconds": self.DOCUMENT_TIMEOUT_SECONDS,
+                    "diagnostic": "Conversion error occurred during document processing. "
+                                  "Check document format, corruption, or system resources.",
+                },
+                exc_info=True,
+            )
+            raise
+        finally:
+            # Don't block on a hung conversion: a timed-out worker keeps running in
+            # the background, but the caller gets TimeoutError as soon as it fires
+            executor.shutdown(wait=False, cancel_futures=True)
     
     def _extract_page_map(self, doc: Any, plain_text: str) -> dict[int, tuple[int, int]]:
         """
@@ -1113,8 +1122,9 @@ def get_converter(
     Behavior:
         - First call: Creates new DoclingConverterAdapter, caches it, returns instance
         - Subsequent calls: Returns cached instance (no reinitialization overhead)
-        - Cache key: f"converter:{config_hash or 'default'}"
-        - Lifetime: Process-scoped (cleared only on process termination)
+        - Cache key: f"converter:{config_hash or 'default'}:..." plus the settings
+        - Lifetime: Process-scoped; at most _CONVERTER_CACHE_MAXSIZE configurations are
+          kept, evicting the least recently used one
     
     Thread Safety:
         - Module-level cache is safe for single-user CLI (no concurrent access expected)
@@ -1153,7 +1163,11 @@ def get_converter(
             do_picture_description=do_picture_description,
             generate_page_images=generate_page_images,
         )
+        if len(_converter_cache) > _CONVERTER_CACHE_MAXSIZE:
+            evicted_key, _ = _converter_cache.popitem(last=False)
+            logger.debug(f"Evicted least recently used converter (cache_key={evicted_key})")
     else:
         logger.debug(f"Reusing cached converter instance (cache_key={cache_key})")
+        _converter_cache.move_to_end(cache_key)
     
     return _converter_cache[cache_key]
@@ -104,7 +104,8 @@ class FastEmbedAdapter:
         try:
             vectors = []
             for vec in self._engine.embed(texts):  # type: ignore[union-attr]
-                vectors.append(list(map(float, vec)))
+                # ndarray.tolist() yields Python floats in a single C-level pass
+                vectors.append(vec.tolist())
             return vectors
         except Exception as e:
             # Fallback on error
@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 import uuid
-from typing import Mapping, Any, Sequence
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Mapping, Any, Sequence
+
+import numpy as np
 
 from ...domain.errors import EmbeddingModelMismatch, ProjectNotFound
 
+if TYPE_CHECKING:
+    from qdrant_client import models
+
 try:
     from qdrant_client import QdrantClient
     from qdrant_client.models import (
@@ -14,38 +23,118 @@ try:
         VectorParams,
         SparseVectorParams,
         PointStruct,
+        Batch,
         Filter,
         FieldCondition,
         MatchValue,
         CollectionStatus,
         PayloadSchemaType,
+        TextIndexParams,
+        TextIndexType,
+        TokenizerType,
+        KeywordIndexParams,
+        KeywordIndexType,
         Query,
         Fusion,
+        FusionQuery,
+        Prefetch,
+        MatchText,
+        ScalarQuantization,
+        ScalarQuantizationConfig,
+        ScalarType,
+        SearchParams,
+        QuantizationSearchParams,
+        HnswConfigDiff,
     )
 except Exception:  # pragma: no cover
     QdrantClient = None  # type: ignore
     VectorParams = None  # type: ignore
     SparseVectorParams = None  # type: ignore
     PointStruct = None  # type: ignore
+    Batch = None  # type: ignore
     Filter = None  # type: ignore
     FieldCondition = None  # type: ignore
     MatchValue = None  # type: ignore
     CollectionStatus = None  # type: ignore
     PayloadSchemaType = None  # type: ignore
+    TextIndexParams = None  # type: ignore
+    TextIndexType = None  # type: ignore
+    TokenizerType = None  # type: ignore
+    KeywordIndexParams = None  # type: ignore
+    KeywordIndexType = None  # type: ignore
     Query = None  # type: ignore
     Fusion = None  # type: ignore
+    FusionQuery = None  # type: ignore
+    Prefetch = None  # type: ignore
+    MatchText = None  # type: ignore
+    ScalarQuantization = None  # type: ignore
+    ScalarQuantizationConfig = None  # type: ignore
+    ScalarType = None  # type: ignore
+    SearchParams = None  # type: ignore
+    QuantizationSearchParams = None  # type: ignore
+    HnswConfigDiff = None  # type: ignore
 
 logger = logging.getLogger(__name__)
 
+# Upsert micro-batch size and how many batches may be built ahead of the
+# batch currently being sent to Qdrant
+_UPSERT_BATCH_SIZE = 64
+_UPSERT_MAX_PENDING_BATCHES = 4
+
+# Candidates fetched per hybrid prefetch branch before server-side RRF fusion
+_HYBRID_PREFETCH_LIMIT = 20
+
+# Quantized-search oversampling: fetch this many times top_k candidates by their
+# int8 scores, then rescore them against the original float32 vectors
+_QUANTIZATION_OVERSAMPLING = 2.0
+
+# HNSW graph settings for new collections: m links per node and the ef_construct
+# build-time beam. Larger values raise recall at the cost of RAM and indexing time.
+_HNSW_M = 16
+_HNSW_EF_CONSTRUCT = 100
+
+# Default search-time beam (hnsw_ef). Qdrant otherwise searches with ef_construct;
+# for RAG-sized top_k (~10) a beam of 64 keeps recall while visiting fewer nodes.
+# Raise it per query for higher recall, lower it for latency; never below top_k.
+_DEFAULT_HNSW_EF = 64
+
+# Module-level cache of collections already ensured in this process, keyed by
+# (Qdrant URL, collection name) -> (dense_model_id, sparse_model_id), so repeat
+# upserts skip the existence check and model-binding round trips
+_ensured_collections: dict[tuple[str, str], tuple[str, str | None]] = {}
+
+# Module-level cache for process-scoped adapter instances, mirroring the
+# converter cache, so each process connects to Qdrant once
+_qdrant_cache: dict[str, "QdrantIndexAdapter"] = {}
+
+# Backoff between reconnection attempts for a cached adapter on the in-memory
+# fallback: each failed attempt costs a connect timeout per transport, so retries
+# start after 5s and double up to 5 minutes
+_RECONNECT_INITIAL_DELAY = 5.0
+_RECONNECT_MAX_DELAY = 300.0
+
 # Fixed namespace UUID for deterministic ID conversion
 _NAMESPACE_UUID = uuid.UUID('6ba7b810-9dad-11d1-80b4-00c04fd430c8')
 
 
 def _string_to_uuid(id_string: str) -> uuid.UUID:
-    """Convert a string ID to a UUID deterministically."""
+    """
+    Convert a string ID to a UUID deterministically.
+    
+    Re-upserting a chunk therefore targets the same point, and Qdrant's point-id
+    index deduplicates it; existence checks should use ids (retrieve/HasIdCondition),
+    not a payload match.
+    """
     return uuid.uuid5(_NAMESPACE_UUID, id_string)
 
 
+@lru_cache(maxsize=1024)
+def _collection_name_for(project_id: str) -> str:
+    """Map a project ID to its collection name, memoized since every operation needs it."""
+    # Replace / with - and prefix with proj-
+    return f"proj-{project_id.replace('/', '-')}"
+
+
 class QdrantIndexAdapter:
     """
     Adapter for Qdrant vector database operations.
@@ -54,32 +143,116 @@ class QdrantIndexAdapter:
     payload indexes, and full-text search support for hybrid retrieval.
     """
     
-    def __init__(self, url: str = "http://localhost:6333", create_fulltext_index: bool = True) -> None:
+    def __init__(
+        self,
+        url: str = "http://localhost:6333",
+        create_fulltext_index: bool = True,
+        scalar_quantization: bool = True,
+        prefer_grpc: bool = True,
+    ) -> None:
         """
         Initialize Qdrant adapter.
         
         Args:
             url: Qdrant server URL
             create_fulltext_index: Whether to create full-text index for hybrid search
+            scalar_quantization: Whether new collections keep an int8 copy of the dense
+                vectors in RAM (originals on disk) and searches rescore with them
+            prefer_grpc: Talk to Qdrant over gRPC (port 6334: protobuf over HTTP/2) rather
+                than REST/JSON; falls back to REST if the gRPC port is unreachable
         """
         self.url = url
         self.create_fulltext_index = create_fulltext_index
-        self._client = None
-        if QdrantClient is not None:
-            try:
-                client = QdrantClient(url=url)
-                # Test connection by attempting to list collections
-                try:
-                    client.get_collections()
-                    self._client = client
-                except Exception:
-                    logger.warning(f"Failed to connect to Qdrant at {url}. Using in-memory fallback.")
-                    self._client = None
-            except Exception as e:
-                logger.warning(f"Failed to initialize Qdrant client: {e}. Using in-memory fallback.")
-                self._client = None
+        self.scalar_quantization = scalar_quantization
+        self.prefer_grpc = prefer_grpc
+        self._client: QdrantClient | None = None
         # In-memory fallback store for testing/development
         self._local: dict[str, dict[str, Any]] = {}  # collection_name -> {model_id, items}
+        # Monotonic deadline before which _retry_connection() won't attempt to connect
+        self._reconnect_delay = _RECONNECT_INITIAL_DELAY
+        self._next_reconnect_at = 0.0
+        if QdrantClient is not None and not self._reconnect():
+            logger.warning(f"Failed to connect to Qdrant at {url}. Using in-memory fallback.")
+            self._next_reconnect_at = time.monotonic() + self._reconnect_delay
+
+    def _reconnect(self) -> bool:
+        """
+        Try to connect to Qdrant, preferring gRPC and falling back to REST.
+        
+        Returns:
+            True if a client is connected (it is stored in self._client)
+        """
+        if QdrantClient is None:
+            return False
+        transports = [True, False] if self.prefer_grpc else [False]
+        for use_grpc in transports:
+            self._client = self._connect(self.url, prefer_grpc=use_grpc)
+            if self._client is not None:
+                return True
+        return False
+
+    def _retry_connection(self) -> bool:
+        """
+        Reconnect an adapter on the in-memory fallback, rate-limited by exponential backoff.
+        
+        Attempts made before the backoff deadline return immediately. On success,
+        anything written to the in-memory store during the outage is discarded
+        (with a warning), since the server is the source of truth from then on.
+        
+        Returns:
+            True if a client is connected
+        """
+        if self._client is not None:
+            return True
+        now = time.monotonic()
+        if now < self._next_reconnect_at:
+            return False
+        if not self._reconnect():
+            self._reconnect_delay = min(self._reconnect_delay * 2, _RECONNECT_MAX_DELAY)
+            self._next_reconnect_at = now + self._reconnect_delay
+            logger.debug(f"Qdrant at {self.url} still unreachable; next retry in {self._reconnect_delay:.0f}s")
+            return False
+        if self._local:
+            logger.warning(
+                f"Reconnected to Qdrant at {self.url}; discarding {len(self._local)} "
+                f"in-memory collection(s) written while it was unreachable"
+            )
+            self._local.clear()
+        else:
+            logger.info(f"Reconnected to Qdrant at {self.url}")
+        self._reconnect_delay = _RECONNECT_INITIAL_DELAY
+        return True
+
+    @staticmethod
+    def _connect(url: str, prefer_grpc: bool) -> QdrantClient | None:
+        """
+        Create a Qdrant client and verify the server answers over the chosen transport.
+        
+        Args:
+            url: Qdrant server URL
+            prefer_grpc: Whether to use the gRPC transport
+        
+        Returns:
+            Connected QdrantClient, or None if the server could not be reached
+        """
+        transport = "gRPC" if prefer_grpc else "REST"
+        try:
+            client = QdrantClient(url=url, prefer_grpc=prefer_grpc)
+            # Test connection by attempting to list collections
+            client.get_collections()
+            return client
+        except Exception as e:
+            logger.debug(f"Could not reach Qdrant at {url} over {transport}: {e}")
+            return None
+
+    def _forget_ensured_collection(self, collection_name: str) -> None:
+        """
+        Drop a collection from the ensured-collection cache.
+        
+        Called when Qdrant rejects operations on it (e.g. it was deleted outside
+        this process), so the next upsert re-checks and re-creates it.
+        """
+        _ensured_collections.pop((self.url, collection_name), None)
 
     def _collection_name(self, project_id: str) -> str:
         """
@@ -91,8 +264,7 @@ class QdrantIndexAdapter:
         Returns:
             Collection name (e.g., "proj-citeloom-clean-arch")
         """
-        # Replace / with - and prefix with proj-
-        return f"proj-{project_id.replace('/', '-')}"
+        return _collection_name_for(project_id)
 
     def _ensure_collection(
         self,
@@ -131,10 +303,17 @@ class QdrantIndexAdapter:
                 }
             return
         
+        cache_key = (self.url, collection_name)
+        if recreate:
+            _ensured_collections.pop(cache_key, None)
+        else:
+            ensured = _ensured_collections.get(cache_key)
+            # A model change falls through so the write-guard below can reject it
+            if ensured is not None and ensured[0] == dense_model_id and sparse_model_id in (None, ensured[1]):
+                return
+        
         try:
-            # Check if collection exists
-            collections = self._client.get_collections()
-            collection_exists = any(c.name == collection_name for c in collections.collections)
+            collection_exists = self._client.collection_exists(collection_name)
             
             if recreate and collection_exists:
                 self._client.delete_collection(collection_name)
@@ -142,11 +321,15 @@ class QdrantIndexAdapter:
             
             if not collection_exists:
                 # Create collection with named vectors (dense and optional sparse)
+                # int8 scalar quantization keeps a 4x smaller copy of the dense vectors
+                # in RAM for scoring; the float32 originals only serve rescoring, so
+                # they can live on disk
+                quantize = self.scalar_quantization and ScalarQuantization is not None
                 vectors_config: dict[str, Any] = {
                     "dense": VectorParams(
                         size=vector_size,
                         distance=Distance.COSINE,
-                        on_disk=on_disk_vectors,
+                        on_disk=on_disk_vectors or quantize,
                     ),
                 }
                 
@@ -164,9 +347,18 @@ class QdrantIndexAdapter:
                     optimizers_config={
                         "indexing_threshold": 20000,  # Default: enable indexing
                     },
-                    hnsw_config={
-                        "on_disk": on_disk_hnsw,
-                    } if on_disk_hnsw else None,
+                    hnsw_config=HnswConfigDiff(
+                        m=_HNSW_M,
+                        ef_construct=_HNSW_EF_CONSTRUCT,
+                        on_disk=on_disk_hnsw,
+                    ),
+                    quantization_config=ScalarQuantization(
+                        scalar=ScalarQuantizationConfig(
+                            type=ScalarType.INT8,
+                            quantile=0.99,
+                            always_ram=True,
+                        ),
+                    ) if quantize else None,
                 )
                 
                 # Bind dense model for text-based queries
@@ -302,6 +494,8 @@ class QdrantIndexAdapter:
                                 f"Sparse model binding check/set for '{sparse_model_id}' on '{collection_name}': {e}",
                                 extra={"collection_name": collection_name, "sparse_model_id": sparse_model_id},
                             )
+            
+            _ensured_collections[cache_key] = (dense_model_id, sparse_model_id)
         except EmbeddingModelMismatch:
             raise
         except Exception as e:
@@ -335,10 +529,10 @@ class QdrantIndexAdapter:
         Creates collection with:
         - Named vectors: 'dense' and optionally 'sparse'
         - Model bindings via set_model() and set_sparse_model()
-        - Payload indexes: keyword on project_id, doc_id, citekey, year, tags; full-text on chunk_text
+        - Payload indexes: keyword on project_id, doc_id, citekey, tags; integer on year; full-text on chunk_text
         - On-disk storage flags if specified
         """
-        collection_name = self._collection_name(project_id)
+        collection_name = _collection_name_for(project_id)
         
         # Determine vector size from dense model (default to 384 for common models)
         # In practice, this should come from the embedding model configuration
@@ -358,111 +552,64 @@ class QdrantIndexAdapter:
         """
         Create payload indexes for filtering and full-text search.
         
-        Creates keyword indexes on: project_id, doc_id, citekey, year, tags
-        Creates full-text index on: chunk_text (if hybrid enabled)
+        Called right after collection creation, before the first upsert, so
+        filtered searches never fall back to a full payload scan.
+        
+        Creates keyword indexes on: project_id (as tenant index), doc_id, citekey, tags,
+        zotero.item_key, zotero.attachment_key; an integer index on: year (stored as int, matched as int);
+        and a full-text index on: chunk_text (if create_fulltext_index)
         
         Args:
             collection_name: Collection name
         """
         if self._client is None:
             return
-        
-        try:
-            # Create keyword indexes on high-cardinality filter fields
-            # Qdrant's create_payload_index method creates indexes for fast filtering
-            keyword_fields = ["project_id", "doc_id", "citekey", "year", "tags"]
-            
-            # T095: Add keyword indexes on zotero.item_key and zotero.attachment_key
-            # Note: These are nested fields, so we index them as nested paths
-            zotero_key_fields = ["zotero.item_key", "zotero.attachment_key"]
-            
-            for field_name in keyword_fields:
-                try:
-                    # Create keyword index using create_payload_index
-                    # Note: Qdrant API may vary by version
-                    # For keyword indexes, use PayloadSchemaType.KEYWORD
-                    if PayloadSchemaType is not None:
-                        from qdrant_client.models import PayloadSchemaType as PST
-                        self._client.create_payload_index(
-                            collection_name=collection_name,
-                            field_name=field_name,
-                            field_schema=PST.KEYWORD,
-                        )
-                        logger.debug(
-                            f"Created keyword index on '{field_name}' for collection '{collection_name}'",
-                            extra={"collection_name": collection_name, "field_name": field_name},
-                        )
-                    else:
-                        # Fallback: Qdrant may auto-index fields used in filters
-                        logger.debug(
-                            f"Payload index creation skipped (auto-index may apply): '{field_name}'",
-                            extra={"collection_name": collection_name, "field_name": field_name},
-                        )
-                except Exception as idx_error:
-                    # Some Qdrant versions auto-index keyword fields
-                    logger.debug(
-                        f"Keyword index creation attempted for '{field_name}' (may auto-index): {idx_error}",
-                        extra={"collection_name": collection_name, "field_name": field_name},
-                    )
-            
-            # T095: Create keyword indexes on zotero.item_key and zotero.attachment_key
-            for field_name in zotero_key_fields:
-                try:
-                    if PayloadSchemaType is not None:
-                        from qdrant_client.models import PayloadSchemaType as PST
-                        self._client.create_payload_index(
-                            collection_name=collection_name,
-                            field_name=field_name,
-                            field_schema=PST.KEYWORD,
-                        )
-                        logger.debug(
-                            f"Created keyword index on '{field_name}' for collection '{collection_name}'",
-                            extra={"collection_name": collection_name, "field_name": field_name},
-                        )
-                    else:
-                        logger.debug(
-                            f"Payload index creation skipped (auto-index may apply): '{field_name}'",
-                            extra={"collection_name": collection_name, "field_name": field_name},
-                        )
-                except Exception as idx_error:
-                    # Some Qdrant versions auto-index keyword fields
-                    logger.debug(
-                        f"Keyword index creation attempted for '{field_name}' (may auto-index): {idx_error}",
-                        extra={"collection_name": collection_name, "field_name": field_name},
-                    )
-            
-            # Create full-text index on chunk_text field (if hybrid enabled)
-            if self.create_fulltext_index:
-                try:
-                    # Create full-text index on 'chunk_text' payload field
-                    # This enables BM25/full-text search for hybrid queries
-                    if PayloadSchemaType is not None:
-                        from qdrant_client.models import PayloadSchemaType as PST
-                        self._client.create_payload_index(
-                            collection_name=collection_name,
-                            field_name="chunk_text",
-                            field_schema=PST.TEXT,
-                        )
-                        logger.info(
-                            f"Created full-text index on 'chunk_text' for collection '{collection_name}'",
-                            extra={"collection_name": collection_name},
-                        )
-                    else:
-                        logger.info(
-                            f"Full-text index enabled for '{collection_name}' on 'chunk_text' field (may auto-index)",
-                            extra={"collection_name": collection_name},
-                        )
-                except Exception as idx_error:
-                    # Some Qdrant versions auto-index full-text fields
-                    logger.debug(
-                        f"Full-text index creation attempted (may auto-index): {idx_error}",
-                        extra={"collection_name": collection_name},
-                    )
-        except Exception as e:
-            logger.warning(
-                f"Failed to create payload indexes for '{collection_name}': {e}",
+        if PayloadSchemaType is None:
+            # Fallback: Qdrant may auto-index fields used in filters
+            logger.debug(
+                f"Payload index creation skipped (auto-index may apply) for '{collection_name}'",
                 extra={"collection_name": collection_name},
             )
+            return
+        
+        field_schemas: dict[str, Any] = {
+            # Tenant index: Qdrant co-locates each project's points on disk, so a
+            # project-filtered search scans only that tenant's segments if a
+            # collection ever holds more than one project
+            "project_id": KeywordIndexParams(type=KeywordIndexType.KEYWORD, is_tenant=True),
+            "doc_id": PayloadSchemaType.KEYWORD,
+            "citekey": PayloadSchemaType.KEYWORD,
+            "year": PayloadSchemaType.INTEGER,
+            "tags": PayloadSchemaType.KEYWORD,
+            # T095: keyword indexes on nested Zotero keys
+            "zotero.item_key": PayloadSchemaType.KEYWORD,
+            "zotero.attachment_key": PayloadSchemaType.KEYWORD,
+        }
+        if self.create_fulltext_index:
+            # Enables BM25/full-text search for hybrid queries
+            field_schemas["chunk_text"] = TextIndexParams(
+                type=TextIndexType.TEXT,
+                tokenizer=TokenizerType.WORD,
+                lowercase=True,
+            )
+        
+        for field_name, field_schema in field_schemas.items():
+            try:
+                self._client.create_payload_index(
+                    collection_name=collection_name,
+                    field_name=field_name,
+                    field_schema=field_schema,
+                )
+                logger.debug(
+                    f"Created payload index on '{field_name}' for collection '{collection_name}'",
+                    extra={"collection_name": collection_name, "field_name": field_name},
+                )
+            except Exception as idx_error:
+                # Some Qdrant versions auto-index keyword and full-text fields
+                logger.debug(
+                    f"Payload index creation attempted for '{field_name}' (may auto-index): {idx_error}",
+                    extra={"collection_name": collection_name, "field_name": field_name},
+                )
 
     def disable_indexing(self, project_id: str) -> None:
         """
@@ -477,7 +624,7 @@ class QdrantIndexAdapter:
         Raises:
             RuntimeError: If collection doesn't exist or update fails
         """
-        collection_name = self._collection_name(project_id)
+        collection_name = _collection_name_for(project_id)
         
         if self._client is None:
             # In-memory fallback: no-op
@@ -528,7 +675,7 @@ class QdrantIndexAdapter:
         Raises:
             RuntimeError: If collection doesn't exist or update fails
         """
-        collection_name = self._collection_name(project_id)
+        collection_name = _collection_name_for(project_id)
         
         if self._client is None:
             # In-memory fallback: no-op
@@ -602,12 +749,12 @@ class QdrantIndexAdapter:
         if not items:
             return
         
-        collection_name = self._collection_name(project_id)
+        collection_name = _collection_name_for(project_id)
         
         # Determine vector size from first item
         first_item = items[0]
         embedding = first_item.get("embedding")
-        if not embedding:
+        if embedding is None or len(embedding) == 0:
             raise ValueError("Items must contain 'embedding' field")
         vector_size = len(embedding)
         
@@ -623,6 +770,7 @@ class QdrantIndexAdapter:
         except EmbeddingModelMismatch:
             raise
         except Exception as e:
+            self._forget_ensured_collection(collection_name)
             raise ProjectNotFound(project_id) from e
         
         if self._client is None:
@@ -652,6 +800,8 @@ class QdrantIndexAdapter:
                         "chunk_idx": stored_item.get("chunk_idx", 0),
                     }
                 collection_data["items"][chunk_id] = stored_item
+            # Stored vectors changed, so the cached search matrix is stale
+            collection_data.pop("dense_matrix", None)
             
             logger.info(
                 f"Upserted {len(items)} chunks to in-memory collection '{collection_name}'",
@@ -659,13 +809,90 @@ class QdrantIndexAdapter:
             )
             return
         
-        # Real Qdrant upsert with exponential backoff retry
-        points = []
-        for item in items:
-            chunk_id_str = item.get("id", f"chunk-{len(points)}")
+        # Real Qdrant upsert: build points for the next micro-batch on a worker
+        # thread while the current batch is on the wire. At most
+        # _UPSERT_MAX_PENDING_BATCHES batches are built ahead (back-pressure).
+        total_points = 0
+        if len(items) <= _UPSERT_BATCH_SIZE:
+            batch = self._build_points(items, project_id, model_id)
+            self._upsert_points_with_retry(collection_name, batch)
+            total_points = len(batch.ids)
+        else:
+            # Smart batching: order by text length so each request carries
+            # similarly sized payloads instead of one long chunk inflating a
+            # batch of short ones. Order is irrelevant to an upsert keyed by ID;
+            # original positions are kept for fallback IDs.
+            positions = sorted(range(len(items)), key=lambda i: len(items[i].get("text") or ""))
+            batches = [
+                positions[start:start + _UPSERT_BATCH_SIZE]
+                for start in range(0, len(positions), _UPSERT_BATCH_SIZE)
+            ]
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                pending: deque[Future[Any]] = deque()
+                next_batch = 0
+                while next_batch < len(batches) or pending:
+                    while next_batch < len(batches) and len(pending) < _UPSERT_MAX_PENDING_BATCHES:
+                        batch_positions = batches[next_batch]
+                        pending.append(
+                            executor.submit(
+                                self._build_points,
+                                [items[i] for i in batch_positions],
+                                project_id,
+                                model_id,
+                                batch_positions,
+                            )
+                        )
+                        next_batch += 1
+                    batch = pending.popleft().result()
+                    # Only the final batch waits for Qdrant to apply it; updates are
+                    # applied in order, so earlier batches are visible by then too
+                    is_last = next_batch == len(batches) and not pending
+                    self._upsert_points_with_retry(collection_name, batch, wait=is_last)
+                    total_points += len(batch.ids)
+        
+        logger.info(
+            f"Upserted {total_points} chunks to Qdrant collection '{collection_name}'",
+            extra={"collection_name": collection_name, "chunk_count": total_points},
+        )
+        
+        self._verify_model_bindings_after_upsert(collection_name, model_id, sparse_model_id)
+
+    def _build_points(
+        self,
+        items: Sequence[Mapping[str, Any]],
+        project_id: str,
+        model_id: str,
+        positions: Sequence[int] | None = None,
+    ) -> Any:
+        """
+        Build a column-oriented Qdrant batch with schema payloads for chunk items.
+        
+        Ids, dense vectors and payloads are collected into parallel lists and sent
+        as one models.Batch, rather than validating a PointStruct model per chunk.
+        
+        Args:
+            items: Chunk dicts with embedding, metadata, payload
+            project_id: Project identifier (stored in payload)
+            model_id: Dense embedding model identifier (stored in payload)
+            positions: Positions of the items within the full upsert (for fallback
+                IDs); defaults to their index in ``items``
+        
+        Returns:
+            Batch with ``ids``, ``vectors["dense"]`` and ``payloads`` in item order
+        """
+        ids: list[models.ExtendedPointId] = []
+        vectors: list[models.Vector] = []
+        payloads: list[dict[str, Any]] = []
+        for i, item in enumerate(items):
+            position = positions[i] if positions is not None else i
+            chunk_id_str = item.get("id", f"chunk-{position}")
             # Convert string ID to UUID (Qdrant requires UUID or integer)
             chunk_id = _string_to_uuid(chunk_id_str)
             embedding = item.get("embedding", [])
+            if hasattr(embedding, "tolist"):
+                # NumPy vectors (e.g. float32 from the embedder) convert to a flat
+                # list of floats in one C-level pass instead of per-element
+                embedding = embedding.tolist()
             
             # Extract payload fields according to schema
             page_span = item.get("page_span", (1, 1))
@@ -742,78 +969,47 @@ class QdrantIndexAdapter:
             if zotero_data:
                 payload["zotero"] = zotero_data
             
-            # Create point with named vector 'dense'
+            # Point with named vector 'dense'
             # Note: Sparse vectors would be generated during query time via model binding
-            # Convert UUID to string for PointStruct (Qdrant accepts string or int IDs)
-            point = PointStruct(
-                id=str(chunk_id),
-                vector={"dense": embedding} if isinstance(embedding, list) else embedding,
-                payload=payload,
-            )
-            points.append(point)
+            # Convert UUID to string (Qdrant accepts string or int IDs)
+            ids.append(str(chunk_id))
+            vectors.append(embedding)
+            payloads.append(payload)
+        batch_vectors: models.BatchVectorStruct = {"dense": vectors}
+        return Batch(ids=ids, vectors=batch_vectors, payloads=payloads)
+
+    def _upsert_points_with_retry(
+        self,
+        collection_name: str,
+        points: Any,
+        wait: bool = True,
+    ) -> None:
+        """
+        Upsert one batch of points with exponential backoff retry.
+        
+        Args:
+            collection_name: Collection name
+            points: Batch of points to upsert (from _build_points)
+            wait: Whether to block until Qdrant has applied the batch (False returns
+                once it is accepted into the write-ahead log)
+        
+        Raises:
+            RuntimeError: If all retries are exhausted
+        """
+        if self._client is None:
+            raise RuntimeError(f"Cannot upsert to {collection_name}: Qdrant client is not connected")
         
-        # Exponential backoff retry for upsert
         max_retries = 3
         retry_delay = 1.0  # Start with 1 second
         last_error = None
         
         for attempt in range(max_retries):
             try:
-                # Batch upsert
                 self._client.upsert(
                     collection_name=collection_name,
                     points=points,
+                    wait=wait,
                 )
-                
-                logger.info(
-                    f"Upserted {len(points)} chunks to Qdrant collection '{collection_name}'",
-                    extra={"collection_name": collection_name, "chunk_count": len(points)},
-                )
-                
-                # T046: Verify model binding after ingestion completes successfully
-                # This ensures queries work immediately after ingestion
-                try:
-                    dense_bound, sparse_bound = self._check_model_bindings(collection_name)
-                    if not dense_bound:
-                        # Try to bind again (may have failed silently earlier)
-                        try:
-                            self._client.set_model(collection_name=collection_name, model_name=model_id)
-                            logger.info(
-                                f"Verified and ensured dense model '{model_id}' binding after ingestion",
-                                extra={"collection_name": collection_name, "model_id": model_id},
-                            )
-                        except Exception as bind_error:
-                            logger.warning(
-                                f"Could not verify/ensure dense model binding after ingestion: {bind_error}. "
-                                "Queries may fail until model is manually bound.",
-                                extra={"collection_name": collection_name, "model_id": model_id},
-                            )
-                    else:
-                        logger.debug(
-                            f"Verified dense model binding after ingestion (model='{model_id}')",
-                            extra={"collection_name": collection_name, "model_id": model_id},
-                        )
-                    
-                    if sparse_model_id is not None and not sparse_bound:
-                        try:
-                            self._client.set_sparse_model(collection_name=collection_name, model_name=sparse_model_id)
-                            logger.info(
-                                f"Verified and ensured sparse model '{sparse_model_id}' binding after ingestion",
-                                extra={"collection_name": collection_name, "sparse_model_id": sparse_model_id},
-                            )
-                        except Exception as bind_error:
-                            logger.warning(
-                                f"Could not verify/ensure sparse model binding after ingestion: {bind_error}",
-                                extra={"collection_name": collection_name, "sparse_model_id": sparse_model_id},
-                            )
-                except Exception as verify_error:
-                    # Don't fail ingestion if verification fails - log warning
-                    logger.warning(
-                        f"Model binding verification failed after ingestion: {verify_error}. "
-                        "Ingestion succeeded, but queries may require manual model binding.",
-                        extra={"collection_name": collection_name, "model_id": model_id},
-                    )
-                
                 return  # Success - exit retry loop
             except Exception as e:
                 last_error = e
@@ -833,11 +1029,138 @@ class QdrantIndexAdapter:
                         exc_info=True,
                     )
         
-        # All retries exhausted
+        # All retries exhausted; the collection may be gone, so re-ensure it next time
+        self._forget_ensured_collection(collection_name)
         raise RuntimeError(
-            f"Failed to upsert {len(points)} chunks to Qdrant after {max_retries} attempts"
+            f"Failed to upsert {len(points.ids)} chunks to Qdrant after {max_retries} attempts"
         ) from last_error
 
+    def _verify_model_bindings_after_upsert(
+        self,
+        collection_name: str,
+        model_id: str,
+        sparse_model_id: str | None,
+    ) -> None:
+        """
+        Ensure dense/sparse model bindings once all batches are upserted.
+        
+        Args:
+            collection_name: Collection name
+            model_id: Dense embedding model identifier
+            sparse_model_id: Optional sparse model identifier
+        """
+        if self._client is None:
+            # In-memory fallback: no server-side model bindings
+            return
+        
+        # T046: Verify model binding after ingestion completes successfully
+        # This ensures queries work immediately after ingestion
+        try:
+            dense_bound, sparse_bound = self._check_model_bindings(collection_name)
+            if not dense_bound:
+                # Try to bind again (may have failed silently earlier)
+                try:
+                    self._client.set_model(collection_name=collection_name, model_name=model_id)
+                    logger.info(
+                        f"Verified and ensured dense model '{model_id}' binding after ingestion",
+                        extra={"collection_name": collection_name, "model_id": model_id},
+                    )
+                except Exception as bind_error:
+                    logger.warning(
+                        f"Could not verify/ensure dense model binding after ingestion: {bind_error}. "
+                        "Queries may fail until model is manually bound.",
+                        extra={"collection_name": collection_name, "model_id": model_id},
+                    )
+            else:
+                logger.debug(
+                    f"Verified dense model binding after ingestion (model='{model_id}')",
+                    extra={"collection_name": collection_name, "model_id": model_id},
+                )
+            
+            if sparse_model_id is not None and not sparse_bound:
+                try:
+                    self._client.set_sparse_model(collection_name=collection_name, model_name=sparse_model_id)
+                    logger.info(
+                        f"Verified and ensured sparse model '{sparse_model_id}' binding after ingestion",
+                        extra={"collection_name": collection_name, "sparse_model_id": sparse_model_id},
+                    )
+                except Exception as bind_error:
+                    logger.warning(
+                        f"Could not verify/ensure sparse model binding after ingestion: {bind_error}",
+                        extra={"collection_name": collection_name, "sparse_model_id": sparse_model_id},
+                    )
+        except Exception as verify_error:
+            # Don't fail ingestion if verification fails - log warning
+            logger.warning(
+                f"Model binding verification failed after ingestion: {verify_error}. "
+                "Ingestion succeeded, but queries may require manual model binding.",
+                extra={"collection_name": collection_name, "model_id": model_id},
+            )
+
+    def _search_params(self, limit: int, hnsw_ef: int | None = None) -> Any:
+        """
+        Search parameters for dense queries.
+        
+        The HNSW beam (hnsw_ef) trades recall for latency: wider beams visit more
+        graph nodes. It defaults to _DEFAULT_HNSW_EF and is never narrower than the
+        number of requested results.
+        
+        With scalar quantization, candidates are ranked by their int8 vectors with
+        oversampling and then rescored against the originals, keeping recall. Qdrant
+        ignores the quantization parameters on collections created without it.
+        
+        Args:
+            limit: Number of results the query asks for
+            hnsw_ef: Optional beam width override
+        """
+        if SearchParams is None:
+            return None
+        quantization = None
+        if self.scalar_quantization:
+            quantization = QuantizationSearchParams(
+                rescore=True,
+                oversampling=_QUANTIZATION_OVERSAMPLING,
+            )
+        return SearchParams(
+            hnsw_ef=max(hnsw_ef or _DEFAULT_HNSW_EF, limit),
+            quantization=quantization,
+        )
+
+    def _local_dense_matrix(
+        self,
+        collection_data: dict[str, Any],
+        dim: int,
+    ) -> tuple[list[dict[str, Any]], np.ndarray]:
+        """
+        Return in-memory items with ``dim``-sized embeddings and their unit-normalized matrix.
+        
+        The float32 (N, dim) matrix is built once and cached on the collection until the
+        next upsert, so each search is a single BLAS matrix-vector product.
+        
+        Args:
+            collection_data: In-memory collection entry from ``self._local``
+            dim: Query vector dimension (items of other sizes are skipped)
+        
+        Returns:
+            Tuple of (items, matrix) where row i of matrix is items[i]'s embedding
+        """
+        cached = collection_data.get("dense_matrix")
+        if cached is not None and cached[0] == dim:
+            return cached[1], cached[2]
+        
+        items = [
+            item for item in collection_data["items"].values()
+            if len(item.get("embedding", [])) == dim
+        ]
+        matrix = np.asarray(
+            [item["embedding"] for item in items], dtype=np.float32
+        ).reshape(len(items), dim)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        
+        collection_data["dense_matrix"] = (dim, items, matrix)
+        return items, matrix
+
     def search(
         self,
         query_vector: list[float] | None = None,
@@ -846,6 +1169,7 @@ class QdrantIndexAdapter:
         top_k: int = 6,
         filters: dict[str, Any] | None = None,
         use_named_vectors: bool = True,
+        hnsw_ef: int | None = None,
     ) -> list[dict[str, Any]]:
         """
         Vector search with project filtering.
@@ -859,6 +1183,8 @@ class QdrantIndexAdapter:
             top_k: Maximum number of results
             filters: Additional Qdrant filters (e.g., tags)
             use_named_vectors: Whether to use named vector 'dense' (default: True)
+            hnsw_ef: HNSW search beam width (default: _DEFAULT_HNSW_EF, at least top_k);
+                higher improves recall, lower reduces latency
         
         Returns:
             List of hit dicts with score, payload (text, metadata, citation info)
@@ -873,7 +1199,7 @@ class QdrantIndexAdapter:
         """
         if query_vector is None and query_text is None:
             raise ValueError("Either query_vector or query_text must be provided")
-        collection_name = self._collection_name(project_id)
+        collection_name = _collection_name_for(project_id)
         
         if self._client is None:
             # In-memory fallback
@@ -881,23 +1207,32 @@ class QdrantIndexAdapter:
             if not collection_data:
                 raise ProjectNotFound(project_id)
             
-            items = list(collection_data["items"].values())
+            # Cosine similarity for every stored vector in one matrix-vector product
+            query = np.asarray(query_vector, dtype=np.float32)
+            items, matrix = self._local_dense_matrix(collection_data, len(query))
+            query_norm = float(np.linalg.norm(query))
+            if query_norm > 0:
+                scores = matrix @ (query / query_norm)
+            else:
+                scores = np.zeros(len(items), dtype=np.float32)
+            
+            # Select top_k without sorting every score, then order just those
+            k = min(top_k, len(items))
+            if k < len(items):
+                top_idx = np.argpartition(-scores, k)[:k]
+            else:
+                top_idx = np.arange(len(items))
+            top_idx = top_idx[np.argsort(-scores[top_idx], kind="stable")]
             
-            # Naive scoring: dot product approximation (placeholder)
             scored = []
-            for item in items:
-                item_vec = item.get("embedding", [])
-                if len(item_vec) != len(query_vector):
-                    continue
-                # Simple cosine similarity approximation
-                score = sum(a * b for a, b in zip(query_vector, item_vec)) / (
-                    (sum(a**2 for a in query_vector) * sum(b**2 for b in item_vec)) ** 0.5 + 1e-10
-                )
+            for idx in top_idx:
+                item = items[idx]
                 # Build proper payload structure matching real Qdrant format
                 payload = {
                     "fulltext": item.get("text", ""),
                     "doc": item.get("doc", {}),
-                    "embed_model": collection_data["model_id"],
+                    "embed_model": collection_data["dense_model_id"],
+                    "project_id": project_id,
                     "project": project_id,
                 }
                 if item.get("citation"):
@@ -905,12 +1240,11 @@ class QdrantIndexAdapter:
                 
                 scored.append({
                     "id": item.get("id"),
-                    "score": float(score),
+                    "score": float(scores[idx]),
                     "payload": payload,
                 })
             
-            scored.sort(key=lambda x: x["score"], reverse=True)
-            return scored[:top_k]
+            return scored
         
         # Real Qdrant search
         try:
@@ -1032,17 +1366,18 @@ class QdrantIndexAdapter:
             if query_vector is None:
                 raise ValueError("query_vector is required when text-based query is not available")
             
-            results = self._client.search(
+            response = self._client.query_points(
                 collection_name=collection_name,
-                query_vector=query_vector,
+                query=query_vector,
                 query_filter=qdrant_filter,
                 limit=top_k,
                 with_payload=True,
                 using="dense" if use_named_vectors else None,  # Use named vector
+                search_params=self._search_params(top_k, hnsw_ef),
             )
             
             hits = []
-            for result in results:
+            for result in response.points:
                 hits.append({
                     "id": str(result.id),
                     "score": float(result.score),
@@ -1056,8 +1391,59 @@ class QdrantIndexAdapter:
                 extra={"collection_name": collection_name, "project_id": project_id},
                 exc_info=True,
             )
+            self._forget_ensured_collection(collection_name)
             raise ProjectNotFound(project_id) from e
 
+    async def aupsert(
+        self,
+        items: Sequence[Mapping[str, Any]],
+        project_id: str,
+        model_id: str,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Awaitable upsert() that runs on the default executor.
+        
+        Upserts to different projects touch different collections, so callers can
+        fan them out with asyncio.gather() and overlap their Qdrant round trips.
+        
+        Args:
+            items: Chunk dicts with embedding, metadata, payload
+            project_id: Project identifier
+            model_id: Dense embedding model identifier
+            **kwargs: Remaining upsert() options (force_rebuild, sparse_model_id, ...)
+        """
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(
+            None,
+            lambda: self.upsert(items, project_id=project_id, model_id=model_id, **kwargs),
+        )
+
+    async def asearch(
+        self,
+        query_vector: list[float] | None = None,
+        project_id: str = "",
+        top_k: int = 6,
+        **kwargs: Any,
+    ) -> list[dict[str, Any]]:
+        """
+        Awaitable search() that runs on the default executor.
+        
+        Args:
+            query_vector: Query embedding vector
+            project_id: Project identifier (mandatory filter)
+            top_k: Maximum number of results
+            **kwargs: Remaining search() options (query_text, filters, ...)
+        
+        Returns:
+            List of hit dicts with score, payload (text, metadata, citation info)
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None,
+            lambda: self.search(query_vector, project_id=project_id, top_k=top_k, **kwargs),
+        )
+
     def _check_model_bindings(self, collection_name: str) -> tuple[bool, bool]:
         """
         Check if both dense and sparse models are bound to the collection.
@@ -1116,13 +1502,13 @@ class QdrantIndexAdapter:
         """
         Hybrid search using Qdrant named vectors with RRF fusion.
         
-        Performs hybrid search combining semantic (dense) and lexical (sparse) retrieval.
-        When both dense and sparse models are bound, Qdrant automatically fuses results
-        using Reciprocal Rank Fusion (RRF).
+        Performs hybrid search combining semantic (dense) and lexical (full-text) retrieval
+        in a single query_points() call: both candidate sets are prefetched and fused
+        server-side using Reciprocal Rank Fusion (RRF).
         
         Args:
-            query_text: Query text for both sparse (BM25) and dense (if model binding) search
-            query_vector: Optional query embedding vector (used if model binding not available)
+            query_text: Query text for the lexical (chunk_text full-text index) prefetch
+            query_vector: Query embedding vector for the dense prefetches (required with Qdrant)
             project_id: Project identifier (mandatory filter)
             top_k: Maximum number of results
             filters: Additional Qdrant filters (tags with AND semantics, optional section prefix)
@@ -1140,7 +1526,7 @@ class QdrantIndexAdapter:
         """
         from ...domain.errors import HybridNotSupported
         
-        collection_name = self._collection_name(project_id)
+        collection_name = _collection_name_for(project_id)
         
         # Check if hybrid is enabled (full-text index available)
         if not self.create_fulltext_index:
@@ -1171,79 +1557,69 @@ class QdrantIndexAdapter:
             
             items = list(collection_data["items"].values())
             
-            # Vector search scores
-            vec_scores: dict[str, float] = {}
-            for item in items:
-                item_vec = item.get("embedding", [])
-                if len(item_vec) != len(query_vector):
-                    continue
-                score = sum(a * b for a, b in zip(query_vector, item_vec)) / (
-                    (sum(a**2 for a in query_vector) * sum(b**2 for b in item_vec)) ** 0.5 + 1e-10
-                )
-                chunk_id = item.get("id", "")
-                vec_scores[chunk_id] = float(score)
-            
-            # Simple text matching scores (BM25 approximation)
-            text_scores: dict[str, float] = {}
+            # Single pass over the items: vector and text scores are computed together
+            # and each score stays paired with its item, so fusion needs no per-result
+            # lookup back into the item list (previously O(N^2))
             query_terms = query_text.lower().split()
+            query_norm_sq = sum(a**2 for a in query_vector)
+            candidates: list[tuple[dict[str, Any], float | None, float]] = []
             for item in items:
-                chunk_id = item.get("id", "")
+                item_vec = item.get("embedding", [])
+                vec_score: float | None = None
+                if len(item_vec) == len(query_vector):
+                    vec_score = float(sum(a * b for a, b in zip(query_vector, item_vec)) / (
+                        (query_norm_sq * sum(b**2 for b in item_vec)) ** 0.5 + 1e-10
+                    ))
+                
+                # Simple text matching score (BM25 approximation): term frequency
                 text = item.get("text", "").lower()
-                score = 0.0
+                word_count = max(len(text.split()), 1)
+                text_score = 0.0
                 for term in query_terms:
                     if term in text:
-                        # Simple term frequency scoring
-                        score += text.count(term) / max(len(text.split()), 1)
-                text_scores[chunk_id] = score
+                        text_score += text.count(term) / word_count
+                candidates.append((item, vec_score, text_score))
             
             # Fusion: 0.3 * text_score + 0.7 * vector_score (normalized)
-            max_text = max(text_scores.values()) if text_scores.values() else 1.0
-            max_vec = max(vec_scores.values()) if vec_scores.values() else 1.0
+            vec_values = [v for _, v, _ in candidates if v is not None]
+            max_text = max((t for _, _, t in candidates), default=1.0)
+            max_vec = max(vec_values) if vec_values else 1.0
             
-            fused_scores: dict[str, tuple[float, dict[str, Any]]] = {}
-            for chunk_id in set(list(vec_scores.keys()) + list(text_scores.keys())):
-                norm_text = text_scores.get(chunk_id, 0.0) / max(max_text, 1e-10)
-                norm_vec = vec_scores.get(chunk_id, 0.0) / max(max_vec, 1e-10)
-                fused_score = 0.3 * norm_text + 0.7 * norm_vec
-                
-                # Find item for payload
-                item = next((it for it in items if it.get("id") == chunk_id), None)
-                if item:
-                    payload = {
-                        "fulltext": item.get("text", ""),
-                        "doc": item.get("doc", {}),
-                        "embed_model": collection_data["model_id"],
-                        "project": project_id,
-                    }
-                    if item.get("citation"):
-                        payload["zotero"] = item["citation"]
-                    fused_scores[chunk_id] = (fused_score, payload)
+            scored = []
+            for item, vec_score, text_score in candidates:
+                norm_text = text_score / max(max_text, 1e-10)
+                norm_vec = (vec_score or 0.0) / max(max_vec, 1e-10)
+                payload = {
+                    "fulltext": item.get("text", ""),
+                    "doc": item.get("doc", {}),
+                    "embed_model": collection_data["dense_model_id"],
+                    "project_id": project_id,
+                    "project": project_id,
+                }
+                if item.get("citation"):
+                    payload["zotero"] = item["citation"]
+                scored.append({
+                    "id": item.get("id", ""),
+                    "score": 0.3 * norm_text + 0.7 * norm_vec,
+                    "payload": payload,
+                })
             
             # Sort by fused score
-            scored = [
-                {"id": cid, "score": score, "payload": payload}
-                for cid, (score, payload) in sorted(
-                    fused_scores.items(), key=lambda x: x[1][0], reverse=True
-                )
-            ]
+            scored.sort(key=lambda x: x["score"], reverse=True)
             return scored[:top_k]
         
-        # Real Qdrant hybrid search using Query interface with RRF fusion
+        # Real Qdrant hybrid search using prefetch + RRF fusion
         try:
             # Build filter with mandatory project filter (server-side enforcement)
-            qdrant_filter = Filter(
-                must=[
-                    FieldCondition(
-                        key="project_id",
-                        match=MatchValue(value=project_id),
-                    ),
-                ],
-            )
+            filter_conditions: list[models.Condition] = [
+                FieldCondition(
+                    key="project_id",
+                    match=MatchValue(value=project_id),
+                ),
+            ]
             
             # Add additional filters if provided
             if filters:
-                filter_conditions = [qdrant_filter.must[0]] if qdrant_filter.must else []
-                
                 if "tags" in filters and filters["tags"]:
                     tag_list = filters["tags"] if isinstance(filters["tags"], list) else [filters["tags"]]
                     for tag in tag_list:
@@ -1278,60 +1654,64 @@ class QdrantIndexAdapter:
                             match=MatchValue(value=filters["zotero_attachment_key"]),
                         )
                     )
-                
-                qdrant_filter = Filter(must=filter_conditions)
             
-            # T041: Use Qdrant's query() method with text-based search for hybrid (RRF fusion)
-            # When both dense and sparse models are bound, RRF fusion is automatic
+            qdrant_filter = Filter(must=filter_conditions)
+            
+            # T041: Single query_points() call: a semantic prefetch (dense vector) and a
+            # lexical prefetch (dense vector restricted to chunks matching the query
+            # terms via the chunk_text full-text index), fused server-side with RRF.
+            # One round trip, and no candidate lists shipped back for client-side fusion.
             try:
-                # Use query() API with text-based search (requires model binding)
-                # This enables automatic RRF fusion when both models are bound
-                from qdrant_client.models import Query
+                if query_vector is None:
+                    raise ValueError("query_vector is required for hybrid query")
                 
-                # Create query with text - Qdrant will use both dense and sparse models
-                # when bound, and automatically fuse results using RRF
-                query = Query(
-                    query=query_text,  # Text query uses both bound models
-                    filter=qdrant_filter,
-                    limit=top_k,
+                prefetch_limit = max(top_k, _HYBRID_PREFETCH_LIMIT)
+                text_filter = Filter(
+                    must=[
+                        *filter_conditions,
+                        FieldCondition(key="chunk_text", match=MatchText(text=query_text)),
+                    ],
                 )
-                
-                # Execute query - Qdrant performs RRF fusion automatically
-                results = self._client.query(
+                response = self._client.query_points(
                     collection_name=collection_name,
-                    queries=[query],
+                    prefetch=[
+                        Prefetch(
+                            query=query_vector,
+                            using="dense",
+                            filter=qdrant_filter,
+                            params=self._search_params(prefetch_limit),
+                            limit=prefetch_limit,
+                        ),
+                        Prefetch(
+                            query=query_vector,
+                            using="dense",
+                            filter=text_filter,
+                            params=self._search_params(prefetch_limit),
+                            limit=prefetch_limit,
+                        ),
+                    ],
+                    query=FusionQuery(fusion=Fusion.RRF),
+                    limit=top_k,
                     with_payload=True,
                 )
                 
-                # Extract results from query response
-                # Results are already RRF-fused by Qdrant
-                hits = []
-                if results and hasattr(results, '__iter__'):
-                    # Handle both single batch and multiple batches
-                    for batch in results:
-                        if hasattr(batch, '__iter__'):
-                            for result in batch:
-                                hits.append({
-                                    "id": str(result.id),
-                                    "score": float(result.score),
-                                    "payload": result.payload or {},
-                                })
-                        else:
-                            # Single result
-                            hits.append({
-                                "id": str(batch.id),
-                                "score": float(batch.score),
-                                "payload": batch.payload or {},
-                            })
+                hits = [
+                    {
+                        "id": str(point.id),
+                        "score": float(point.score),
+                        "payload": point.payload or {},
+                    }
+                    for point in response.points
+                ]
                 
                 logger.debug(
                     f"Hybrid query completed with RRF fusion: {len(hits)} results",
                     extra={"collection_name": collection_name, "result_count": len(hits)},
                 )
                 
-                return hits[:top_k]
+                return hits
             except (ImportError, AttributeError) as query_error:
-                # Fallback to manual fusion if query() API not available (older Qdrant versions)
+                # Fallback to manual fusion if query_points() API not available (older clients)
                 logger.warning(
                     f"Query API not available, using manual fusion: {query_error}",
                     extra={"collection_name": collection_name},
@@ -1339,11 +1719,6 @@ class QdrantIndexAdapter:
                 
                 # Manual fusion: run both searches and combine
                 # 1. Vector search using dense named vector
-                if query_vector is None:
-                    raise ValueError(
-                        "query_vector is required when Qdrant query() API is not available"
-                    )
-                
                 vec_results = self._client.search(
                     collection_name=collection_name,
                     query_vector=query_vector,
@@ -1409,4 +1784,65 @@ class QdrantIndexAdapter:
                 extra={"collection_name": collection_name, "project_id": project_id},
                 exc_info=True,
             )
+            self._forget_ensured_collection(collection_name)
             raise ProjectNotFound(project_id) from e
+
+
+def get_qdrant_index(
+    config_hash: str | None = None,
+    url: str = "http://localhost:6333",
+    create_fulltext_index: bool = True,
+    scalar_quantization: bool = True,
+    prefer_grpc: bool = True,
+) -> QdrantIndexAdapter:
+    """
+    Get or create shared QdrantIndexAdapter instance (process-scoped).
+    
+    Constructing the adapter opens a client and probes the server with
+    get_collections(), so reusing one instance avoids that round trip on
+    every command or MCP tool call in the same process.
+    
+    Args:
+        config_hash: Optional configuration hash for variant instances
+            (default: "default" for single instance)
+        url: Qdrant server URL
+        create_fulltext_index: Whether to create full-text index for hybrid search
+        scalar_quantization: Whether new collections use int8 scalar quantization
+        prefer_grpc: Whether to talk to Qdrant over gRPC (REST fallback)
+    
+    Returns:
+        QdrantIndexAdapter instance (shared across process lifetime)
+    
+    Behavior:
+        - First call: Creates new QdrantIndexAdapter, caches it, returns instance
+        - Subsequent calls: Returns cached instance (no reconnection overhead)
+        - In-memory fallback: If the cached instance has no client, reconnection
+          is retried with exponential backoff (5s doubling to 5min) until the
+          server answers; in-memory data written meanwhile is then discarded
+        - Cache key: f"qdrant:{config_hash or 'default'}:url={url}:fulltext=...:int8=...:grpc=..."
+        - Lifetime: Process-scoped (cleared only on process termination)
+    """
+    cache_key = (
+        f"qdrant:{config_hash or 'default'}:"
+        f"url={url}:"
+        f"fulltext={create_fulltext_index}:"
+        f"int8={scalar_quantization}:"
+        f"grpc={prefer_grpc}"
+    )
+    
+    if cache_key not in _qdrant_cache:
+        logger.debug(f"Creating new Qdrant index instance (cache_key={cache_key})")
+        _qdrant_cache[cache_key] = QdrantIndexAdapter(
+            url=url,
+            create_fulltext_index=create_fulltext_index,
+            scalar_quantization=scalar_quantization,
+            prefer_grpc=prefer_grpc,
+        )
+    elif _qdrant_cache[cache_key]._client is None:
+        # Cached instance fell back to in-memory; retry (with backoff) so a long-running
+        # process (e.g. the MCP server) picks up a Qdrant server that started later
+        _qdrant_cache[cache_key]._retry_connection()
+    else:
+        logger.debug(f"Reusing cached Qdrant index instance (cache_key={cache_key})")
+    
+    return _qdrant_cache[cache_key]
@@ -5,7 +5,9 @@ from __future__ import annotations
 import logging
 import random
 import time
-from typing import TYPE_CHECKING, Any, Callable
+from itertools import batched
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Callable, Sequence
 
 from ...application.ports.annotation_resolver import Annotation, AnnotationResolverPort
 from ...application.ports.embeddings import EmbeddingPort
@@ -18,6 +20,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Annotation texts sent to the embedder per call
+_EMBEDDING_BATCH_SIZE = 256
+
+_tag_name = itemgetter("tag")
+
 
 class ZoteroAnnotationResolverAdapter(AnnotationResolverPort):
     """
@@ -97,6 +104,31 @@ class ZoteroAnnotationResolverAdapter(AnnotationResolverPort):
             details={"max_retries": max_retries, "last_error": str(last_error)},
         ) from last_error
 
+    @staticmethod
+    def _normalize_annotation(data: dict[str, Any]) -> Annotation:
+        """Build an Annotation from a Zotero annotation item's data dict."""
+        page_index = data.get("pageIndex", 0)
+        
+        # Extract tags: Zotero sends [{"tag": ...}], so map a C-level itemgetter over them
+        # and only fall back to the per-tag loop for plain strings or missing keys
+        raw_tags = data.get("tags", [])
+        try:
+            tags = list(filter(None, map(_tag_name, raw_tags)))
+        except (KeyError, TypeError):
+            tags = []
+            for tag_obj in raw_tags:
+                tag_name = tag_obj.get("tag", "") if isinstance(tag_obj, dict) else str(tag_obj)
+                if tag_name:
+                    tags.append(tag_name)
+        
+        return Annotation(
+            page=page_index + 1,  # Convert 0-indexed to 1-indexed
+            quote=data.get("text", "") or "",
+            comment=data.get("comment", "") or None,
+            color=data.get("color", "") or None,
+            tags=tags,
+        )
+
     def fetch_annotations(
         self,
         attachment_key: str,
@@ -126,36 +158,7 @@ class ZoteroAnnotationResolverAdapter(AnnotationResolverPort):
                     return []
                 
                 # Normalize annotations
-                normalized: list[Annotation] = []
-                for ann in annotations_data:
-                    data = ann.get("data", {})
-                    
-                    # Extract fields
-                    page_index = data.get("pageIndex", 0)
-                    page = page_index + 1  # Convert 0-indexed to 1-indexed
-                    quote = data.get("text", "") or ""
-                    comment = data.get("comment", "") or None
-                    color = data.get("color", "") or None
-                    
-                    # Extract tags
-                    tags: list[str] = []
-                    tag_data = data.get("tags", [])
-                    for tag_obj in tag_data:
-                        tag_name = tag_obj.get("tag", "") if isinstance(tag_obj, dict) else str(tag_obj)
-                        if tag_name:
-                            tags.append(tag_name)
-                    
-                    # Create Annotation object
-                    annotation = Annotation(
-                        page=page,
-                        quote=quote,
-                        comment=comment,
-                        color=color,
-                        tags=tags,
-                    )
-                    normalized.append(annotation)
-                
-                return normalized
+                return [self._normalize_annotation(ann.get("data", {})) for ann in annotations_data]
                 
             except Exception as e:
                 error_str = str(e).lower()
@@ -189,10 +192,14 @@ class ZoteroAnnotationResolverAdapter(AnnotationResolverPort):
         vector_index: VectorIndexPort,
         embedding_model: str,
         resolver: MetadataResolverPort | None = None,
+        embedding_batch_size: int = _EMBEDDING_BATCH_SIZE,
     ) -> int:
         """
         Index annotations as separate vector points.
         
+        Annotation texts are embedded in batches of embedding_batch_size rather
+        than one embed() call per annotation.
+        
         Args:
             annotations: List of Annotation objects to index
             item_key: Parent Zotero item key
@@ -201,6 +208,7 @@ class ZoteroAnnotationResolverAdapter(AnnotationResolverPort):
             vector_index: Vector index port for storage
             embedding_model: Embedding model identifier
             resolver: Optional metadata resolver for citation metadata
+            embedding_batch_size: Maximum number of texts per embed() call
         
         Returns:
             Number of annotation points successfully indexed
@@ -242,29 +250,36 @@ class ZoteroAnnotationResolverAdapter(AnnotationResolverPort):
             # Prepare annotation items for indexing
             items_to_index: list[dict[str, Any]] = []
             
-            for annotation in annotations:
-                # Create chunk text: quote + comment (if comment exists)
-                chunk_text = annotation.quote
-                if annotation.comment:
-                    chunk_text = f"{annotation.quote}\n\n{annotation.comment}"
-                
-                # Generate embedding for annotation
+            # Create chunk text: quote + comment (if comment exists)
+            chunk_texts = [
+                f"{annotation.quote}\n\n{annotation.comment}" if annotation.comment else annotation.quote
+                for annotation in annotations
+            ]
+            
+            # Generate embeddings in batches; a failed batch skips only its annotations
+            embeddings: list[Sequence[float] | None] = []
+            for batch in batched(chunk_texts, embedding_batch_size):
+                batch_embeddings: list[Sequence[float] | None]
                 try:
-                    # embed() takes a list and returns a list of embeddings
-                    embeddings = self._embedder.embed([chunk_text], model_id=embedding_model)
-                    embedding = embeddings[0] if embeddings else None
-                    if not embedding:
-                        logger.warning(
-                            f"Failed to generate embedding for annotation (empty result)",
-                            extra={"attachment_key": attachment_key, "page": annotation.page},
-                        )
-                        continue
+                    batch_embeddings = list(self._embedder.embed(list(batch), model_id=embedding_model))
                 except Exception as e:
                     logger.warning(
-                        f"Failed to generate embedding for annotation: {e}",
+                        f"Failed to generate embeddings for {len(batch)} annotations: {e}",
+                        extra={"attachment_key": attachment_key},
+                    )
+                    batch_embeddings = []
+                if len(batch_embeddings) != len(batch):
+                    # Misaligned or failed result: skip the batch rather than mis-pair vectors
+                    batch_embeddings = [None] * len(batch)
+                embeddings.extend(batch_embeddings)
+            
+            for annotation, chunk_text, embedding in zip(annotations, chunk_texts, embeddings):
+                if embedding is None or len(embedding) == 0:
+                    logger.warning(
+                        f"Failed to generate embedding for annotation (empty result)",
                         extra={"attachment_key": attachment_key, "page": annotation.page},
                     )
-                    continue  # Skip this annotation if embedding fails
+                    continue
                 
                 # Create annotation payload
                 payload: dict[str, Any] = {
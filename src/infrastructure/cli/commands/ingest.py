@@ -21,7 +21,7 @@ from src.infrastructure.adapters.checkpoint_manager import CheckpointManagerAdap
 from src.infrastructure.adapters.docling_converter import DoclingConverterAdapter, get_converter
 from src.infrastructure.adapters.docling_chunker import DoclingHybridChunkerAdapter
 from src.infrastructure.adapters.fastembed_embeddings import FastEmbedAdapter
-from src.infrastructure.adapters.qdrant_index import QdrantIndexAdapter
+from src.infrastructure.adapters.qdrant_index import get_qdrant_index
 from src.infrastructure.adapters.rich_progress_reporter import RichProgressReporterAdapter
 from src.infrastructure.adapters.zotero_importer import ZoteroImporterAdapter
 from src.infrastructure.adapters.zotero_metadata import ZoteroPyzoteroResolver
@@ -293,7 +293,10 @@ def run(
         
         resolver: MetadataResolverPort = ZoteroPyzoteroResolver(zotero_config=resolver_config)
         embedder: EmbeddingPort = FastEmbedAdapter(default_model=model_id)
-        index: VectorIndexPort = QdrantIndexAdapter(url=settings.qdrant.url)
+        index: VectorIndexPort = get_qdrant_index(
+            url=settings.qdrant.url,
+            scalar_quantization=settings.qdrant.scalar_quantization,
+        )
         
         # Initialize annotation resolver if annotations are enabled
         annotation_resolver: AnnotationResolverPort | None = None
@@ -532,7 +535,10 @@ def run(
     
     resolver: MetadataResolverPort = ZoteroPyzoteroResolver(zotero_config=zotero_config_dict)
     embedder: EmbeddingPort = FastEmbedAdapter(default_model=model_id)
-    index: VectorIndexPort = QdrantIndexAdapter(url=settings.qdrant.url)
+    index: VectorIndexPort = get_qdrant_index(
+        url=settings.qdrant.url,
+        scalar_quantization=settings.qdrant.scalar_quantization,
+    )
     
     # Process each document
     total_chunks = 0
@@ -819,7 +825,10 @@ def process_downloads(
     
     resolver: MetadataResolverPort = ZoteroPyzoteroResolver(zotero_config=zotero_config_dict)
     embedder: EmbeddingPort = FastEmbedAdapter(default_model=model_id)
-    index: VectorIndexPort = QdrantIndexAdapter(url=settings.qdrant.url)
+    index: VectorIndexPort = get_qdrant_index(
+        url=settings.qdrant.url,
+        scalar_quantization=settings.qdrant.scalar_quantization,
+    )
     
     # Initialize checkpoint manager and progress reporter
     checkpoints_dir = Path(settings.paths.checkpoints_dir if hasattr(settings.paths, "checkpoints_dir") else "var/checkpoints")
@@ -11,7 +11,7 @@ from rich.panel import Panel
 from rich.table import Table
 
 from src.domain.errors import ProjectNotFound
-from src.infrastructure.adapters.qdrant_index import QdrantIndexAdapter
+from src.infrastructure.adapters.qdrant_index import get_qdrant_index
 from src.infrastructure.config.settings import Settings
 
 app = typer.Typer(help="Inspect stored chunks and collection configuration")
@@ -57,7 +57,11 @@ def collection(
     collection_name = f"proj-{project.replace('/', '-')}"
     
     # Initialize Qdrant adapter
-    index = QdrantIndexAdapter(url=settings.qdrant.url)
+    index = get_qdrant_index(
+        url=settings.qdrant.url,
+        create_fulltext_index=settings.qdrant.create_fulltext_index,
+        scalar_quantization=settings.qdrant.scalar_quantization,
+    )
     
     if index._client is None:
         console.print(f"[red]Error: Could not connect to Qdrant at {settings.qdrant.url}[/red]")
@@ -172,7 +176,8 @@ def collection(
     schema_table.add_column("Indexed", justify="center")
     
     # T072: Index presence confirmation
-    keyword_indexes = ["project_id", "doc_id", "citekey", "year", "tags"]
+    keyword_indexes = ["project_id", "doc_id", "citekey", "tags"]
+    integer_indexes = ["year"]
     fulltext_indexes = ["chunk_text"] if (project_settings.hybrid_enabled and settings.qdrant.create_fulltext_index) else []
     
     for key in all_keys:
@@ -182,6 +187,8 @@ def collection(
         index_status = ""
         if is_keyword_indexed:
             index_status = "[green]keyword[/green]"
+        elif key in integer_indexes:
+            index_status = "[green]integer[/green]"
         if is_fulltext_indexed:
             if index_status:
                 index_status += ", [blue]fulltext[/blue]"
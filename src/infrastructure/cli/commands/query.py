@@ -13,7 +13,7 @@ from src.application.ports.embeddings import EmbeddingPort
 from src.application.ports.vector_index import VectorIndexPort
 from src.domain.errors import ProjectNotFound, HybridNotSupported
 from src.infrastructure.adapters.fastembed_embeddings import FastEmbedAdapter
-from src.infrastructure.adapters.qdrant_index import QdrantIndexAdapter
+from src.infrastructure.adapters.qdrant_index import get_qdrant_index
 from src.infrastructure.config.settings import Settings
 
 app = typer.Typer(help="Query chunks from CiteLoom")
@@ -63,9 +63,10 @@ def run(
     
     # Initialize adapters
     embedder: EmbeddingPort = FastEmbedAdapter()
-    index: VectorIndexPort = QdrantIndexAdapter(
+    index: VectorIndexPort = get_qdrant_index(
         url=settings.qdrant.url,
         create_fulltext_index=settings.qdrant.create_fulltext_index,
+        scalar_quantization=settings.qdrant.scalar_quantization,
     )
     
     # Execute query
@@ -13,7 +13,7 @@ from src.domain.errors import ProjectNotFound
 from src.domain.policy.chunking_policy import ChunkingPolicy
 from src.infrastructure.adapters.docling_chunker import DoclingHybridChunkerAdapter
 from src.infrastructure.adapters.fastembed_embeddings import FastEmbedAdapter
-from src.infrastructure.adapters.qdrant_index import QdrantIndexAdapter
+from src.infrastructure.adapters.qdrant_index import get_qdrant_index
 from src.infrastructure.adapters.zotero_metadata import ZoteroPyzoteroResolver
 from src.infrastructure.config.settings import Settings
 
@@ -209,7 +209,11 @@ def _check_tokenizer_alignment(
 def _check_qdrant_connectivity(settings: Settings) -> dict[str, Any]:
     """T063: Check vector database connectivity."""
     try:
-        index = QdrantIndexAdapter(url=settings.qdrant.url)
+        index = get_qdrant_index(
+            url=settings.qdrant.url,
+            create_fulltext_index=settings.qdrant.create_fulltext_index,
+            scalar_quantization=settings.qdrant.scalar_quantization,
+        )
         
         if index._client is None:
             guidance = (
@@ -264,7 +268,11 @@ def _check_collection_and_model_lock(
 ) -> dict[str, Any]:
     """T064: Check collection presence and model lock verification."""
     try:
-        index = QdrantIndexAdapter(url=settings.qdrant.url)
+        index = get_qdrant_index(
+            url=settings.qdrant.url,
+            create_fulltext_index=settings.qdrant.create_fulltext_index,
+            scalar_quantization=settings.qdrant.scalar_quantization,
+        )
         
         if index._client is None:
             return {
@@ -351,7 +359,11 @@ def _check_payload_indexes(
 ) -> dict[str, Any]:
     """T065: Check payload index verification."""
     try:
-        index = QdrantIndexAdapter(url=settings.qdrant.url)
+        index = get_qdrant_index(
+            url=settings.qdrant.url,
+            create_fulltext_index=settings.qdrant.create_fulltext_index,
+            scalar_quantization=settings.qdrant.scalar_quantization,
+        )
         
         if index._client is None:
             return {
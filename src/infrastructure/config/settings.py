@@ -53,6 +53,7 @@ class QdrantSettings(BaseModel):
     api_key: str = ""
     timeout_ms: int = 15000
     create_fulltext_index: bool = True
+    scalar_quantization: bool = True  # int8 dense vectors in RAM, float32 originals on disk
     
     def __init__(self, **data: Any) -> None:
         """Initialize with environment variable precedence."""
@@ -83,6 +84,12 @@ class PathsSettings(BaseModel):
     audit_dir: str = "var/audit"
 
 
+class McpSettings(BaseModel):
+    """MCP server configuration settings."""
+    
+    pretty_print_responses: bool = False  # Indent JSON tool responses (debugging only)
+
+
 class ZoteroFulltextSettings(BaseModel):
     """Zotero fulltext configuration settings."""
     
@@ -153,6 +160,7 @@ class Settings(BaseModel):
     docling: DoclingSettings = Field(default_factory=DoclingSettings)
     qdrant: QdrantSettings = Field(default_factory=QdrantSettings)
     paths: PathsSettings = Field(default_factory=PathsSettings)
+    mcp: McpSettings = Field(default_factory=McpSettings)
     zotero: ZoteroSettings = Field(default_factory=ZoteroSettings)
     projects: dict[str, ProjectSettings] = Field(default_factory=dict)
     
@@ -197,6 +205,10 @@ class Settings(BaseModel):
         paths_data = data.get("paths", {})
         paths = PathsSettings(**paths_data)
         
+        # Extract MCP settings
+        mcp_data = data.get("mcp", {})
+        mcp = McpSettings(**mcp_data)
+        
         # Extract Zotero settings
         zotero_data = data.get("zotero", {})
         zotero_fulltext_data = zotero_data.get("fulltext", {})
@@ -234,6 +246,7 @@ class Settings(BaseModel):
             docling=docling,
             qdrant=qdrant,
             paths=paths,
+            mcp=mcp,
             zotero=zotero,
             projects=projects,
         )
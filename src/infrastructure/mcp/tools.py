@@ -18,12 +18,12 @@ from ...domain.errors import EmbeddingModelMismatch, HybridNotSupported, Project
 from ...infrastructure.adapters.docling_converter import DoclingConverterAdapter, get_converter
 from ...infrastructure.adapters.docling_chunker import DoclingHybridChunkerAdapter
 from ...infrastructure.adapters.fastembed_embeddings import FastEmbedAdapter
-from ...infrastructure.adapters.qdrant_index import QdrantIndexAdapter
+from ...infrastructure.adapters.qdrant_index import get_qdrant_index
 from ...infrastructure.adapters.zotero_metadata import ZoteroPyzoteroResolver
 from ...infrastructure.adapters.zotero_importer import ZoteroImporterAdapter
 from ...application.use_cases.batch_import_from_zotero import batch_import_from_zotero
 from ...infrastructure.config.settings import Settings
-from ...infrastructure.logging import get_correlation_id, set_correlation_id
+from ...infrastructure.logging import get_correlation_id
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +61,131 @@ class MCPToolError(Exception):
         }
 
 
+# Tool input schemas (built once at import; shared sub-schemas are reused
+# across tools rather than re-allocated on every create_tools() call).
+# Plain dicts rather than MappingProxyType: Tool.inputSchema must stay
+# JSON-serializable by pydantic. Treat these as read-only.
+_PROJECT_PROPERTY: dict[str, Any] = {
+    "type": "string",
+    "description": "Project identifier",
+}
+
+_TOP_K_BOUNDS: dict[str, Any] = {
+    "type": "integer",
+    "default": 6,
+    "minimum": 1,
+    "maximum": 20,
+}
+
+_INGEST_FROM_SOURCE_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "project": {
+            "type": "string",
+            "description": "Project identifier (e.g., citeloom/clean-arch)",
+        },
+        "source": {
+            "type": "string",
+            "description": "Path to source document/directory OR 'zotero' for Zotero collection ingestion",
+        },
+        "options": {
+            "type": "object",
+            "description": "Additional options",
+            "properties": {
+                "ocr_languages": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Explicit OCR language codes (overrides Zotero/default)",
+                },
+                "collection_key": {
+                    "type": "string",
+                    "description": "Zotero collection key (required when source='zotero')",
+                },
+                "include_tags": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Tags to include (OR logic - any match selects item). Case-insensitive partial matching.",
+                },
+                "exclude_tags": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Tags to exclude (ANY-match logic - any exclude tag excludes item). Case-insensitive partial matching.",
+                },
+                "zotero_config": {
+                    "type": "object",
+                    "description": "Override Zotero configuration (library_id, library_type, api_key for remote, or local=true for local access)",
+                },
+                "force_rebuild": {
+                    "type": "boolean",
+                    "description": "Force collection rebuild for model migration",
+                },
+            },
+        },
+    },
+    "required": ["project", "source"],
+}
+
+_QUERY_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "project": _PROJECT_PROPERTY,
+        "text": {
+            "type": "string",
+            "description": "Query text (model binding handles embedding automatically)",
+        },
+        "top_k": {
+            **_TOP_K_BOUNDS,
+            "description": "Maximum results (default 6, max configurable)",
+        },
+        "filters": {
+            "type": "object",
+            "description": "Additional filters (e.g., {\"tags\": [\"architecture\"], \"section_prefix\": \"Part I\"})",
+        },
+    },
+    "required": ["project", "text"],
+}
+
+_QUERY_HYBRID_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "project": _PROJECT_PROPERTY,
+        "text": {
+            "type": "string",
+            "description": "Query text for both sparse (BM25) and dense search",
+        },
+        "top_k": {
+            **_TOP_K_BOUNDS,
+            "description": "Maximum results (default 6)",
+        },
+        "filters": {
+            "type": "object",
+            "description": "Additional filters with AND semantics for tags",
+        },
+    },
+    "required": ["project", "text"],
+}
+
+_INSPECT_COLLECTION_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "project": _PROJECT_PROPERTY,
+        "sample": {
+            "type": "integer",
+            "description": "Number of sample payloads to return (default 0, max 5)",
+            "default": 0,
+            "minimum": 0,
+            "maximum": 5,
+        },
+    },
+    "required": ["project"],
+}
+
+_LIST_PROJECTS_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {},
+}
+
+
 def create_tools(settings: Settings) -> list[Tool]:
     """
     Create list of MCP tools for CiteLoom matching FastMCP contracts.
@@ -75,140 +200,27 @@ def create_tools(settings: Settings) -> list[Tool]:
         Tool(
             name="ingest_from_source",
             description="Ingest documents from source files or Zotero collections into a project collection. Timeout: 15s, returns counts + model IDs + warnings.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "project": {
-                        "type": "string",
-                        "description": "Project identifier (e.g., citeloom/clean-arch)",
-                    },
-                    "source": {
-                        "type": "string",
-                        "description": "Path to source document/directory OR 'zotero' for Zotero collection ingestion",
-                    },
-                    "options": {
-                        "type": "object",
-                        "description": "Additional options",
-                        "properties": {
-                            "ocr_languages": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "Explicit OCR language codes (overrides Zotero/default)",
-                            },
-                            "collection_key": {
-                                "type": "string",
-                                "description": "Zotero collection key (required when source='zotero')",
-                            },
-                            "include_tags": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "Tags to include (OR logic - any match selects item). Case-insensitive partial matching.",
-                            },
-                            "exclude_tags": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "Tags to exclude (ANY-match logic - any exclude tag excludes item). Case-insensitive partial matching.",
-                            },
-                            "zotero_config": {
-                                "type": "object",
-                                "description": "Override Zotero configuration (library_id, library_type, api_key for remote, or local=true for local access)",
-                            },
-                            "force_rebuild": {
-                                "type": "boolean",
-                                "description": "Force collection rebuild for model migration",
-                            },
-                        },
-                    },
-                },
-                "required": ["project", "source"],
-            },
+            inputSchema=_INGEST_FROM_SOURCE_SCHEMA,
         ),
         Tool(
             name="query",
             description="Dense-only vector search using named vector 'dense' with model binding. Timeout: 8s, always enforces project filter.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "project": {
-                        "type": "string",
-                        "description": "Project identifier",
-                    },
-                    "text": {
-                        "type": "string",
-                        "description": "Query text (model binding handles embedding automatically)",
-                    },
-                    "top_k": {
-                        "type": "integer",
-                        "description": "Maximum results (default 6, max configurable)",
-                        "default": 6,
-                        "minimum": 1,
-                        "maximum": 20,
-                    },
-                    "filters": {
-                        "type": "object",
-                        "description": "Additional filters (e.g., {\"tags\": [\"architecture\"], \"section_prefix\": \"Part I\"})",
-                    },
-                },
-                "required": ["project", "text"],
-            },
+            inputSchema=_QUERY_SCHEMA,
         ),
         Tool(
             name="query_hybrid",
             description="Hybrid search using RRF fusion (named vectors: dense + sparse). Timeout: 15s, requires both dense and sparse models bound.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "project": {
-                        "type": "string",
-                        "description": "Project identifier",
-                    },
-                    "text": {
-                        "type": "string",
-                        "description": "Query text for both sparse (BM25) and dense search",
-                    },
-                    "top_k": {
-                        "type": "integer",
-                        "description": "Maximum results (default 6)",
-                        "default": 6,
-                        "minimum": 1,
-                        "maximum": 20,
-                    },
-                    "filters": {
-                        "type": "object",
-                        "description": "Additional filters with AND semantics for tags",
-                    },
-                },
-                "required": ["project", "text"],
-            },
+            inputSchema=_QUERY_HYBRID_SCHEMA,
         ),
         Tool(
             name="inspect_collection",
             description="Inspect project collection metadata, model bindings, and structure. Timeout: 5s, shows collection stats and sample payloads.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "project": {
-                        "type": "string",
-                        "description": "Project identifier",
-                    },
-                    "sample": {
-                        "type": "integer",
-                        "description": "Number of sample payloads to return (default 0, max 5)",
-                        "default": 0,
-                        "minimum": 0,
-                        "maximum": 5,
-                    },
-                },
-                "required": ["project"],
-            },
+            inputSchema=_INSPECT_COLLECTION_SCHEMA,
         ),
         Tool(
             name="list_projects",
             description="List all configured projects with metadata. No timeout (fast enumeration).",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-            },
+            inputSchema=_LIST_PROJECTS_SCHEMA,
         ),
     ]
 
@@ -257,33 +269,61 @@ def _trim_text(text: str, max_chars: int = MAX_CHARS_PER_CHUNK) -> str:
         max_chars: Maximum characters (default 1800)
     
     Returns:
-        Trimmed text with ellipsis if truncated
+        Trimmed text with ellipsis if truncated (ellipsis included in max_chars)
     """
     if len(text) <= max_chars:
         return text
-    # Trim to max_chars, then find last space before that point
-    trimmed = text[:max_chars]
+    # Leave room for the ellipsis, then find last space before that point
+    trimmed = text[:max_chars - len("...")]
     last_space = trimmed.rfind(" ")
     if last_space > 0:
         return trimmed[:last_space] + "..."
-    return trimmed[:max_chars] + "..."
+    return trimmed + "..."
 
 
-def _add_correlation_id(result: dict[str, Any]) -> dict[str, Any]:
+def _add_correlation_id(result: dict[str, Any], correlation_id: str | None = None) -> dict[str, Any]:
     """
-    Add correlation ID to response (T054).
+    Add correlation ID to response in place (T054).
     
     Args:
-        result: Response dictionary
+        result: Response dictionary (mutated, not copied)
+        correlation_id: Correlation ID already read by the handler; looked up
+            from the context only when not supplied
     
     Returns:
-        Response with correlation_id added
+        The same response dictionary with correlation_id set
     """
-    correlation_id = get_correlation_id()
-    result["correlation_id"] = correlation_id
+    result["correlation_id"] = correlation_id or get_correlation_id()
     return result
 
 
+def _finalize(
+    result: dict[str, Any],
+    settings: Settings,
+    correlation_id: str | None = None,
+) -> str:
+    """
+    Attach correlation ID and serialize a tool response.
+    
+    Single exit point for both success and error responses so every tool
+    shares one serialization path. Responses are compact JSON (MCP clients
+    parse them programmatically); indentation is only applied when
+    ``[mcp] pretty_print_responses`` is enabled for debugging.
+    
+    Args:
+        result: Response dictionary
+        settings: Application settings
+        correlation_id: Correlation ID already read by the handler
+    
+    Returns:
+        JSON string response
+    """
+    result = _add_correlation_id(result, correlation_id)
+    if settings.mcp.pretty_print_responses:
+        return json.dumps(result, indent=2)
+    return json.dumps(result, separators=(",", ":"))
+
+
 async def handle_ingest_from_source(arguments: dict[str, Any], settings: Settings) -> str:
     """
     Handle ingest_from_source tool call (T047).
@@ -294,9 +334,8 @@ async def handle_ingest_from_source(arguments: dict[str, Any], settings: Setting
     source = arguments["source"]
     options = arguments.get("options", {})
     
-    # Generate correlation ID for this operation
+    # Read (or generate) the correlation ID once per request
     correlation_id = get_correlation_id()
-    set_correlation_id(correlation_id)
     
     _validate_project(project_id, settings)
     project_settings = settings.get_project(project_id)
@@ -334,9 +373,10 @@ async def handle_ingest_from_source(arguments: dict[str, Any], settings: Setting
         chunker = DoclingHybridChunkerAdapter()
         resolver = ZoteroPyzoteroResolver(zotero_config=zotero_config)
         embedder = FastEmbedAdapter(default_model=project_settings.embedding_model)
-        index = QdrantIndexAdapter(
+        index = get_qdrant_index(
             url=settings.qdrant.url,
             create_fulltext_index=settings.qdrant.create_fulltext_index,
+            scalar_quantization=settings.qdrant.scalar_quantization,
         )
         
         # Execute batch import with timeout (15s)
@@ -372,7 +412,7 @@ async def handle_ingest_from_source(arguments: dict[str, Any], settings: Setting
         
         try:
             result = await asyncio.wait_for(_batch_import(), timeout=15.0)
-            return json.dumps(result, indent=2)
+            return _finalize(result, settings, correlation_id)
         except asyncio.TimeoutError:
             raise MCPToolError(
                 code="TIMEOUT",
@@ -407,9 +447,10 @@ async def handle_ingest_from_source(arguments: dict[str, Any], settings: Setting
     converter = get_converter()
     chunker = DoclingHybridChunkerAdapter()
     embedder = FastEmbedAdapter()
-    index = QdrantIndexAdapter(
+    index = get_qdrant_index(
         url=settings.qdrant.url,
         create_fulltext_index=settings.qdrant.create_fulltext_index,
+        scalar_quantization=settings.qdrant.scalar_quantization,
     )
     
     # Initialize metadata resolver (uses environment variables or zotero_config)
@@ -522,105 +563,42 @@ async def handle_ingest_from_source(arguments: dict[str, Any], settings: Setting
             ) from e
     
     result = await _run_with_timeout(_ingest(), timeout_seconds=15.0, operation_name="ingest_from_source")
-    result = _add_correlation_id(result)
-    return json.dumps(result, indent=2)
+    return _finalize(result, settings, correlation_id)
 
 
-async def handle_query(arguments: dict[str, Any], settings: Settings) -> str:
+async def _handle_query(
+    arguments: dict[str, Any],
+    settings: Settings,
+    *,
+    hybrid: bool,
+    timeout: float,
+) -> str:
     """
-    Handle query tool call - dense-only vector search (T048).
+    Shared implementation of the query and query_hybrid tools.
     
-    Uses named vector 'dense' with model binding, 8s timeout.
-    """
-    project_id = arguments["project"]
-    query_text = arguments["text"]
-    top_k = arguments.get("top_k", 6)
-    filters = arguments.get("filters")
-    
-    # Generate correlation ID
-    correlation_id = get_correlation_id()
-    set_correlation_id(correlation_id)
-    
-    _validate_project(project_id, settings)
-    project_settings = settings.get_project(project_id)
-    
-    # Initialize adapters
-    embedder = FastEmbedAdapter()
-    index = QdrantIndexAdapter(
-        url=settings.qdrant.url,
-        create_fulltext_index=settings.qdrant.create_fulltext_index,
-    )
-    
-    # Create request
-    request = QueryRequest(
-        project_id=project_id,
-        query_text=query_text,
-        top_k=top_k,
-        hybrid=False,  # Dense-only search
-        filters=filters,
-    )
-    
-    # Execute query with timeout (8s)
-    async def _query() -> dict[str, Any]:
-        loop = asyncio.get_event_loop()
-        try:
-            result = await loop.run_in_executor(
-                None,
-                lambda: query_chunks(request, embedder, index)
-            )
-            
-            # Format items for MCP response with text trimming (T053)
-            items = []
-            for item in result.items:
-                trimmed_text = _trim_text(item.text)
-                items.append({
-                    "render_text": trimmed_text,
-                    "score": item.score,
-                    "citekey": item.citekey,
-                    "section": item.section,
-                    "page_span": list(item.page_span) if item.page_span else None,
-                    "section_path": item.section_path,
-                    "doi": item.doi,
-                    "full_text": None,  # Not included by default per contract
-                })
-            
-            return {
-                "items": items,
-                "count": len(items),
-                "model": project_settings.embedding_model,
-            }
-        except ProjectNotFound as e:
-            raise MCPToolError(
-                code=MCPErrorCode.INVALID_PROJECT,
-                message=str(e),
-                details={"project_id": project_id},
-            ) from e
-    
-    result = await _run_with_timeout(_query(), timeout_seconds=8.0, operation_name="query")
-    result = _add_correlation_id(result)
-    return json.dumps(result, indent=2)
-
-
-async def handle_query_hybrid(arguments: dict[str, Any], settings: Settings) -> str:
-    """
-    Handle query_hybrid tool call - hybrid search with RRF fusion (T049).
+    Args:
+        arguments: Tool arguments (project, text, top_k, filters)
+        settings: Application settings
+        hybrid: Whether to run hybrid (dense + sparse, RRF) search
+        timeout: Timeout in seconds for the search
     
-    Requires both dense and sparse models bound, 15s timeout.
+    Returns:
+        JSON string result
     """
+    operation_name = "query_hybrid" if hybrid else "query"
     project_id = arguments["project"]
     query_text = arguments["text"]
     top_k = arguments.get("top_k", 6)
     filters = arguments.get("filters")
     
-    # Generate correlation ID
+    # Read (or generate) the correlation ID once per request
     correlation_id = get_correlation_id()
-    set_correlation_id(correlation_id)
     
     _validate_project(project_id, settings)
     project_settings = settings.get_project(project_id)
     
     # Check hybrid enabled
-    if not project_settings.hybrid_enabled:
+    if hybrid and not project_settings.hybrid_enabled:
         raise MCPToolError(
             code=MCPErrorCode.HYBRID_NOT_SUPPORTED,
             message=f"Hybrid search not enabled for project '{project_id}'",
@@ -629,9 +607,10 @@ async def handle_query_hybrid(arguments: dict[str, Any], settings: Settings) ->
     
     # Initialize adapters
     embedder = FastEmbedAdapter()
-    index = QdrantIndexAdapter(
+    index = get_qdrant_index(
         url=settings.qdrant.url,
         create_fulltext_index=settings.qdrant.create_fulltext_index,
+        scalar_quantization=settings.qdrant.scalar_quantization,
     )
     
     # Create request
@@ -639,11 +618,10 @@ async def handle_query_hybrid(arguments: dict[str, Any], settings: Settings) ->
         project_id=project_id,
         query_text=query_text,
         top_k=top_k,
-        hybrid=True,  # Hybrid search
+        hybrid=hybrid,
         filters=filters,
     )
     
-    # Execute query with timeout (15s)
     async def _query() -> dict[str, Any]:
         loop = asyncio.get_event_loop()
         try:
@@ -655,16 +633,25 @@ async def handle_query_hybrid(arguments: dict[str, Any], settings: Settings) ->
             # Format items for MCP response with text trimming (T053)
             items = []
             for item in result.items:
-                trimmed_text = _trim_text(item.text)
-                items.append({
-                    "render_text": trimmed_text,
+                formatted = {
+                    "render_text": _trim_text(item.text),
                     "score": item.score,
                     "citekey": item.citekey,
                     "section": item.section,
                     "page_span": list(item.page_span) if item.page_span else None,
                     "section_path": item.section_path,
                     "doi": item.doi,
-                })
+                }
+                if not hybrid:
+                    formatted["full_text"] = None  # Not included by default per contract
+                items.append(formatted)
+            
+            if not hybrid:
+                return {
+                    "items": items,
+                    "count": len(items),
+                    "model": project_settings.embedding_model,
+                }
             
             # Get sparse model ID from collection
             sparse_model_id = "Qdrant/bm25"  # Default
@@ -701,9 +688,26 @@ async def handle_query_hybrid(arguments: dict[str, Any], settings: Settings) ->
                 details={"project_id": project_id},
             ) from e
     
-    result = await _run_with_timeout(_query(), timeout_seconds=15.0, operation_name="query_hybrid")
-    result = _add_correlation_id(result)
-    return json.dumps(result, indent=2)
+    result = await _run_with_timeout(_query(), timeout_seconds=timeout, operation_name=operation_name)
+    return _finalize(result, settings, correlation_id)
+
+
+async def handle_query(arguments: dict[str, Any], settings: Settings) -> str:
+    """
+    Handle query tool call - dense-only vector search (T048).
+    
+    Uses named vector 'dense' with model binding, 8s timeout.
+    """
+    return await _handle_query(arguments, settings, hybrid=False, timeout=8.0)
+
+
+async def handle_query_hybrid(arguments: dict[str, Any], settings: Settings) -> str:
+    """
+    Handle query_hybrid tool call - hybrid search with RRF fusion (T049).
+    
+    Requires both dense and sparse models bound, 15s timeout.
+    """
+    return await _handle_query(arguments, settings, hybrid=True, timeout=15.0)
 
 
 async def handle_inspect_collection(arguments: dict[str, Any], settings: Settings) -> str:
@@ -715,16 +719,19 @@ async def handle_inspect_collection(arguments: dict[str, Any], settings: Setting
     project_id = arguments["project"]
     sample_count = arguments.get("sample", 0)
     
-    # Generate correlation ID
+    # Read (or generate) the correlation ID once per request
     correlation_id = get_correlation_id()
-    set_correlation_id(correlation_id)
     
     _validate_project(project_id, settings)
     project_settings = settings.get_project(project_id)
     collection_name = f"proj-{project_id.replace('/', '-')}"
     
     # Initialize Qdrant adapter
-    index = QdrantIndexAdapter(url=settings.qdrant.url)
+    index = get_qdrant_index(
+        url=settings.qdrant.url,
+        create_fulltext_index=settings.qdrant.create_fulltext_index,
+        scalar_quantization=settings.qdrant.scalar_quantization,
+    )
     
     # Get collection info with timeout (5s)
     async def _inspect() -> dict[str, Any]:
@@ -800,7 +807,8 @@ async def handle_inspect_collection(arguments: dict[str, Any], settings: Setting
             
             # Determine indexes (simplified - actual indexes may differ)
             indexes = {
-                "keyword": ["project_id", "doc_id", "citekey", "year", "tags"],
+                "keyword": ["project_id", "doc_id", "citekey", "tags"],
+                "integer": ["year"],
                 "fulltext": ["chunk_text"] if settings.qdrant.create_fulltext_index else [],
             }
             
@@ -846,8 +854,7 @@ async def handle_inspect_collection(arguments: dict[str, Any], settings: Setting
             ) from e
     
     result = await _run_with_timeout(_inspect(), timeout_seconds=5.0, operation_name="inspect_collection")
-    result = _add_correlation_id(result)
-    return json.dumps(result, indent=2)
+    return _finalize(result, settings, correlation_id)
 
 
 async def handle_list_projects(arguments: dict[str, Any], settings: Settings) -> str:
@@ -856,9 +863,8 @@ async def handle_list_projects(arguments: dict[str, Any], settings: Settings) ->
     
     Fast enumeration with no timeout.
     """
-    # Generate correlation ID
+    # Read (or generate) the correlation ID once per request
     correlation_id = get_correlation_id()
-    set_correlation_id(correlation_id)
     
     projects = []
     for project_id, project_settings in settings.projects.items():
@@ -868,7 +874,11 @@ async def handle_list_projects(arguments: dict[str, Any], settings: Settings) ->
         sparse_model_id = None
         if project_settings.hybrid_enabled:
             # Try to get from collection metadata
-            index = QdrantIndexAdapter(url=settings.qdrant.url)
+            index = get_qdrant_index(
+                url=settings.qdrant.url,
+                create_fulltext_index=settings.qdrant.create_fulltext_index,
+                scalar_quantization=settings.qdrant.scalar_quantization,
+            )
             try:
                 if index._client is not None:
                     collection_info = index._client.get_collection(collection_name)
@@ -889,8 +899,7 @@ async def handle_list_projects(arguments: dict[str, Any], settings: Settings) ->
         "projects": projects,
         "count": len(projects),
     }
-    result = _add_correlation_id(result)
-    return json.dumps(result, indent=2)
+    return _finalize(result, settings, correlation_id)
 
 
 async def handle_tool_call(name: str, arguments: dict[str, Any], settings: Settings) -> str:
@@ -926,10 +935,7 @@ async def handle_tool_call(name: str, arguments: dict[str, Any], settings: Setti
                 details={"tool_name": name},
             )
     except MCPToolError as e:
-        # Return error as JSON
-        error_json = e.to_json()
-        error_json = _add_correlation_id(error_json)
-        return json.dumps(error_json, indent=2)
+        return _finalize(e.to_json(), settings)
     except Exception as e:
         logger.error(f"Unexpected error in tool '{name}': {e}", exc_info=True)
         error = MCPToolError(
@@ -937,6 +943,4 @@ async def handle_tool_call(name: str, arguments: dict[str, Any], settings: Setti
             message=f"Internal error: {e}",
             details={"tool_name": name},
         )
-        error_json = error.to_json()
-        error_json = _add_correlation_id(error_json)
-        return json.dumps(error_json, indent=2)
+        return _finalize(error.to_json(), settings)
@@ -1,7 +1,9 @@
 import sys
 from pathlib import Path
 
+# Tests import the package as ``src.…`` (as the CLI entry point does). Only the
+# repository root goes on sys.path, so a bare ``infrastructure.…`` import fails
+# instead of loading a second copy of each module and its process-level caches.
 ROOT = Path(__file__).resolve().parents[1]
-SRC = ROOT / "src"
-if str(SRC) not in sys.path:
-    sys.path.insert(0, str(SRC))
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
@@ -0,0 +1,55 @@
+"""Cached lookup of optional real-document fixtures for integration tests."""
+
+from __future__ import annotations
+
+import functools
+from pathlib import Path
+
+# Real paper used when present (large, with a clear heading hierarchy)
+_SAKAI_PAPER = Path(
+    "assets/raw/Sakai - 2025 - AI Agent Architecture Mapping Domain, Agent, and Orchestration to Clean Architecture.pdf"
+)
+
+
+def _first_existing(candidates: tuple[Path, ...]) -> str | None:
+    """Return the absolute path of the first candidate that exists, or None."""
+    for pdf_path in candidates:
+        if pdf_path.exists():
+            return str(pdf_path.absolute())
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def find_large_document() -> str | None:
+    """Get path to a large document (20+ pages) if available (stats each candidate once per process)."""
+    return _first_existing((
+        _SAKAI_PAPER,
+        Path("assets/raw/test_large_document.pdf"),
+        Path("tests/fixtures/large_document.pdf"),
+    ))
+
+
+@functools.lru_cache(maxsize=None)
+def find_headings_document() -> str | None:
+    """Get path to a document with clear headings if available (stats each candidate once per process)."""
+    return _first_existing((
+        _SAKAI_PAPER,
+        Path("assets/raw/test_with_headings.pdf"),
+        Path("tests/fixtures/document_with_headings.pdf"),
+    ))
+
+
+@functools.lru_cache(maxsize=None)
+def find_multi_page_document() -> str | None:
+    """Get path to a multi-page PDF file if available (stats each candidate once per process)."""
+    return _first_existing((
+        _SAKAI_PAPER,
+        Path("assets/raw/test_multi_page.pdf"),
+        Path("tests/fixtures/multi_page.pdf"),
+    ))
+
+
+@functools.lru_cache(maxsize=None)
+def find_sample_document() -> str | None:
+    """Get path to the sample PDF used by smoke tests if available (stats it once per process)."""
+    return _first_existing((_SAKAI_PAPER,))
@@ -0,0 +1,15 @@
+"""Shared helpers for the MCP tool integration tests."""
+
+from __future__ import annotations
+
+import json
+
+from src.infrastructure.config.settings import Settings
+
+# Settings with no projects; read-only, so one instance serves every test
+EMPTY_SETTINGS = Settings()
+
+
+def error_code(result: str) -> str | None:
+    """Parse a tool response once and return its error code (None for success)."""
+    return json.loads(result).get("error", {}).get("code")
@@ -0,0 +1,214 @@
+"""Shared fixtures for integration tests."""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.metadata
+import os
+import pickle
+from functools import cache
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from src.domain.policy.chunking_policy import ChunkingPolicy
+from src.infrastructure.config.settings import Settings
+from src.infrastructure.adapters import docling_converter as docling_converter_module
+from src.infrastructure.adapters.docling_converter import DoclingConverterAdapter
+from src.infrastructure.adapters.fastembed_embeddings import FastEmbedAdapter, get_embedding_model
+from src.infrastructure.adapters.qdrant_index import QdrantIndexAdapter, get_qdrant_index
+
+from _fixture_paths import (
+    find_headings_document,
+    find_large_document,
+    find_multi_page_document,
+    find_sample_document,
+)
+
+# Conversion results memoized per session, keyed by (path, mtime, size) so an
+# edited file is re-converted
+_conversion_cache: dict[tuple[str, int, int], dict[str, Any]] = {}
+
+# Real-document fixtures -> (path lookup, skip reason); tests depending on one whose
+# PDF is missing are skipped at collection, before any fixture setup runs
+_PDF_FIXTURE_FINDERS: dict[str, tuple[Callable[[], str | None], str]] = {
+    "large_document_pdf": (
+        find_large_document,
+        "Large document not available - requires actual PDF file with 20+ pages",
+    ),
+    "sample_document_with_headings": (
+        find_headings_document,
+        "Document with headings not available - requires actual PDF file with headings",
+    ),
+    "sample_multi_page_pdf": (
+        find_multi_page_document,
+        "Multi-page PDF not available - requires actual PDF file with 2+ pages",
+    ),
+    "smoke_pdf_path": (find_sample_document, "Sample PDF not available"),
+}
+
+# On-disk conversion artifacts, keyed by content-hash doc_id plus the converter
+# fingerprint so they survive across runs; set CITELOOM_TEST_REFRESH_CACHE=1 to
+# force re-conversion
+_CONVERSION_CACHE_DIR = Path(__file__).resolve().parents[1] / "fixtures" / "_cache"
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip tests that need a missing real-document PDF (checked once per fixture)."""
+    for item in items:
+        for fixture_name in getattr(item, "fixturenames", ()):
+            finder = _PDF_FIXTURE_FINDERS.get(fixture_name)
+            if finder is not None and finder[0]() is None:
+                item.add_marker(pytest.mark.skip(reason=finder[1]))
+                break
+
+
+@cache
+def _converter_fingerprint() -> str:
+    """
+    Short hash of the installed Docling version and the converter adapter source.
+    
+    Upgrading Docling or editing docling_converter.py changes the conversion output,
+    so either one must invalidate the on-disk artifacts.
+    """
+    digest = hashlib.sha256(importlib.metadata.version("docling").encode())
+    digest.update(Path(docling_converter_module.__file__).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _load_or_convert(
+    converter: DoclingConverterAdapter, source_path: str, worker_id: str
+) -> dict[str, Any]:
+    """
+    Load a pickled conversion result for the file's content hash and the converter
+    fingerprint, or convert and store it.
+    
+    Writes go to a per-worker temp file and are moved into place atomically, so
+    concurrent pytest-xdist workers never read a partially written artifact.
+    """
+    doc_id = converter._compute_doc_id(source_path)
+    cache_file = _CONVERSION_CACHE_DIR / f"{doc_id}-{_converter_fingerprint()}.pkl"
+    refresh = os.getenv("CITELOOM_TEST_REFRESH_CACHE") == "1"
+
+    if cache_file.exists() and not refresh:
+        with cache_file.open("rb") as f:
+            return pickle.load(f)
+
+    result = converter.convert(source_path)
+    _CONVERSION_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{worker_id}.tmp")
+    with tmp_file.open("wb") as f:
+        pickle.dump(result, f)
+    os.replace(tmp_file, cache_file)
+    return result
+
+
+@pytest.fixture(scope="session")
+def docling_class() -> type[DoclingConverterAdapter]:
+    """Converter class for tests that only read class-level configuration (no model load)."""
+    return DoclingConverterAdapter
+
+
+@pytest.fixture(scope="session")
+def docling_converter() -> DoclingConverterAdapter:
+    """
+    Single Docling converter per session (model load is the expensive part).
+    
+    Under pytest-xdist every worker is its own process and session, so each worker
+    builds exactly one converter and serves all of its tests with it.
+    
+    Modules using this fixture guard themselves with pytest.importorskip("docling")
+    or skipif(not DOCLING_AVAILABLE), so Docling is importable whenever it is constructed.
+    """
+    return DoclingConverterAdapter()
+
+
+@pytest.fixture(scope="session")
+def convert_document(
+    docling_converter: DoclingConverterAdapter,
+    worker_id: str,
+) -> Callable[[str], dict[str, Any]]:
+    """
+    Return a converter function that converts each file at most once per session.
+
+    Results are also persisted under tests/fixtures/_cache, so later runs skip
+    Docling conversion entirely until the file content, the Docling version or
+    the converter adapter changes.
+    """
+    def _convert(source_path: str) -> dict[str, Any]:
+        stat = Path(source_path).stat()
+        key = (source_path, stat.st_mtime_ns, stat.st_size)
+        if key not in _conversion_cache:
+            _conversion_cache[key] = _load_or_convert(docling_converter, source_path, worker_id)
+        return _conversion_cache[key]
+
+    return _convert
+
+
+@pytest.fixture(scope="session")
+def embedding_adapter() -> FastEmbedAdapter:
+    """Process-scoped embedding model, so the ONNX weights load once per session."""
+    return get_embedding_model()
+
+
+@pytest.fixture(scope="session")
+def qdrant_index() -> QdrantIndexAdapter:
+    """
+    Process-scoped index adapter, so the Qdrant connection is probed once per session.
+    
+    State is shared across tests: use a project ID unique to the test.
+    """
+    return get_qdrant_index()
+
+
+@pytest.fixture(scope="session")
+def default_chunking_policy() -> ChunkingPolicy:
+    """Chunking policy shared by the Docling chunking tests (frozen, so safe to reuse)."""
+    return ChunkingPolicy(
+        max_tokens=450,
+        overlap_tokens=60,
+        heading_context=2,
+        tokenizer_id="minilm",
+    )
+
+
+@pytest.fixture(scope="session")
+def large_document_pdf() -> str | None:
+    """Get path to a large document (20+ pages) if available."""
+    return find_large_document()
+
+
+@pytest.fixture(scope="session")
+def converted_large_document(
+    convert_document: Callable[[str], dict[str, Any]],
+    large_document_pdf: str | None,
+) -> dict[str, Any]:
+    """Conversion result of the large document, converted once per session."""
+    return convert_document(large_document_pdf)
+
+
+@pytest.fixture(scope="session")
+def test_settings(tmp_path_factory: pytest.TempPathFactory) -> Settings:
+    """MCP tool settings with a hybrid and a dense-only project. Parsed once per session; copy before mutating."""
+    config_file = tmp_path_factory.mktemp("cfg") / "citeloom.toml"
+    config_content = """[project."test/project"]
+collection = "proj-test-project"
+references_json = "test.json"
+embedding_model = "fastembed/all-MiniLM-L6-v2"
+sparse_model = "Qdrant/bm25"
+hybrid_enabled = true
+
+[project."test/project-no-hybrid"]
+collection = "proj-test-project-no-hybrid"
+references_json = "test.json"
+embedding_model = "fastembed/all-MiniLM-L6-v2"
+hybrid_enabled = false
+
+[qdrant]
+url = "http://localhost:6333"
+create_fulltext_index = true
+"""
+    config_file.write_text(config_content)
+    
+    return Settings.from_toml(config_file)
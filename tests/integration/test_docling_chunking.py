@@ -4,44 +4,31 @@ from __future__ import annotations
 
 import pytest
 import sys
-from pathlib import Path
 from typing import Any
 
-from src.infrastructure.adapters.docling_converter import DoclingConverterAdapter
-from src.infrastructure.adapters.docling_chunker import DoclingHybridChunkerAdapter
-from src.domain.policy.chunking_policy import ChunkingPolicy
+# Skip the whole module at collection time when Docling is not installed
+docling = pytest.importorskip("docling", reason="Docling not available (Windows compatibility - use WSL/Docker)")
 
+from src.infrastructure.adapters.docling_chunker import DoclingHybridChunkerAdapter  # noqa: E402
+from src.domain.models.chunk import Chunk  # noqa: E402
+from src.domain.policy.chunking_policy import ChunkingPolicy  # noqa: E402
 
-@pytest.fixture
-def docling_available():
-    """Skip tests if Docling is not available."""
-    try:
-        converter = DoclingConverterAdapter()
-        return converter
-    except ImportError:
-        pytest.skip("Docling not available (Windows compatibility - use WSL/Docker)")
 
-
-@pytest.fixture
-def large_document_pdf():
-    """Get path to a large document (20+ pages) if available."""
-    possible_paths = [
-        Path("assets/raw/Sakai - 2025 - AI Agent Architecture Mapping Domain, Agent, and Orchestration to Clean Architecture.pdf"),
-        Path("assets/raw/test_large_document.pdf"),
-        Path("tests/fixtures/large_document.pdf"),
-    ]
-    
-    for pdf_path in possible_paths:
-        if pdf_path.exists():
-            return str(pdf_path.absolute())
-    return None
+@pytest.fixture(scope="class")
+def chunked_large_doc(
+    converted_large_document, default_chunking_policy: ChunkingPolicy
+) -> tuple[dict[str, Any], list[Any]]:
+    """Chunk the shared large-document conversion once for the whole class."""
+    chunks = DoclingHybridChunkerAdapter().chunk(converted_large_document, default_chunking_policy)
+    return converted_large_document, chunks
 
 
+@pytest.mark.xdist_group("docling")
 class TestDoclingChunking:
     """Tests for chunk creation and manual chunking fallback."""
     
     def test_chunk_creation_produces_multiple_chunks_from_large_document(
-        self, docling_available, large_document_pdf
+        self, chunked_large_doc
     ):
         """
         Test that chunk creation produces multiple chunks from large documents.
@@ -54,14 +41,8 @@ class TestDoclingChunking:
         - Chunks cover the document content
         - Chunk count is proportional to document size
         """
-        if large_document_pdf is None:
-            pytest.skip("Large document not available - requires actual PDF file with 20+ pages")
-        
-        converter = docling_available
-        chunker = DoclingHybridChunkerAdapter()
-        
-        # Convert document
-        conversion_result = converter.convert(large_document_pdf)
+        # Conversion and chunking are shared across the class (done once)
+        conversion_result, chunks = chunked_large_doc
         
         # Get page count from conversion result
         page_map = conversion_result.get("structure", {}).get("page_map", {})
@@ -70,56 +51,38 @@ class TestDoclingChunking:
         if page_count < 20:
             pytest.skip(f"Document has only {page_count} pages, need 20+ pages for large document test")
         
-        # Create chunking policy
-        policy = ChunkingPolicy(
-            max_tokens=450,
-            overlap_tokens=60,
-            heading_context=2,
-            tokenizer_id="minilm",
-        )
-        
-        # Chunk the document
-        chunks = chunker.chunk(conversion_result, policy)
-        
         # T020: Verify multiple chunks are created
         assert len(chunks) > 1, f"Large document should produce multiple chunks, got {len(chunks)}"
         assert len(chunks) >= 15, f"Large document (20+ pages) should produce at least 15 chunks, got {len(chunks)}"
         assert len(chunks) <= 100, f"Large document should produce reasonable number of chunks, got {len(chunks)} (may indicate issue)"
         
-        # Verify chunk structure
-        for chunk in chunks:
-            assert hasattr(chunk, "id") or "id" in dir(chunk), "Chunk should have id"
-            assert hasattr(chunk, "doc_id") or "doc_id" in dir(chunk), "Chunk should have doc_id"
-            assert hasattr(chunk, "text") or "text" in dir(chunk), "Chunk should have text"
-            assert hasattr(chunk, "page_span") or "page_span" in dir(chunk), "Chunk should have page_span"
-            
-            # Access chunk attributes (handle both object and dict)
-            chunk_id = chunk.id if hasattr(chunk, "id") else chunk.get("id")
-            chunk_doc_id = chunk.doc_id if hasattr(chunk, "doc_id") else chunk.get("doc_id")
-            chunk_text = chunk.text if hasattr(chunk, "text") else chunk.get("text", "")
-            chunk_page_span = chunk.page_span if hasattr(chunk, "page_span") else chunk.get("page_span")
-            
-            assert chunk_id, "Chunk id should not be empty"
-            assert chunk_doc_id == conversion_result.get("doc_id"), "Chunk doc_id should match conversion result"
-            assert chunk_text, "Chunk text should not be empty"
-            assert chunk_page_span, "Chunk page_span should not be empty"
-            
-            # Verify page_span is valid
-            if isinstance(chunk_page_span, tuple) and len(chunk_page_span) == 2:
-                start_page, end_page = chunk_page_span
-                assert isinstance(start_page, int), "Page span start should be int"
-                assert isinstance(end_page, int), "Page span end should be int"
-                assert start_page > 0, "Page span start should be positive"
-                assert end_page >= start_page, "Page span end should be >= start"
-        
-        # Verify chunks cover document (check page spans)
-        all_page_spans = [
-            chunk.page_span if hasattr(chunk, "page_span") else chunk.get("page_span")
-            for chunk in chunks
+        # Verify chunk structure: chunker returns domain Chunks, so read attributes
+        # directly; extract once per chunk, then check each invariant over the rows
+        # (failures report the offending index)
+        assert all(isinstance(chunk, Chunk) for chunk in chunks), "Chunker should return Chunk instances"
+        rows = [(chunk.id, chunk.doc_id, chunk.text, chunk.page_span) for chunk in chunks]
+        expected_doc_id = conversion_result.get("doc_id")
+        
+        bad = [i for i, row in enumerate(rows) if not row[0]]
+        assert not bad, f"Chunk id should not be empty (chunk indices {bad})"
+        bad = [i for i, row in enumerate(rows) if row[1] != expected_doc_id]
+        assert not bad, f"Chunk doc_id should match conversion result (chunk indices {bad})"
+        bad = [i for i, row in enumerate(rows) if not row[2]]
+        assert not bad, f"Chunk text should not be empty (chunk indices {bad})"
+        bad = [i for i, row in enumerate(rows) if not row[3]]
+        assert not bad, f"Chunk page_span should not be empty (chunk indices {bad})"
+        
+        # Verify page_span is valid: positive int start, end >= start
+        spans = [row[3] for row in rows if isinstance(row[3], tuple) and len(row[3]) == 2]
+        bad = [
+            span for span in spans
+            if not (isinstance(span[0], int) and isinstance(span[1], int) and 0 < span[0] <= span[1])
         ]
+        assert not bad, f"Page spans should be (start, end) ints with 0 < start <= end, got {bad}"
         
-        min_page = min(span[0] for span in all_page_spans if span and isinstance(span, tuple))
-        max_page = max(span[1] for span in all_page_spans if span and isinstance(span, tuple))
+        # Verify chunks cover document (check page spans)
+        starts, ends = zip(*spans)
+        min_page, max_page = min(starts), max(ends)
         
         assert min_page == 1, f"Chunks should start from page 1, got min_page={min_page}"
         assert max_page <= page_count, f"Chunks should not exceed document page count ({page_count}), got max_page={max_page}"
@@ -129,7 +92,7 @@ class TestDoclingChunking:
             f"Expected 15-100 chunks for large document, got {len(chunks)} (range allows for variations)"
     
     def test_manual_chunking_fallback_windows_produces_multiple_chunks(
-        self, docling_available, large_document_pdf
+        self, chunked_large_doc
     ):
         """
         Test that manual chunking fallback on Windows produces multiple chunks.
@@ -144,14 +107,8 @@ class TestDoclingChunking:
         - Chunks are proportional to document size
         - Chunk structure is valid
         """
-        if large_document_pdf is None:
-            pytest.skip("Large document not available - requires actual PDF file")
-        
-        converter = docling_available
-        chunker = DoclingHybridChunkerAdapter()
-        
-        # Convert document
-        conversion_result = converter.convert(large_document_pdf)
+        # Conversion and chunking are shared across the class (done once)
+        conversion_result, chunks = chunked_large_doc
         
         # Force manual chunking by simulating Windows environment
         # (In real Windows, HybridChunker would fail to import)
@@ -167,17 +124,6 @@ class TestDoclingChunking:
         page_map = structure.get("page_map", {})
         doc_id = conversion_result.get("doc_id", "test")
         
-        # Create chunking policy
-        policy = ChunkingPolicy(
-            max_tokens=450,
-            overlap_tokens=60,
-            heading_context=2,
-            tokenizer_id="minilm",
-        )
-        
-        # Chunk using the chunker (will use manual fallback if HybridChunker unavailable)
-        chunks = chunker.chunk(conversion_result, policy)
-        
         # T021: Verify manual chunking produces multiple chunks
         # For a large document, we should get multiple chunks even with manual chunking
         if len(page_map) >= 10:  # Large enough document
@@ -192,20 +138,19 @@ class TestDoclingChunking:
         
         # Verify chunk structure is valid
         assert len(chunks) > 0, "Should produce at least one chunk"
+        assert all(isinstance(chunk, Chunk) for chunk in chunks), "Chunker should return Chunk instances"
         
-        for chunk in chunks:
-            chunk_text = chunk.text if hasattr(chunk, "text") else chunk.get("text", "")
-            chunk_page_span = chunk.page_span if hasattr(chunk, "page_span") else chunk.get("page_span")
-            
+        chunk_texts = [chunk.text for chunk in chunks]
+        
+        for chunk_text, chunk in zip(chunk_texts, chunks):
             assert chunk_text, "Chunk text should not be empty"
-            assert chunk_page_span, "Chunk should have page_span"
+            assert chunk.page_span, "Chunk should have page_span"
             
             # Verify chunk text length is reasonable
             assert len(chunk_text) >= 50, \
                 f"Chunk text should have reasonable length, got {len(chunk_text)} chars"
         
         # Verify chunks are not all identical (they should vary)
-        chunk_texts = [chunk.text if hasattr(chunk, "text") else chunk.get("text", "") for chunk in chunks]
         unique_texts = set(chunk_texts)
         
         # If we have multiple chunks, at least some should be different
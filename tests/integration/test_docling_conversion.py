@@ -6,18 +6,11 @@ import pytest
 from pathlib import Path
 from typing import Any
 
-from src.infrastructure.adapters.docling_converter import DoclingConverterAdapter, TimeoutError
-from src.domain.policy.chunking_policy import ChunkingPolicy
+# Skip the whole module at collection time when Docling is not installed
+docling = pytest.importorskip("docling", reason="Docling not available (Windows compatibility - use WSL/Docker)")
 
-
-@pytest.fixture
-def docling_available():
-    """Skip tests if Docling is not available."""
-    try:
-        converter = DoclingConverterAdapter()
-        return converter
-    except ImportError:
-        pytest.skip("Docling not available (Windows compatibility - use WSL/Docker)")
+from src.infrastructure.adapters.docling_converter import DoclingConverterAdapter, TimeoutError  # noqa: E402
+from src.domain.models.chunk import Chunk  # noqa: E402
 
 
 @pytest.fixture
@@ -32,32 +25,47 @@ def sample_pdf_path(tmp_path: Path) -> Path | None:
     return None
 
 
+@pytest.fixture(scope="session")
+def hash_corpus(tmp_path_factory: pytest.TempPathFactory) -> list[Path]:
+    """Files with distinct contents for doc_id hashing tests (written once per session)."""
+    directory = tmp_path_factory.mktemp("hash")
+    contents = [b"fake pdf content", b"content 1", b"content 2"]
+    files = [directory / f"file{i}.pdf" for i in range(len(contents))]
+    for path, content in zip(files, contents):
+        path.write_bytes(content)
+    return files
+
+
+@pytest.mark.xdist_group("docling")
 class TestDoclingConversion:
     """Comprehensive tests for Docling document conversion."""
     
-    def test_converter_initialization(self, docling_available):
+    def test_converter_initialization(self, docling_converter):
         """Test that DoclingConverterAdapter initializes correctly."""
-        converter = docling_available
+        converter = docling_converter
         assert converter is not None
         assert hasattr(converter, 'converter')
-        assert converter.DOCUMENT_TIMEOUT_SECONDS == 120
-        assert converter.PAGE_TIMEOUT_SECONDS == 10
+        assert converter.DOCUMENT_TIMEOUT_SECONDS == DoclingConverterAdapter.DEFAULT_DOCUMENT_TIMEOUT_SECONDS
+        assert converter.PAGE_TIMEOUT_SECONDS == DoclingConverterAdapter.DEFAULT_PAGE_TIMEOUT_SECONDS
     
-    def test_ocr_language_selection_default(self, docling_available):
+    @pytest.mark.xdist_group("light")
+    def test_ocr_language_selection_default(self, docling_converter):
         """Test OCR language selection with default fallback."""
-        converter = docling_available
+        converter = docling_converter
         languages = converter._select_ocr_languages(None)
         assert languages == ['en', 'de']
     
-    def test_ocr_language_selection_explicit(self, docling_available):
+    @pytest.mark.xdist_group("light")
+    def test_ocr_language_selection_explicit(self, docling_converter):
         """Test OCR language selection with explicit languages."""
-        converter = docling_available
+        converter = docling_converter
         languages = converter._select_ocr_languages(['en', 'fr'])
         assert languages == ['en', 'fr']
     
-    def test_ocr_language_normalization(self, docling_available):
+    @pytest.mark.xdist_group("light")
+    def test_ocr_language_normalization(self, docling_converter):
         """Test OCR language code normalization (e.g., 'en-US' → 'en')."""
-        converter = docling_available
+        converter = docling_converter
         languages = converter._select_ocr_languages(['en-US', 'de-DE', 'fr-FR'])
         assert 'en' in languages
         assert 'de' in languages
@@ -65,42 +73,24 @@ class TestDoclingConversion:
         # Should not have duplicates
         assert len(languages) == 3
     
-    def test_doc_id_computation_stable(self, docling_available, tmp_path: Path):
-        """Test that doc_id computation is stable for same file."""
-        converter = docling_available
-        
-        # Create a test file
-        test_file = tmp_path / "test.pdf"
-        test_file.write_bytes(b"fake pdf content")
+    @pytest.mark.xdist_group("light")
+    def test_doc_id_computation(self, docling_converter, hash_corpus: list[Path]):
+        """Test that doc_id is stable for the same file and distinct across files."""
+        converter = docling_converter
         
-        doc_id1 = converter._compute_doc_id(str(test_file))
-        doc_id2 = converter._compute_doc_id(str(test_file))
+        doc_ids = [converter._compute_doc_id(str(path)) for path in hash_corpus]
         
-        assert doc_id1 == doc_id2, "doc_id should be deterministic for same file"
-        assert isinstance(doc_id1, str)
-        assert len(doc_id1) > 0
+        assert all(isinstance(doc_id, str) and doc_id for doc_id in doc_ids)
+        assert converter._compute_doc_id(str(hash_corpus[0])) == doc_ids[0], \
+            "doc_id should be deterministic for same file"
+        assert len(set(doc_ids)) == len(doc_ids), "Different files should have different doc_ids"
     
-    def test_doc_id_computation_different_files(self, docling_available, tmp_path: Path):
-        """Test that different files produce different doc_ids."""
-        converter = docling_available
-        
-        file1 = tmp_path / "file1.pdf"
-        file1.write_bytes(b"content 1")
-        
-        file2 = tmp_path / "file2.pdf"
-        file2.write_bytes(b"content 2")
-        
-        doc_id1 = converter._compute_doc_id(str(file1))
-        doc_id2 = converter._compute_doc_id(str(file2))
-        
-        assert doc_id1 != doc_id2, "Different files should have different doc_ids"
-    
-    def test_conversion_result_structure(self, docling_available, sample_pdf_path):
+    def test_conversion_result_structure(self, docling_converter, sample_pdf_path):
         """Test that conversion result has required structure."""
         if sample_pdf_path is None:
             pytest.skip("No sample PDF available - requires actual PDF file")
         
-        converter = docling_available
+        converter = docling_converter
         result = converter.convert(str(sample_pdf_path))
         
         # Required fields
@@ -116,12 +106,12 @@ class TestDoclingConversion:
         if "ocr_languages" in result:
             assert isinstance(result["ocr_languages"], list)
     
-    def test_page_map_structure(self, docling_available, sample_pdf_path):
+    def test_page_map_structure(self, docling_converter, sample_pdf_path):
         """Test that page_map has correct structure (page → text span)."""
         if sample_pdf_path is None:
             pytest.skip("No sample PDF available")
         
-        converter = docling_available
+        converter = docling_converter
         result = converter.convert(str(sample_pdf_path))
         
         page_map = result["structure"]["page_map"]
@@ -137,12 +127,12 @@ class TestDoclingConversion:
                 assert "start" in span or "start_offset" in span
                 assert "end" in span or "end_offset" in span
     
-    def test_heading_tree_structure(self, docling_available, sample_pdf_path):
+    def test_heading_tree_structure(self, docling_converter, sample_pdf_path):
         """Test that heading_tree has hierarchical structure with page anchors."""
         if sample_pdf_path is None:
             pytest.skip("No sample PDF available")
         
-        converter = docling_available
+        converter = docling_converter
         result = converter.convert(str(sample_pdf_path))
         
         heading_tree = result["structure"]["heading_tree"]
@@ -152,9 +142,9 @@ class TestDoclingConversion:
         if "root" in heading_tree:
             assert isinstance(heading_tree["root"], list)
     
-    def test_text_normalization(self, docling_available):
+    def test_text_normalization(self, docling_converter):
         """Test text normalization (hyphen repair, whitespace normalization)."""
-        converter = docling_available
+        converter = docling_converter
         
         # Test hyphen repair
         text_with_hyphens = "This is a test-\nof hyphen repair."
@@ -168,37 +158,34 @@ class TestDoclingConversion:
         # Multiple spaces should be normalized
         assert "    " not in normalized or len(normalized) < len(text_with_whitespace)
     
-    def test_image_only_page_detection(self, docling_available, sample_pdf_path):
+    def test_image_only_page_detection(self, docling_converter, sample_pdf_path):
         """Test that image-only pages are detected and logged."""
         if sample_pdf_path is None:
             pytest.skip("No sample PDF available")
         
-        converter = docling_available
+        converter = docling_converter
         result = converter.convert(str(sample_pdf_path))
         
         # Image-only pages should be detected if present
         # This is logged during conversion, so we verify the logging structure
         # In real documents, we'd check the log output or result metadata
     
-    def test_timeout_enforcement_document_level(self, docling_available):
-        """Test that document-level timeout is enforced (120s)."""
-        converter = docling_available
-        
-        # This would require a very large/complex document that takes >120s
-        # For now, we verify the timeout handler exists
-        assert hasattr(converter, '_timeout_handler')
-        assert converter.DOCUMENT_TIMEOUT_SECONDS == 120
+    @pytest.mark.xdist_group("light")
+    def test_timeout_enforcement_document_level(self, docling_class):
+        """Test that document-level timeout defaults to 600s (CPU-only processing)."""
+        # This would require a very large/complex document that takes >600s
+        # For now, we verify the class-level default (no converter needed)
+        assert docling_class.DEFAULT_DOCUMENT_TIMEOUT_SECONDS == 600
     
-    def test_timeout_enforcement_page_level(self, docling_available):
-        """Test that page-level timeout is enforced (10s per page)."""
-        converter = docling_available
-        
+    @pytest.mark.xdist_group("light")
+    def test_timeout_enforcement_page_level(self, docling_class):
+        """Test that page-level timeout defaults to 15s per page."""
         # Verify page timeout configuration
-        assert converter.PAGE_TIMEOUT_SECONDS == 10
+        assert docling_class.DEFAULT_PAGE_TIMEOUT_SECONDS == 15
     
-    def test_ocr_configuration_with_languages(self, docling_available):
+    def test_ocr_configuration_with_languages(self, docling_converter):
         """Test OCR configuration with specific languages."""
-        converter = docling_available
+        converter = docling_converter
         
         # Configure OCR with languages
         languages = ['en', 'de']
@@ -207,9 +194,9 @@ class TestDoclingConversion:
         # Verify OCR is configured (logs debug message)
         # In real scenario, this would affect OCR processing
     
-    def test_error_handling_invalid_file(self, docling_available, tmp_path: Path):
+    def test_error_handling_invalid_file(self, docling_converter, tmp_path: Path):
         """Test error handling for invalid/non-existent files."""
-        converter = docling_available
+        converter = docling_converter
         
         invalid_path = tmp_path / "nonexistent.pdf"
         
@@ -217,12 +204,12 @@ class TestDoclingConversion:
         with pytest.raises((FileNotFoundError, Exception)):
             converter.convert(str(invalid_path))
     
-    def test_conversion_with_ocr_languages_parameter(self, docling_available, sample_pdf_path):
+    def test_conversion_with_ocr_languages_parameter(self, docling_converter, sample_pdf_path):
         """Test conversion with explicit OCR languages parameter."""
         if sample_pdf_path is None:
             pytest.skip("No sample PDF available")
         
-        converter = docling_available
+        converter = docling_converter
         result = converter.convert(
             str(sample_pdf_path),
             ocr_languages=['en', 'fr']
@@ -233,7 +220,7 @@ class TestDoclingConversion:
             assert 'en' in result["ocr_languages"]
             assert 'fr' in result["ocr_languages"]
     
-    def test_conversion_logging(self, docling_available, sample_pdf_path, caplog):
+    def test_conversion_logging(self, docling_converter, sample_pdf_path, caplog):
         """Test that conversion produces appropriate logging."""
         if sample_pdf_path is None:
             pytest.skip("No sample PDF available")
@@ -241,7 +228,7 @@ class TestDoclingConversion:
         import logging
         caplog.set_level(logging.INFO)
         
-        converter = docling_available
+        converter = docling_converter
         result = converter.convert(str(sample_pdf_path))
         
         # Should log conversion start and completion
@@ -249,50 +236,29 @@ class TestDoclingConversion:
         # Verify relevant log entries exist (adjust based on actual logging)
 
 
-class TestDoclingConversionWindowsCompatibility:
-    """Tests for Windows compatibility handling."""
-    
-    def test_windows_compatibility_error_message(self):
-        """Test that Windows users get helpful error message."""
-        # If Docling is not available, should raise ImportError with helpful message
-        try:
-            converter = DoclingConverterAdapter()
-            # If we get here, Docling is available (skip test)
-            pytest.skip("Docling is available (not testing Windows compatibility)")
-        except ImportError as e:
-            error_msg = str(e)
-            assert "Windows" in error_msg or "WSL" in error_msg or "Docker" in error_msg
-            assert any(keyword in error_msg.lower() for keyword in ["windows", "wsl", "docker"])
-
-
 class TestDoclingConversionIntegration:
     """Integration tests combining conversion with chunking."""
     
-    def test_conversion_chunking_workflow(self, docling_available, sample_pdf_path):
+    def test_conversion_chunking_workflow(
+        self, convert_document, sample_pdf_path, default_chunking_policy
+    ):
         """Test complete workflow: conversion → chunking."""
         if sample_pdf_path is None:
             pytest.skip("No sample PDF available")
         
         from src.infrastructure.adapters.docling_chunker import DoclingHybridChunkerAdapter
         
-        converter = docling_available
         chunker = DoclingHybridChunkerAdapter()
         
-        # Convert
-        conversion_result = converter.convert(str(sample_pdf_path))
+        # Convert (cached on disk across runs)
+        conversion_result = convert_document(str(sample_pdf_path))
         
         # Chunk
-        policy = ChunkingPolicy(
-            max_tokens=450,
-            overlap_tokens=60,
-            heading_context=2,
-            tokenizer_id="minilm",
-        )
-        
-        chunks = chunker.chunk(conversion_result, policy)
+        chunks = chunker.chunk(conversion_result, default_chunking_policy)
         
         assert len(chunks) > 0
+        assert all(isinstance(chunk, Chunk) for chunk in chunks)
         # Verify chunks reference original conversion result
-        for chunk in chunks:
-            assert chunk.doc_id == conversion_result["doc_id"]
+        doc_id = conversion_result["doc_id"]
+        assert all(chunk.doc_id == doc_id for chunk in chunks)
 
@@ -0,0 +1,27 @@
+"""Integration tests for Docling Windows compatibility handling (T097)."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.infrastructure.adapters.docling_converter import DoclingConverterAdapter
+
+
+# Kept apart from test_docling_conversion.py: that module is skipped at collection
+# when Docling is missing, which is exactly the case these tests cover
+
+class TestDoclingConversionWindowsCompatibility:
+    """Tests for Windows compatibility handling."""
+    
+    def test_windows_compatibility_error_message(self):
+        """Test that Windows users get helpful error message."""
+        # If Docling is not available, should raise ImportError with helpful message
+        try:
+            DoclingConverterAdapter()
+            # If we get here, Docling is available (skip test)
+            pytest.skip("Docling is available (not testing Windows compatibility)")
+        except ImportError as e:
+            error_msg = str(e)
+            assert "Windows" in error_msg or "WSL" in error_msg or "Docker" in error_msg
+            assert any(keyword in error_msg.lower() for keyword in ["windows", "wsl", "docker"])
+
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import pytest
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import Mock, patch, AsyncMock
 
+from src.application.dto.query import QueryResult, QueryResultItem
 from src.infrastructure.config.settings import Settings, ProjectSettings
 from src.infrastructure.mcp.tools import (
     handle_tool_call,
@@ -18,48 +21,39 @@ from src.infrastructure.mcp.tools import (
     MCPToolError,
     MCPErrorCode,
     MAX_CHARS_PER_CHUNK,
+    _run_with_timeout,
 )
 
+from _mcp_helpers import EMPTY_SETTINGS, error_code
+
+# Chunk text longer than the MCP trimming limit, built once for the trimming tests
+_OVERLONG_TEXT = "x" * (MAX_CHARS_PER_CHUNK + 500)
+
 
 @pytest.fixture
-def test_settings(tmp_path: Path) -> Settings:
-    """Create test settings with sample projects."""
-    config_file = tmp_path / "citeloom.toml"
-    config_content = """[project."test/project"]
-collection = "proj-test-project"
-references_json = "test.json"
-embedding_model = "fastembed/all-MiniLM-L6-v2"
-sparse_model = "Qdrant/bm25"
-hybrid_enabled = true
+def mock_query_chunks() -> Iterator[Mock]:
+    """Patch query_chunks for one test; returns no items unless a test sets return_value."""
+    with patch('src.infrastructure.mcp.tools.query_chunks') as mock_query:
+        mock_query.return_value = QueryResult(items=[])
+        yield mock_query
 
-[project."test/project-no-hybrid"]
-collection = "proj-test-project-no-hybrid"
-references_json = "test.json"
-embedding_model = "fastembed/all-MiniLM-L6-v2"
-hybrid_enabled = false
 
-[qdrant]
-url = "http://localhost:6333"
-create_fulltext_index = true
-"""
-    config_file.write_text(config_content)
-    
-    return Settings.from_toml(config_file)
+@pytest.fixture(scope="module")
+def dummy_pdf(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Placeholder source file for ingest tests (never read; ingest_document is mocked)."""
+    path = tmp_path_factory.mktemp("pdfs") / "test.pdf"
+    path.write_bytes(b"dummy pdf content")
+    return path
 
 
 class TestFastMCPToolsIngest:
     """Comprehensive tests for ingest_from_source tool."""
     
-    @pytest.mark.asyncio
-    async def test_ingest_from_source_valid_project(self, test_settings: Settings, tmp_path: Path):
+    async def test_ingest_from_source_valid_project(self, test_settings: Settings, dummy_pdf: Path):
         """Test ingest_from_source with valid project and source file."""
-        # Create a dummy source file
-        source_file = tmp_path / "test.pdf"
-        source_file.write_bytes(b"dummy pdf content")
-        
         arguments = {
             "project": "test/project",
-            "source": str(source_file),
+            "source": str(dummy_pdf),
         }
         
         # Mock the ingestion use case
@@ -80,44 +74,11 @@ class TestFastMCPToolsIngest:
             assert "dense_model" in result_data
             assert "correlation_id" in result_data
     
-    @pytest.mark.asyncio
-    async def test_ingest_from_source_invalid_project(self, test_settings: Settings):
-        """Test ingest_from_source with invalid project."""
-        arguments = {
-            "project": "nonexistent/project",
-            "source": "/path/to/doc.pdf",
-        }
-        
-        result = await handle_tool_call("ingest_from_source", arguments, test_settings)
-        result_data = json.loads(result)
-        
-        assert "error" in result_data
-        assert result_data["error"]["code"] == MCPErrorCode.INVALID_PROJECT
-    
-    @pytest.mark.asyncio
-    async def test_ingest_from_source_timeout_enforcement(self, test_settings: Settings, tmp_path: Path):
-        """Test that ingest_from_source enforces 15s timeout."""
-        source_file = tmp_path / "test.pdf"
-        source_file.write_bytes(b"dummy content")
-        
-        arguments = {
-            "project": "test/project",
-            "source": str(source_file),
-        }
-        
-        # Test timeout handling (would need to mock slow operation)
-        # For now, verify timeout is configured
-        assert True  # Placeholder - actual timeout test would require time-consuming operation
-    
-    @pytest.mark.asyncio
-    async def test_ingest_from_source_correlation_id(self, test_settings: Settings, tmp_path: Path):
+    async def test_ingest_from_source_correlation_id(self, test_settings: Settings, dummy_pdf: Path):
         """Test that ingest_from_source includes correlation ID in response."""
-        source_file = tmp_path / "test.pdf"
-        source_file.write_bytes(b"dummy content")
-        
         arguments = {
             "project": "test/project",
-            "source": str(source_file),
+            "source": str(dummy_pdf),
         }
         
         with patch('src.infrastructure.mcp.tools.ingest_document'):
@@ -128,33 +89,26 @@ class TestFastMCPToolsIngest:
             assert isinstance(result_data["correlation_id"], str)
             assert len(result_data["correlation_id"]) > 0
     
-    @pytest.mark.asyncio
-    async def test_ingest_from_source_embedding_mismatch(self, test_settings: Settings, tmp_path: Path):
+    async def test_ingest_from_source_embedding_mismatch(self, test_settings: Settings, dummy_pdf: Path):
         """Test that ingest_from_source handles embedding model mismatch."""
         from src.domain.errors import EmbeddingModelMismatch
         
-        source_file = tmp_path / "test.pdf"
-        source_file.write_bytes(b"dummy content")
-        
         arguments = {
             "project": "test/project",
-            "source": str(source_file),
+            "source": str(dummy_pdf),
         }
         
         with patch('src.infrastructure.mcp.tools.ingest_document') as mock_ingest:
             mock_ingest.side_effect = EmbeddingModelMismatch("Model mismatch error")
             
             result = await handle_tool_call("ingest_from_source", arguments, test_settings)
-            result_data = json.loads(result)
-            
-            assert "error" in result_data
-            assert result_data["error"]["code"] == MCPErrorCode.EMBEDDING_MISMATCH
+            assert error_code(result) == MCPErrorCode.EMBEDDING_MISMATCH
 
 
+@pytest.mark.usefixtures("mock_query_chunks")
 class TestFastMCPToolsQuery:
     """Comprehensive tests for query tool (dense-only search)."""
     
-    @pytest.mark.asyncio
     async def test_query_valid_project(self, test_settings: Settings):
         """Test query tool with valid project."""
         arguments = {
@@ -163,84 +117,34 @@ class TestFastMCPToolsQuery:
             "top_k": 5,
         }
         
-        with patch('src.infrastructure.mcp.tools.query_chunks') as mock_query:
-            mock_result = Mock()
-            mock_result.items = []
-            mock_query.return_value = mock_result
-            
-            result = await handle_tool_call("query", arguments, test_settings)
-            result_data = json.loads(result)
-            
-            assert "items" in result_data
-            assert "correlation_id" in result_data
-    
-    @pytest.mark.asyncio
-    async def test_query_invalid_project(self, test_settings: Settings):
-        """Test query tool with invalid project."""
-        arguments = {
-            "project": "nonexistent/project",
-            "query": "test query",
-        }
-        
         result = await handle_tool_call("query", arguments, test_settings)
         result_data = json.loads(result)
         
-        assert "error" in result_data
-        assert result_data["error"]["code"] == MCPErrorCode.INVALID_PROJECT
-    
-    @pytest.mark.asyncio
-    async def test_query_timeout_enforcement(self, test_settings: Settings):
-        """Test that query tool enforces 8s timeout."""
-        arguments = {
-            "project": "test/project",
-            "query": "test query",
-        }
-        
-        # Verify timeout is configured (8s for dense-only search)
-        assert True  # Placeholder - actual timeout test would require slow operation
+        assert "items" in result_data
+        assert "correlation_id" in result_data
     
-    @pytest.mark.asyncio
-    async def test_query_text_trimming(self, test_settings: Settings):
+    async def test_query_text_trimming(self, test_settings: Settings, mock_query_chunks: Mock):
         """Test that query results have text trimmed to MAX_CHARS_PER_CHUNK."""
-        long_text = "a" * (MAX_CHARS_PER_CHUNK + 100)
-        
         arguments = {
             "project": "test/project",
-            "query": "test query",
+            "text": "test query",
         }
         
-        with patch('src.infrastructure.mcp.tools.query_chunks') as mock_query:
-            mock_result = Mock()
-            mock_item = Mock()
-            mock_item.chunk_text = long_text
-            mock_result.items = [mock_item]
-            mock_query.return_value = mock_result
-            
-            result = await handle_tool_call("query", arguments, test_settings)
-            result_data = json.loads(result)
-            
-            if result_data.get("items"):
-                first_item = result_data["items"][0]
-                if "text" in first_item:
-                    assert len(first_item["text"]) <= MAX_CHARS_PER_CHUNK
-    
-    @pytest.mark.asyncio
-    async def test_query_project_filtering(self, test_settings: Settings):
-        """Test that query enforces server-side project filtering."""
-        arguments = {
-            "project": "test/project",
-            "query": "test query",
-        }
+        mock_query_chunks.return_value = QueryResult(items=[QueryResultItem(text=_OVERLONG_TEXT, score=1.0)])
+        
+        result = await handle_tool_call("query", arguments, test_settings)
+        result_data = json.loads(result)
         
-        # Verify project filtering is applied server-side
-        # (Would verify in real Qdrant scenario)
-        assert True
+        assert len(result_data["items"]) == 1
+        render_text = result_data["items"][0]["render_text"]
+        assert len(render_text) <= MAX_CHARS_PER_CHUNK
+        assert render_text.endswith("...")
 
 
+@pytest.mark.usefixtures("mock_query_chunks")
 class TestFastMCPToolsQueryHybrid:
     """Comprehensive tests for query_hybrid tool."""
     
-    @pytest.mark.asyncio
     async def test_query_hybrid_valid_project(self, test_settings: Settings):
         """Test query_hybrid with valid project and hybrid enabled."""
         arguments = {
@@ -249,61 +153,26 @@ class TestFastMCPToolsQueryHybrid:
             "top_k": 5,
         }
         
-        with patch('src.infrastructure.mcp.tools.query_chunks') as mock_query:
-            mock_result = Mock()
-            mock_result.items = []
-            mock_query.return_value = mock_result
-            
-            result = await handle_tool_call("query_hybrid", arguments, test_settings)
-            result_data = json.loads(result)
-            
-            assert "items" in result_data
-            assert "correlation_id" in result_data
-    
-    @pytest.mark.asyncio
-    async def test_query_hybrid_not_supported(self, test_settings: Settings):
-        """Test query_hybrid when hybrid is not enabled for project."""
-        arguments = {
-            "project": "test/project-no-hybrid",
-            "query": "test query",
-        }
-        
         result = await handle_tool_call("query_hybrid", arguments, test_settings)
         result_data = json.loads(result)
         
-        assert "error" in result_data
-        assert result_data["error"]["code"] == MCPErrorCode.HYBRID_NOT_SUPPORTED
+        assert "items" in result_data
+        assert "correlation_id" in result_data
     
-    @pytest.mark.asyncio
-    async def test_query_hybrid_invalid_project(self, test_settings: Settings):
-        """Test query_hybrid with invalid project."""
+    async def test_query_hybrid_not_supported(self, test_settings: Settings):
+        """Test query_hybrid when hybrid is not enabled for project."""
         arguments = {
-            "project": "nonexistent/project",
+            "project": "test/project-no-hybrid",
             "query": "test query",
         }
         
         result = await handle_tool_call("query_hybrid", arguments, test_settings)
-        result_data = json.loads(result)
-        
-        assert "error" in result_data
-        assert result_data["error"]["code"] == MCPErrorCode.INVALID_PROJECT
-    
-    @pytest.mark.asyncio
-    async def test_query_hybrid_timeout_enforcement(self, test_settings: Settings):
-        """Test that query_hybrid enforces 15s timeout."""
-        arguments = {
-            "project": "test/project",
-            "query": "test query",
-        }
-        
-        # Verify timeout is configured (15s for hybrid search)
-        assert True
+        assert error_code(result) == MCPErrorCode.HYBRID_NOT_SUPPORTED
 
 
 class TestFastMCPToolsInspect:
     """Comprehensive tests for inspect_collection tool."""
     
-    @pytest.mark.asyncio
     async def test_inspect_collection_valid_project(self, test_settings: Settings):
         """Test inspect_collection with valid project."""
         arguments = {
@@ -315,51 +184,11 @@ class TestFastMCPToolsInspect:
         
         assert "collection" in result_data
         assert "correlation_id" in result_data
-    
-    @pytest.mark.asyncio
-    async def test_inspect_collection_invalid_project(self, test_settings: Settings):
-        """Test inspect_collection with invalid project."""
-        arguments = {
-            "project": "nonexistent/project",
-        }
-        
-        result = await handle_tool_call("inspect_collection", arguments, test_settings)
-        result_data = json.loads(result)
-        
-        assert "error" in result_data
-        assert result_data["error"]["code"] == MCPErrorCode.INVALID_PROJECT
-    
-    @pytest.mark.asyncio
-    async def test_inspect_collection_shows_model_bindings(self, test_settings: Settings):
-        """Test that inspect_collection shows dense and sparse model bindings."""
-        arguments = {
-            "project": "test/project",
-        }
-        
-        result = await handle_tool_call("inspect_collection", arguments, test_settings)
-        result_data = json.loads(result)
-        
-        if "collection" in result_data:
-            collection_info = result_data["collection"]
-            # Should show model bindings if available
-            # (Would verify in real Qdrant scenario)
-            assert True
-    
-    @pytest.mark.asyncio
-    async def test_inspect_collection_timeout_enforcement(self, test_settings: Settings):
-        """Test that inspect_collection enforces 5s timeout."""
-        arguments = {
-            "project": "test/project",
-        }
-        
-        # Verify timeout is configured (5s for inspection)
-        assert True
 
 
 class TestFastMCPToolsListProjects:
     """Comprehensive tests for list_projects tool."""
     
-    @pytest.mark.asyncio
     async def test_list_projects_basic(self, test_settings: Settings):
         """Test list_projects tool basic functionality."""
         result = await handle_tool_call("list_projects", {}, test_settings)
@@ -370,7 +199,6 @@ class TestFastMCPToolsListProjects:
         assert "count" in result_data
         assert "correlation_id" in result_data
     
-    @pytest.mark.asyncio
     async def test_list_projects_shows_model_ids(self, test_settings: Settings):
         """Test that list_projects shows dense_model and sparse_model IDs."""
         result = await handle_tool_call("list_projects", {}, test_settings)
@@ -382,7 +210,6 @@ class TestFastMCPToolsListProjects:
             # sparse_model may be None if hybrid not enabled
             assert "sparse_model" in project or "hybrid_enabled" in project
     
-    @pytest.mark.asyncio
     async def test_list_projects_no_timeout(self, test_settings: Settings):
         """Test that list_projects has no timeout (fast enumeration)."""
         # list_projects should be fast and have no timeout
@@ -391,11 +218,9 @@ class TestFastMCPToolsListProjects:
         
         assert "projects" in result_data
     
-    @pytest.mark.asyncio
     async def test_list_projects_empty_settings(self):
         """Test list_projects with empty settings."""
-        empty_settings = Settings()
-        result = await handle_tool_call("list_projects", {}, empty_settings)
+        result = await handle_tool_call("list_projects", {}, EMPTY_SETTINGS)
         result_data = json.loads(result)
         
         assert result_data["projects"] == []
@@ -405,41 +230,39 @@ class TestFastMCPToolsListProjects:
 class TestFastMCPToolsErrorHandling:
     """Comprehensive tests for error handling and error taxonomy."""
     
-    @pytest.mark.asyncio
-    async def test_error_taxonomy_invalid_project(self, test_settings: Settings):
-        """Test that INVALID_PROJECT error code is returned."""
-        arguments = {
-            "project": "nonexistent/project",
-            "query": "test query",
-        }
-        
-        result = await handle_tool_call("query", arguments, test_settings)
-        result_data = json.loads(result)
-        
-        assert result_data["error"]["code"] == MCPErrorCode.INVALID_PROJECT
-    
-    @pytest.mark.asyncio
-    async def test_error_taxonomy_embedding_mismatch(self, test_settings: Settings, tmp_path: Path):
+    @pytest.mark.parametrize(
+        ("tool_name", "arguments"),
+        [
+            ("ingest_from_source", {"source": "/path/to/doc.pdf"}),
+            ("query", {"text": "test query"}),
+            ("query_hybrid", {"text": "test query"}),
+            ("inspect_collection", {}),
+        ],
+    )
+    async def test_error_taxonomy_invalid_project(
+        self, test_settings: Settings, tool_name: str, arguments: dict
+    ):
+        """Test that every project-scoped tool returns INVALID_PROJECT for an unknown project."""
+        arguments = {"project": "nonexistent/project", **arguments}
+        
+        result = await handle_tool_call(tool_name, arguments, test_settings)
+        assert error_code(result) == MCPErrorCode.INVALID_PROJECT
+    
+    async def test_error_taxonomy_embedding_mismatch(self, test_settings: Settings, dummy_pdf: Path):
         """Test that EMBEDDING_MISMATCH error code is returned."""
         from src.domain.errors import EmbeddingModelMismatch
         
-        source_file = tmp_path / "test.pdf"
-        source_file.write_bytes(b"dummy content")
-        
         arguments = {
             "project": "test/project",
-            "source": str(source_file),
+            "source": str(dummy_pdf),
         }
         
         with patch('src.infrastructure.mcp.tools.ingest_document') as mock_ingest:
             mock_ingest.side_effect = EmbeddingModelMismatch("Model mismatch")
             
             result = await handle_tool_call("ingest_from_source", arguments, test_settings)
-            result_data = json.loads(result)
-            
-            assert result_data["error"]["code"] == MCPErrorCode.EMBEDDING_MISMATCH
+            assert error_code(result) == MCPErrorCode.EMBEDDING_MISMATCH
     
-    @pytest.mark.asyncio
     async def test_error_taxonomy_hybrid_not_supported(self, test_settings: Settings):
         """Test that HYBRID_NOT_SUPPORTED error code is returned."""
         arguments = {
@@ -448,23 +271,20 @@ class TestFastMCPToolsErrorHandling:
         }
         
         result = await handle_tool_call("query_hybrid", arguments, test_settings)
-        result_data = json.loads(result)
-        
-        assert result_data["error"]["code"] == MCPErrorCode.HYBRID_NOT_SUPPORTED
-    
-    @pytest.mark.asyncio
-    async def test_error_taxonomy_index_unavailable(self, test_settings: Settings):
-        """Test that INDEX_UNAVAILABLE error code is returned when appropriate."""
-        # Would require mocking Qdrant connection failure
-        assert True  # Placeholder
+        assert error_code(result) == MCPErrorCode.HYBRID_NOT_SUPPORTED
     
-    @pytest.mark.asyncio
-    async def test_error_taxonomy_timeout(self, test_settings: Settings):
+    async def test_error_taxonomy_timeout(self):
         """Test that TIMEOUT error code is returned when operation exceeds timeout."""
-        # Would require mocking timeout scenario
-        assert True  # Placeholder
+        # Every timed tool goes through _run_with_timeout; a never-set event stands
+        # in for a stalled operation, with a budget far below the real 5-15s
+        stalled = asyncio.Event()
+        
+        with pytest.raises(MCPToolError) as exc_info:
+            await _run_with_timeout(stalled.wait(), timeout_seconds=0.01, operation_name="query")
+        
+        assert exc_info.value.code == MCPErrorCode.TIMEOUT
+        assert exc_info.value.details == {"timeout_seconds": 0.01, "operation": "query"}
     
-    @pytest.mark.asyncio
     async def test_error_response_format(self, test_settings: Settings):
         """Test that error responses follow standardized format."""
         arguments = {
@@ -483,77 +303,67 @@ class TestFastMCPToolsErrorHandling:
         assert isinstance(result_data["error"]["message"], str)
 
 
+@pytest.mark.usefixtures("mock_query_chunks")
 class TestFastMCPToolsCorrelationIDs:
     """Tests for correlation ID handling."""
     
-    @pytest.mark.asyncio
-    async def test_all_tools_include_correlation_id(self, test_settings: Settings):
-        """Test that all tools include correlation_id in responses."""
-        tools_and_args = [
+    @pytest.mark.parametrize(
+        ("tool_name", "arguments"),
+        [
             ("list_projects", {}),
             ("query", {"project": "test/project", "query": "test"}),
             ("inspect_collection", {"project": "test/project"}),
-        ]
-        
-        for tool_name, args in tools_and_args:
-            # Skip tools that require mocking complex dependencies
-            if tool_name == "query":
-                with patch('src.infrastructure.mcp.tools.query_chunks'):
-                    result = await handle_tool_call(tool_name, args, test_settings)
-                    result_data = json.loads(result)
-                    assert "correlation_id" in result_data or "error" in result_data
-            else:
-                result = await handle_tool_call(tool_name, args, test_settings)
-                result_data = json.loads(result)
-                assert "correlation_id" in result_data or "error" in result_data
+        ],
+    )
+    async def test_all_tools_include_correlation_id(
+        self, test_settings: Settings, tool_name: str, arguments: dict
+    ):
+        """Test that all tools include correlation_id in responses."""
+        result = await handle_tool_call(tool_name, arguments, test_settings)
+        result_data = json.loads(result)
+        assert "correlation_id" in result_data or "error" in result_data
 
 
+@pytest.mark.usefixtures("mock_query_chunks")
 class TestFastMCPToolsBoundedOutputs:
     """Tests for bounded output requirements (text trimming, top_k limits)."""
     
-    @pytest.mark.asyncio
-    async def test_query_results_trimmed_to_max_chars(self, test_settings: Settings):
+    async def test_query_results_trimmed_to_max_chars(self, test_settings: Settings, mock_query_chunks: Mock):
         """Test that query results have chunk text trimmed to MAX_CHARS_PER_CHUNK."""
-        long_text = "x" * (MAX_CHARS_PER_CHUNK + 500)
-        
         arguments = {
             "project": "test/project",
-            "query": "test query",
+            "text": "test query",
         }
         
-        with patch('src.infrastructure.mcp.tools.query_chunks') as mock_query:
-            mock_result = Mock()
-            mock_item = Mock()
-            mock_item.chunk_text = long_text
-            mock_result.items = [mock_item]
-            mock_query.return_value = mock_result
-            
-            result = await handle_tool_call("query", arguments, test_settings)
-            result_data = json.loads(result)
-            
-            if result_data.get("items"):
-                for item in result_data["items"]:
-                    if "text" in item:
-                        assert len(item["text"]) <= MAX_CHARS_PER_CHUNK
+        mock_query_chunks.return_value = QueryResult(
+            items=[QueryResultItem(text=_OVERLONG_TEXT, score=1.0), QueryResultItem(text="short", score=0.5)]
+        )
+        
+        result = await handle_tool_call("query", arguments, test_settings)
+        result_data = json.loads(result)
+        
+        assert result_data["count"] == len(result_data["items"]) == 2
+        for item in result_data["items"]:
+            assert len(item["render_text"]) <= MAX_CHARS_PER_CHUNK
+        assert result_data["items"][1]["render_text"] == "short"
     
-    @pytest.mark.asyncio
-    async def test_query_top_k_default_limit(self, test_settings: Settings):
+    async def test_query_top_k_default_limit(self, test_settings: Settings, mock_query_chunks: Mock):
         """Test that query respects top_k default limit (6)."""
         arguments = {
             "project": "test/project",
-            "query": "test query",
+            "text": "test query",
             # top_k not specified - should default to 6
         }
         
-        with patch('src.infrastructure.mcp.tools.query_chunks') as mock_query:
-            mock_result = Mock()
-            mock_result.items = [Mock()] * 10  # More than default
-            mock_query.return_value = mock_result
-            
-            result = await handle_tool_call("query", arguments, test_settings)
-            result_data = json.loads(result)
-            
-            if result_data.get("items"):
-                # Should be limited to top_k (default 6 or specified)
-                assert len(result_data["items"]) <= 10  # Would verify actual limit
+        # More candidates than the default; query_chunks returns at most request.top_k
+        candidates = [QueryResultItem(text="", score=0.0)] * 10
+        mock_query_chunks.side_effect = lambda request, embedder, index: QueryResult(
+            items=candidates[:request.top_k]
+        )
+        
+        result = await handle_tool_call("query", arguments, test_settings)
+        result_data = json.loads(result)
+        
+        assert mock_query_chunks.call_args.args[0].top_k == 6
+        assert result_data["count"] == len(result_data["items"]) == 6
 
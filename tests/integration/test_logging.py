@@ -1,10 +1,12 @@
 from typer.testing import CliRunner
 
-from infrastructure.cli.main import app
+from src.infrastructure.cli.main import app
+
+# Stateless between invocations, so one runner serves every CLI test here
+runner = CliRunner()
 
 
 def test_ingest_prints_correlation_id():
-    runner = CliRunner()
     result = runner.invoke(app, [
         "ingest",
         "run",
@@ -15,4 +17,4 @@ def test_ingest_prints_correlation_id():
         "assets/raw/clean-arch.pdf",
     ])
     assert result.exit_code == 0
-    assert "correlation_id=" in result.stdout
+    assert b"correlation_id=" in result.stdout_bytes
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
+import copy
 import json
 import pytest
-from pathlib import Path
 
 from src.infrastructure.config.settings import Settings
 from src.infrastructure.mcp.tools import (
@@ -13,28 +13,9 @@ from src.infrastructure.mcp.tools import (
     MCPErrorCode,
 )
 
-
-@pytest.fixture
-def test_settings(tmp_path: Path) -> Settings:
-    """Create test settings with a sample project."""
-    # Create a temporary citeloom.toml
-    config_file = tmp_path / "citeloom.toml"
-    config_content = """[project."test/project"]
-collection = "proj-test-project"
-references_json = "test.json"
-embedding_model = "fastembed/all-MiniLM-L6-v2"
-hybrid_enabled = true
-
-[qdrant]
-url = "http://localhost:6333"
-create_fulltext_index = true
-"""
-    config_file.write_text(config_content)
-    
-    return Settings.from_toml(config_file)
+from _mcp_helpers import EMPTY_SETTINGS, error_code
 
 
-@pytest.mark.asyncio
 async def test_list_projects(test_settings: Settings) -> None:
     """Test list_projects tool."""
     result = await handle_tool_call("list_projects", {}, test_settings)
@@ -51,84 +32,47 @@ async def test_list_projects(test_settings: Settings) -> None:
     assert "hybrid_enabled" in project
 
 
-@pytest.mark.asyncio
 async def test_list_projects_empty() -> None:
     """Test list_projects with empty settings."""
-    empty_settings = Settings()
-    result = await handle_tool_call("list_projects", {}, empty_settings)
+    result = await handle_tool_call("list_projects", {}, EMPTY_SETTINGS)
     result_data = json.loads(result)
     
     assert "projects" in result_data
     assert result_data["projects"] == []
 
 
-@pytest.mark.asyncio
-async def test_find_chunks_invalid_project(test_settings: Settings) -> None:
-    """Test find_chunks with invalid project."""
-    arguments = {
-        "project": "nonexistent/project",
-        "query": "test query",
-    }
-    
-    result = await handle_tool_call("find_chunks", arguments, test_settings)
-    result_data = json.loads(result)
-    
-    # Should return error response
-    assert "error" in result_data
-    assert result_data["error"]["code"] == MCPErrorCode.INVALID_PROJECT
-
-
-@pytest.mark.asyncio
-async def test_query_hybrid_invalid_project(test_settings: Settings) -> None:
-    """Test query_hybrid with invalid project."""
-    arguments = {
-        "project": "nonexistent/project",
-        "query": "test query",
-    }
-    
-    result = await handle_tool_call("query_hybrid", arguments, test_settings)
-    result_data = json.loads(result)
+@pytest.mark.parametrize(
+    ("tool_name", "arguments"),
+    [
+        ("ingest_from_source", {"source": "/path/to/doc.pdf"}),
+        ("query", {"text": "test query"}),
+        ("query_hybrid", {"text": "test query"}),
+        ("inspect_collection", {}),
+    ],
+)
+async def test_invalid_project(test_settings: Settings, tool_name: str, arguments: dict) -> None:
+    """Test project-scoped tools with invalid project."""
+    arguments = {"project": "nonexistent/project", **arguments}
     
-    # Should return error response
-    assert "error" in result_data
-    assert result_data["error"]["code"] == MCPErrorCode.INVALID_PROJECT
+    result = await handle_tool_call(tool_name, arguments, test_settings)
+    assert error_code(result) == MCPErrorCode.INVALID_PROJECT
 
 
-@pytest.mark.asyncio
 async def test_query_hybrid_not_supported(test_settings: Settings) -> None:
     """Test query_hybrid when hybrid is not enabled for project."""
-    # Modify test project to disable hybrid
-    test_settings.projects["test/project"].hybrid_enabled = False
+    # Disable hybrid on a copy; test_settings is shared across the session
+    settings = copy.deepcopy(test_settings)
+    settings.projects["test/project"].hybrid_enabled = False
     
     arguments = {
         "project": "test/project",
         "query": "test query",
     }
     
-    result = await handle_tool_call("query_hybrid", arguments, test_settings)
-    result_data = json.loads(result)
-    
-    # Should return error response
-    assert "error" in result_data
-    assert result_data["error"]["code"] == MCPErrorCode.HYBRID_NOT_SUPPORTED
-
-
-@pytest.mark.asyncio
-async def test_inspect_collection_invalid_project(test_settings: Settings) -> None:
-    """Test inspect_collection with invalid project."""
-    arguments = {
-        "project": "nonexistent/project",
-    }
-    
-    result = await handle_tool_call("inspect_collection", arguments, test_settings)
-    result_data = json.loads(result)
-    
-    # Should return error response
-    assert "error" in result_data
-    assert result_data["error"]["code"] == MCPErrorCode.INVALID_PROJECT
+    result = await handle_tool_call("query_hybrid", arguments, settings)
+    assert error_code(result) == MCPErrorCode.HYBRID_NOT_SUPPORTED
 
 
-@pytest.mark.asyncio
 async def test_store_chunks_invalid_batch_size(test_settings: Settings) -> None:
     """Test store_chunks with invalid batch size."""
     arguments = {
@@ -137,36 +81,22 @@ async def test_store_chunks_invalid_batch_size(test_settings: Settings) -> None:
     }
     
     result = await handle_tool_call("store_chunks", arguments, test_settings)
-    result_data = json.loads(result)
-    
-    # Should return error response
-    assert "error" in result_data
-    assert result_data["error"]["code"] == "INVALID_INPUT"
-
-
-@pytest.mark.asyncio
-async def test_store_chunks_invalid_project(test_settings: Settings) -> None:
-    """Test store_chunks with invalid project."""
-    arguments = {
-        "project": "nonexistent/project",
-        "items": [{"id": "chunk-1", "text": "test", "embedding": [0.1] * 384, "metadata": {}}] * 100,
-    }
-    
-    result = await handle_tool_call("store_chunks", arguments, test_settings)
-    result_data = json.loads(result)
-    
-    # Should return error response
-    assert "error" in result_data
-    assert result_data["error"]["code"] == MCPErrorCode.INVALID_PROJECT
+    assert error_code(result) == "INVALID_INPUT"
 
 
-@pytest.mark.asyncio
 async def test_unknown_tool(test_settings: Settings) -> None:
     """Test unknown tool name."""
     result = await handle_tool_call("unknown_tool", {}, test_settings)
-    result_data = json.loads(result)
-    
-    # Should return error response
-    assert "error" in result_data
-    assert result_data["error"]["code"] == "UNKNOWN_TOOL"
+    assert error_code(result) == "UNKNOWN_TOOL"
+
 
+async def test_responses_compact_by_default(test_settings: Settings) -> None:
+    """Test responses are compact JSON unless pretty printing is enabled."""
+    result = await handle_tool_call("unknown_tool", {}, test_settings)
+    assert "\n" not in result
+    
+    settings = copy.deepcopy(test_settings)
+    settings.mcp.pretty_print_responses = True
+    result = await handle_tool_call("unknown_tool", {}, settings)
+    assert "\n" in result
+    assert error_code(result) == "UNKNOWN_TOOL"
@@ -2,23 +2,54 @@
 
 from __future__ import annotations
 
+import asyncio
+import uuid
+
+import numpy as np
 import pytest
 from typing import Any
+from unittest.mock import Mock, patch
+
+from qdrant_client.models import (
+    Fusion,
+    FusionQuery,
+    PayloadSchemaType,
+    ScalarType,
+    TokenizerType,
+)
 
-from src.infrastructure.adapters.qdrant_index import QdrantIndexAdapter
+from src.infrastructure.adapters import qdrant_index
+from src.infrastructure.adapters.qdrant_index import QdrantIndexAdapter, _ensured_collections
 from src.domain.errors import EmbeddingModelMismatch, ProjectNotFound
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def qdrant_adapter():
-    """Create a Qdrant adapter instance."""
+    """
+    One Qdrant adapter (and client connection) shared by every test in the session.
+    
+    Tests that swap the client or flip adapter flags go through mock_client_adapter,
+    which patches via monkeypatch so the shared instance is restored afterwards.
+    """
     return QdrantIndexAdapter()
 
 
 @pytest.fixture
 def test_project_id() -> str:
-    """Test project ID."""
-    return "citeloom/test-named-vectors"
+    """Test project ID, unique per test so tests sharing the adapter never collide."""
+    return f"citeloom/test-named-vectors-{uuid.uuid4().hex[:8]}"
+
+
+@pytest.fixture
+def mock_client_adapter(qdrant_adapter, monkeypatch):
+    """Shared adapter backed by a mock client, with empty local and ensured-collection state."""
+    _ensured_collections.clear()
+    client = Mock()
+    client.collection_exists.return_value = False
+    monkeypatch.setattr(qdrant_adapter, "_client", client)
+    monkeypatch.setattr(qdrant_adapter, "_local", {})
+    yield qdrant_adapter
+    _ensured_collections.clear()
 
 
 class TestQdrantNamedVectors:
@@ -165,6 +196,27 @@ class TestQdrantNamedVectors:
         # Hybrid query should work when both models are bound
         # (Actual test would perform hybrid_query and verify results)
     
+    def test_hybrid_query_fuses_server_side_in_one_call(self, mock_client_adapter, test_project_id):
+        """Test that hybrid queries issue one query_points() call with prefetch + RRF."""
+        qdrant_adapter = mock_client_adapter
+        qdrant_adapter._client.query_points.return_value.points = []
+        
+        qdrant_adapter.hybrid_query(
+            query_text="dependency inversion",
+            query_vector=[0.1] * 384,
+            project_id=test_project_id,
+            top_k=5,
+        )
+        
+        qdrant_adapter._client.query_points.assert_called_once()
+        qdrant_adapter._client.search.assert_not_called()
+        kwargs = qdrant_adapter._client.query_points.call_args.kwargs
+        assert kwargs["query"] == FusionQuery(fusion=Fusion.RRF)
+        assert kwargs["limit"] == 5
+        dense, lexical = kwargs["prefetch"]
+        assert dense.using == lexical.using == "dense"
+        assert lexical.filter.must[-1].key == "chunk_text"
+    
     def test_per_project_collection_naming(self, qdrant_adapter):
         """Test that collections are named per-project (proj-{project_id})."""
         project_id1 = "project/a"
@@ -177,24 +229,35 @@ class TestQdrantNamedVectors:
         assert collection2 == "proj-project-b"
         assert collection1 != collection2
     
-    def test_payload_indexes_creation(self, qdrant_adapter, test_project_id):
+    def test_payload_indexes_creation(self, mock_client_adapter, test_project_id):
         """Test that payload indexes are created for filtering."""
         collection_name = f"proj-{test_project_id.replace('/', '-')}"
+        # Local/in-memory Qdrant ignores payload indexes, so record the calls instead
+        mock_client_adapter._create_payload_indexes(collection_name)
+        
+        schemas = {
+            c.kwargs["field_name"]: c.kwargs["field_schema"]
+            for c in mock_client_adapter._client.create_payload_index.call_args_list
+        }
+        for field_name in ("doc_id", "citekey", "tags"):
+            assert schemas[field_name] == PayloadSchemaType.KEYWORD
+        # project_id is a tenant index, so per-project points are stored together
+        assert schemas["project_id"].type == "keyword"
+        assert schemas["project_id"].is_tenant is True
+        # year is stored as an int, so only an integer index serves year filters
+        assert schemas["year"] == PayloadSchemaType.INTEGER
+        assert schemas["chunk_text"].tokenizer == TokenizerType.WORD
+    
+    def test_numpy_embeddings_build_named_dense_vectors(self, qdrant_adapter, test_project_id):
+        """Test that float32 ndarray embeddings are stored under the named 'dense' vector."""
+        items = [{"id": "chunk-np", "text": "t", "embedding": np.full(384, 0.1, dtype=np.float32)}]
         
-        qdrant_adapter._ensure_collection(
-            collection_name=collection_name,
-            vector_size=384,
-            dense_model_id="fastembed/all-MiniLM-L6-v2",
-        )
-        
-        # Payload indexes should be created for:
-        # - project_id
-        # - doc_id
-        # - citekey
-        # - year
-        # - tags
+        batch = qdrant_adapter._build_points(items, test_project_id, "fastembed/all-MiniLM-L6-v2")
         
-        # In real Qdrant, would verify indexes exist via client API
+        dense = batch.vectors["dense"][0]
+        assert len(dense) == 384
+        assert isinstance(dense[0], float)
+        assert dense[0] == pytest.approx(0.1)
     
     def test_fulltext_index_creation_when_hybrid(self, qdrant_adapter, test_project_id):
         """Test that full-text index is created when hybrid search is enabled."""
@@ -261,10 +324,196 @@ class TestQdrantModelConsistency:
             # (Would verify in real Qdrant scenario)
 
 
+class TestQdrantEnsuredCollectionCache:
+    """Tests for the process-scoped cache of already-ensured collections."""
+    
+    def test_repeat_ensure_skips_round_trips(self, mock_client_adapter):
+        """Test that ensuring the same collection again makes no Qdrant calls."""
+        ensure_kwargs = {
+            "collection_name": "proj-cache-test",
+            "vector_size": 384,
+            "dense_model_id": "fastembed/all-MiniLM-L6-v2",
+        }
+        mock_client_adapter._ensure_collection(**ensure_kwargs)
+        mock_client_adapter._client.reset_mock()
+        
+        mock_client_adapter._ensure_collection(**ensure_kwargs)
+        
+        assert mock_client_adapter._client.method_calls == []
+    
+    def test_model_change_still_hits_write_guard(self, mock_client_adapter):
+        """Test that a cached collection still rejects a different dense model."""
+        mock_client_adapter._ensure_collection(
+            collection_name="proj-cache-test",
+            vector_size=384,
+            dense_model_id="fastembed/all-MiniLM-L6-v2",
+        )
+        mock_client_adapter._client.collection_exists.return_value = True
+        
+        with pytest.raises(EmbeddingModelMismatch):
+            mock_client_adapter._ensure_collection(
+                collection_name="proj-cache-test",
+                vector_size=384,
+                dense_model_id="fastembed/bge-small-en-v1.5",
+            )
+    
+    def test_recreate_invalidates_cache(self, mock_client_adapter):
+        """Test that recreate bypasses the cache and recreates the collection."""
+        ensure_kwargs = {
+            "collection_name": "proj-cache-test",
+            "vector_size": 384,
+            "dense_model_id": "fastembed/all-MiniLM-L6-v2",
+        }
+        mock_client_adapter._ensure_collection(**ensure_kwargs)
+        mock_client_adapter._client.collection_exists.return_value = True
+        
+        mock_client_adapter._ensure_collection(**ensure_kwargs, recreate=True)
+        
+        mock_client_adapter._client.delete_collection.assert_called_once_with("proj-cache-test")
+        mock_client_adapter._client.create_collection.assert_called()
+    
+    def test_failed_upsert_invalidates_cache(self, mock_client_adapter):
+        """Test that exhausted upsert retries make the next call re-check the collection."""
+        ensure_kwargs = {
+            "collection_name": "proj-cache-test",
+            "vector_size": 384,
+            "dense_model_id": "fastembed/all-MiniLM-L6-v2",
+        }
+        mock_client_adapter._ensure_collection(**ensure_kwargs)
+        # Collection deleted outside this process: every upsert now fails
+        mock_client_adapter._client.upsert.side_effect = Exception("Not found: collection")
+        
+        with patch("time.sleep"), pytest.raises(RuntimeError):
+            mock_client_adapter._upsert_points_with_retry("proj-cache-test", Mock(ids=["p1"]))
+        
+        assert (mock_client_adapter.url, "proj-cache-test") not in _ensured_collections
+        mock_client_adapter._client.reset_mock()
+        mock_client_adapter._ensure_collection(**ensure_kwargs)
+        mock_client_adapter._client.collection_exists.assert_called_once_with("proj-cache-test")
+        mock_client_adapter._client.create_collection.assert_called_once()
+    
+    def test_project_not_found_invalidates_cache(self, mock_client_adapter):
+        """Test that a search failing with ProjectNotFound evicts the cached collection."""
+        project_id = "citeloom/cache-test"
+        collection_name = mock_client_adapter._collection_name(project_id)
+        mock_client_adapter._ensure_collection(
+            collection_name=collection_name,
+            vector_size=384,
+            dense_model_id="fastembed/all-MiniLM-L6-v2",
+        )
+        mock_client_adapter._client.query_points.side_effect = Exception("Not found: collection")
+        
+        with pytest.raises(ProjectNotFound):
+            mock_client_adapter.search([0.1] * 384, project_id=project_id)
+        
+        assert (mock_client_adapter.url, collection_name) not in _ensured_collections
+
+
+class TestQdrantScalarQuantization:
+    """Tests for int8 scalar quantization of dense vectors."""
+    
+    def test_new_collection_is_quantized(self, mock_client_adapter):
+        """Test that new collections keep int8 vectors in RAM and originals on disk."""
+        mock_client_adapter._ensure_collection(
+            collection_name="proj-int8-test",
+            vector_size=384,
+            dense_model_id="fastembed/all-MiniLM-L6-v2",
+        )
+        
+        kwargs = mock_client_adapter._client.create_collection.call_args.kwargs
+        scalar = kwargs["quantization_config"].scalar
+        assert scalar.type == ScalarType.INT8
+        assert scalar.always_ram is True
+        assert kwargs["vectors_config"]["dense"].on_disk is True
+    
+    def test_quantization_disabled(self, mock_client_adapter, monkeypatch):
+        """Test that disabling quantization keeps plain in-RAM float32 vectors."""
+        monkeypatch.setattr(mock_client_adapter, "scalar_quantization", False)
+        
+        mock_client_adapter._ensure_collection(
+            collection_name="proj-int8-test",
+            vector_size=384,
+            dense_model_id="fastembed/all-MiniLM-L6-v2",
+        )
+        
+        kwargs = mock_client_adapter._client.create_collection.call_args.kwargs
+        assert kwargs["quantization_config"] is None
+        assert kwargs["vectors_config"]["dense"].on_disk is False
+        assert mock_client_adapter._search_params(10).quantization is None
+    
+    def test_search_rescores_with_oversampling(self, mock_client_adapter, test_project_id):
+        """Test that dense search asks Qdrant to rescore oversampled int8 candidates."""
+        mock_client_adapter._client.query_points.return_value.points = []
+        
+        mock_client_adapter.search(query_vector=[0.1] * 384, project_id=test_project_id, top_k=3)
+        
+        params = mock_client_adapter._client.query_points.call_args.kwargs["search_params"]
+        assert params.quantization.rescore is True
+        assert params.quantization.oversampling == 2.0
+
+
+class TestQdrantHnswTuning:
+    """Tests for HNSW build and search parameters."""
+    
+    def test_new_collection_sets_hnsw_config(self, mock_client_adapter):
+        """Test that collections are created with explicit m / ef_construct."""
+        mock_client_adapter._ensure_collection(
+            collection_name="proj-hnsw-test",
+            vector_size=384,
+            dense_model_id="fastembed/all-MiniLM-L6-v2",
+        )
+        
+        hnsw = mock_client_adapter._client.create_collection.call_args.kwargs["hnsw_config"]
+        assert (hnsw.m, hnsw.ef_construct, hnsw.on_disk) == (16, 100, False)
+    
+    @pytest.mark.parametrize(
+        ("top_k", "hnsw_ef", "expected_ef"),
+        [(10, None, 64), (100, None, 100), (10, 256, 256), (10, 4, 10)],
+    )
+    def test_search_hnsw_ef(self, mock_client_adapter, test_project_id, top_k, hnsw_ef, expected_ef):
+        """Test that the search beam defaults to 64, honors overrides, and never drops below top_k."""
+        mock_client_adapter._client.query_points.return_value.points = []
+        
+        mock_client_adapter.search(
+            query_vector=[0.1] * 384,
+            project_id=test_project_id,
+            top_k=top_k,
+            hnsw_ef=hnsw_ef,
+        )
+        
+        params = mock_client_adapter._client.query_points.call_args.kwargs["search_params"]
+        assert params.hnsw_ef == expected_ef
+
+
+class TestQdrantTransport:
+    """Tests for choosing the Qdrant client transport."""
+    
+    def test_prefers_grpc_and_falls_back_to_rest(self, monkeypatch):
+        """Test that the adapter tries gRPC first and uses REST when gRPC is unreachable."""
+        attempts: list[bool] = []
+        
+        class FakeClient:
+            def __init__(self, url: str, prefer_grpc: bool) -> None:
+                attempts.append(prefer_grpc)
+                self.prefer_grpc = prefer_grpc
+            
+            def get_collections(self) -> list[Any]:
+                if self.prefer_grpc:
+                    raise ConnectionError("gRPC port closed")
+                return []
+        
+        monkeypatch.setattr(qdrant_index, "QdrantClient", FakeClient)
+        
+        adapter = QdrantIndexAdapter()
+        
+        assert attempts == [True, False]
+        assert adapter._client.prefer_grpc is False
+
+
 class TestQdrantProjectIsolation:
     """Tests for per-project collection isolation."""
     
-    def test_projects_have_separate_collections(self, qdrant_adapter):
+    async def test_projects_have_separate_collections(self, qdrant_adapter):
         """Test that different projects use separate collections."""
         project_id1 = "project/a"
         project_id2 = "project/b"
@@ -287,26 +536,21 @@ class TestQdrantProjectIsolation:
         
         model_id = "fastembed/all-MiniLM-L6-v2"
         
-        # Upsert to different projects
-        qdrant_adapter.upsert(items1, project_id=project_id1, model_id=model_id)
-        qdrant_adapter.upsert(items2, project_id=project_id2, model_id=model_id)
-        
-        # Search should return project-specific results
-        results1 = qdrant_adapter.search(
-            query_vector=[0.1] * 384,
-            project_id=project_id1,
-            top_k=10,
+        # Upsert to different projects concurrently (independent collections)
+        await asyncio.gather(
+            qdrant_adapter.aupsert(items1, project_id=project_id1, model_id=model_id),
+            qdrant_adapter.aupsert(items2, project_id=project_id2, model_id=model_id),
         )
         
-        results2 = qdrant_adapter.search(
-            query_vector=[0.2] * 384,
-            project_id=project_id2,
-            top_k=10,
+        # Search should return project-specific results
+        results1, results2 = await asyncio.gather(
+            qdrant_adapter.asearch([0.1] * 384, project_id=project_id1, top_k=10),
+            qdrant_adapter.asearch([0.2] * 384, project_id=project_id2, top_k=10),
         )
         
-        # Results should be isolated (would verify in real Qdrant)
-        assert len(results1) >= 0
-        assert len(results2) >= 0
+        # Results should be isolated per project
+        assert results1 and all(r["payload"]["project_id"] == project_id1 for r in results1)
+        assert results2 and all(r["payload"]["project_id"] == project_id2 for r in results2)
     
     def test_project_filtering_enforcement(self, qdrant_adapter, test_project_id):
         """Test that search enforces server-side project filtering."""
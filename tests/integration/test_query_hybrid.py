@@ -5,11 +5,16 @@ from src.application.use_cases.query_chunks import query_chunks
 from src.infrastructure.adapters.fastembed_embeddings import FastEmbedAdapter
 from src.infrastructure.adapters.qdrant_index import QdrantIndexAdapter
 
+PROJECT_ID = "citeloom/test-query-hybrid"
 
-def test_query_hybrid_modes_execute():
+
+def test_query_hybrid_modes_execute(
+    embedding_adapter: FastEmbedAdapter,
+    qdrant_index: QdrantIndexAdapter,
+):
     """Test that both dense-only and hybrid search modes execute successfully."""
-    embed = FastEmbedAdapter()
-    index = QdrantIndexAdapter(create_fulltext_index=True)
+    embed = embedding_adapter
+    index = qdrant_index
     
     # Create test chunks with embeddings
     texts = [
@@ -37,11 +42,11 @@ def test_query_hybrid_modes_execute():
     
     # Upsert chunks
     model_id = embed.model_id
-    index.upsert(items, project_id="citeloom/test", model_id=model_id)
+    index.upsert(items, project_id=PROJECT_ID, model_id=model_id)
     
     # Test dense-only search
     req_dense = QueryRequest(
-        project_id="citeloom/test",
+        project_id=PROJECT_ID,
         query_text="entities",
         top_k=1,
         hybrid=False,
@@ -54,7 +59,7 @@ def test_query_hybrid_modes_execute():
     
     # Test hybrid search
     req_hybrid = QueryRequest(
-        project_id="citeloom/test",
+        project_id=PROJECT_ID,
         query_text="entities",
         top_k=1,
         hybrid=True,
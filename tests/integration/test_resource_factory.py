@@ -1,10 +1,19 @@
 """Integration tests for resource factory functions (User Story 4)."""
 
+from unittest.mock import Mock
+
 import pytest
+from src.infrastructure.adapters import docling_converter
 from src.infrastructure.adapters.docling_converter import (
     DoclingConverterAdapter,
     get_converter,
     _converter_cache,
+    _CONVERTER_CACHE_MAXSIZE,
+)
+from src.infrastructure.adapters.qdrant_index import (
+    QdrantIndexAdapter,
+    get_qdrant_index,
+    _qdrant_cache,
 )
 
 
@@ -91,6 +100,23 @@ class TestConverterFactory:
         # Verify only one instance in cache
         assert len(_converter_cache) == 1, "Should have only one cached instance for default key"
     
+    def test_cache_evicts_least_recently_used_configuration(self, monkeypatch):
+        """Test that the converter cache is bounded and evicts the least recently used entry."""
+        # Construction cost is irrelevant to eviction; avoid loading Docling models
+        monkeypatch.setattr(docling_converter, "DoclingConverterAdapter", lambda **kwargs: object())
+        
+        first = get_converter("config0")
+        for i in range(1, _CONVERTER_CACHE_MAXSIZE):
+            get_converter(f"config{i}")
+        assert get_converter("config0") is first  # Refreshes config0's recency
+        
+        get_converter("overflow")
+        
+        assert len(_converter_cache) == _CONVERTER_CACHE_MAXSIZE
+        assert get_converter("config0") is first, "Recently used converter should survive"
+        assert not any(key.startswith("converter:config1:") for key in _converter_cache), \
+            "Least recently used converter should be evicted"
+    
     def test_process_scoped_lifetime(self):
         """
         T043: Verify process-scoped lifetime (no inactivity-based cleanup).
@@ -151,3 +177,70 @@ class TestConverterFactory:
             "Module-level cache should be shared across all imports"
 
 
+class TestQdrantIndexFactory:
+    """Tests for get_qdrant_index() factory function."""
+    
+    def setup_method(self):
+        """Clear cache before each test to ensure isolation."""
+        _qdrant_cache.clear()
+    
+    def teardown_method(self):
+        """Clear cache after each test so no patched adapter leaks to later tests on this worker."""
+        _qdrant_cache.clear()
+    
+    def test_factory_returns_same_instance_on_multiple_calls(self):
+        """Verify that get_qdrant_index() implements singleton pattern correctly."""
+        index1 = get_qdrant_index()
+        assert isinstance(index1, QdrantIndexAdapter)
+        
+        index2 = get_qdrant_index()
+        assert index2 is index1, "Factory should return same instance on subsequent calls"
+        
+        # Verify cache key format
+        assert "qdrant:default:url=http://localhost:6333:fulltext=True:int8=True:grpc=True" in _qdrant_cache
+    
+    def test_factory_different_settings_create_separate_instances(self):
+        """Test that different URLs or full-text settings create separate instances."""
+        index1 = get_qdrant_index(create_fulltext_index=True)
+        index2 = get_qdrant_index(create_fulltext_index=False)
+        index3 = get_qdrant_index(create_fulltext_index=True)
+        
+        assert index1 is not index2, "Different settings should create separate instances"
+        assert index1 is index3, "Same settings should return same instance"
+        assert index2.create_fulltext_index is False
+    
+    def test_factory_reconnects_in_memory_fallback(self, monkeypatch):
+        """Test that a cached adapter without a client reconnects once the backoff has elapsed."""
+        connected = Mock()
+        monkeypatch.setattr(QdrantIndexAdapter, "_connect", staticmethod(lambda url, prefer_grpc: None))
+        index1 = get_qdrant_index()
+        assert index1._client is None
+        index1._local["proj-outage"] = {"items": {}}
+        
+        # Qdrant comes up later in the process lifetime, after the backoff deadline
+        monkeypatch.setattr(QdrantIndexAdapter, "_connect", staticmethod(lambda url, prefer_grpc: connected))
+        index1._next_reconnect_at = 0.0
+        index2 = get_qdrant_index()
+        
+        assert index2 is index1, "Reconnection should reuse the cached instance"
+        assert index2._client is connected
+        assert index2._local == {}, "In-memory data from the outage is discarded on reconnect"
+    
+    def test_factory_reconnect_is_rate_limited(self, monkeypatch):
+        """Test that reconnection attempts back off instead of running on every call."""
+        connect = Mock(return_value=None)
+        monkeypatch.setattr(QdrantIndexAdapter, "_connect", staticmethod(connect))
+        index = get_qdrant_index(prefer_grpc=False)
+        assert connect.call_count == 1
+        
+        # Within the backoff window: no connection attempt
+        get_qdrant_index(prefer_grpc=False)
+        assert connect.call_count == 1
+        
+        # Deadline passed: one attempt, then the delay doubles
+        delay = index._reconnect_delay
+        index._next_reconnect_at = 0.0
+        get_qdrant_index(prefer_grpc=False)
+        get_qdrant_index(prefer_grpc=False)
+        assert connect.call_count == 2
+        assert index._reconnect_delay == delay * 2
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from unittest.mock import Mock, MagicMock
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from unittest.mock import Mock
 
 import pytest
 
@@ -10,18 +13,41 @@ from src.application.ports.annotation_resolver import Annotation
 from src.infrastructure.adapters.zotero_annotation_resolver import ZoteroAnnotationResolverAdapter
 
 
+@dataclass(frozen=True, slots=True)
+class _FakeMetadata:
+    """Resolved citation metadata stand-in (index_annotations reads these four fields)."""
+    citekey: str = "test2024"
+    title: str = "Test Document"
+    authors: list[str] = field(default_factory=lambda: ["Author 1"])
+    year: int = 2024
+
+
+_FAKE_METADATA = _FakeMetadata()
+
+# Mock embedding vector, allocated once; a tuple so no test can mutate the shared value
+_MOCK_EMBEDDING = (0.1,) * 384
+
+
 @pytest.fixture
 def mock_embedder():
     """Create a mock EmbeddingPort."""
     embedder = Mock()
-    embedder.embed.return_value = [[0.1] * 384]  # Mock embedding vector
+    embedder.embed.return_value = (_MOCK_EMBEDDING,)
     return embedder
 
 
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch) -> Mock:
+    """Replace the retry backoff sleep with a recorder, so backoff is asserted but never slept."""
+    sleep = Mock()
+    monkeypatch.setattr("time.sleep", sleep)
+    return sleep
+
+
 @pytest.fixture
 def mock_zotero_client():
     """Create a mock pyzotero client."""
-    client = MagicMock()
+    client = Mock()
     return client
 
 
@@ -85,7 +111,7 @@ class TestAnnotationResolverExtraction:
 
         assert annotations == []
 
-    def test_fetch_annotations_retry_on_failure(self, mock_embedder, mock_zotero_client):
+    def test_fetch_annotations_retry_on_failure(self, mock_embedder, mock_zotero_client, no_sleep):
         """Test that retry logic works on transient failures."""
         # First call fails, second succeeds
         mock_zotero_client.children.side_effect = [
@@ -106,13 +132,16 @@ class TestAnnotationResolverExtraction:
         resolver = ZoteroAnnotationResolverAdapter(embedder=mock_embedder)
         annotations = resolver.fetch_annotations("ATTACH1", mock_zotero_client)
 
+        assert mock_zotero_client.children.call_count == 2
+        no_sleep.assert_called_once()
         assert len(annotations) == 1
         assert annotations[0].quote == "Success"
 
-    def test_fetch_annotations_graceful_degradation(self, mock_embedder, mock_zotero_client):
+    def test_fetch_annotations_graceful_degradation(self, mock_embedder, mock_zotero_client, no_sleep):
         """Test that annotation fetch fails gracefully (returns empty list)."""
-        # All retries fail
-        mock_zotero_client.children.side_effect = Exception("Permanent error")
+        # All retries fail; a finite list means an extra attempt raises StopIteration instead of looping
+        max_retries = 3
+        mock_zotero_client.children.side_effect = [Exception("Permanent error")] * max_retries
 
         resolver = ZoteroAnnotationResolverAdapter(embedder=mock_embedder)
         # Should not raise, but return empty list after retries
@@ -120,6 +149,37 @@ class TestAnnotationResolverExtraction:
 
         # Should gracefully return empty list
         assert annotations == []
+        assert mock_zotero_client.children.call_count == max_retries
+
+        # Exponential backoff between attempts (1s, 2s with ±25% jitter), none after the last
+        delays = [call.args[0] for call in no_sleep.call_args_list]
+        assert len(delays) == max_retries - 1
+        for attempt, delay in enumerate(delays):
+            assert 0.75 * 2**attempt <= delay <= 1.25 * 2**attempt
+
+    def test_fetch_annotations_concurrent(self, mock_embedder):
+        """Test that one resolver serves concurrent fetches across attachments."""
+        workers = 8
+        # Each children() call waits until all workers are inside one; a serialized
+        # fetch path would time out the barrier and fail the fetch
+        barrier = threading.Barrier(workers, timeout=5)
+
+        def children(attachment_key, itemType):
+            barrier.wait()
+            return [{"data": {"pageIndex": 0, "text": f"Quote {attachment_key}", "tags": []}}]
+
+        clients = [Mock(children=Mock(side_effect=children)) for _ in range(workers * 2)]
+        resolver = ZoteroAnnotationResolverAdapter(embedder=mock_embedder)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(
+                lambda pair: resolver.fetch_annotations(f"ATTACH{pair[0]}", pair[1]),
+                enumerate(clients),
+            ))
+
+        assert [[ann.quote for ann in result] for result in results] == [
+            [f"Quote ATTACH{i}"] for i in range(len(clients))
+        ]
 
 
 class TestAnnotationResolverIndexing:
@@ -128,15 +188,9 @@ class TestAnnotationResolverIndexing:
     def test_index_annotations_creates_payloads(self, mock_embedder):
         """Test that index_annotations creates correct payload structure."""
         mock_vector_index = Mock()
-        mock_vector_index.upsert_chunks.return_value = None
 
         mock_metadata_resolver = Mock()
-        mock_metadata_resolver.resolve.return_value = Mock(
-            citekey="test2024",
-            title="Test Document",
-            authors=["Author 1"],
-            year=2024,
-        )
+        mock_metadata_resolver.resolve.return_value = _FAKE_METADATA
 
         resolver = ZoteroAnnotationResolverAdapter(embedder=mock_embedder)
 
@@ -161,35 +215,62 @@ class TestAnnotationResolverIndexing:
         )
 
         # Verify indexing result
-        # Note: Indexing may skip if embedding fails or other conditions aren't met
-        # The mock embedder should work, but if it doesn't, we'll get 0
-        if indexed_count == 0:
-            # If indexing failed, skip this test (embedding likely failed)
-            pytest.skip("Indexing skipped - likely due to embedding failure or other condition")
-        
         assert indexed_count == 1
-        mock_vector_index.upsert_chunks.assert_called_once()
+        mock_vector_index.upsert.assert_called_once()
         
         # Verify payload structure
-        call_args = mock_vector_index.upsert_chunks.call_args
-        chunks = call_args[0][0]  # First positional argument
+        items = mock_vector_index.upsert.call_args.kwargs["items"]
         
-        assert len(chunks) == 1
-        chunk = chunks[0]
+        assert len(items) == 1
+        payload = items[0]["payload"]
         
         # Verify payload has zotero keys
-        assert "zotero" in chunk.payload
-        assert chunk.payload["zotero"]["item_key"] == "ITEM1"
-        assert chunk.payload["zotero"]["attachment_key"] == "ATTACH1"
-        assert "annotation" in chunk.payload["zotero"]
-        assert chunk.payload["zotero"]["annotation"]["page"] == 1
-        assert chunk.payload["zotero"]["annotation"]["quote"] == "Test quote"
-        assert chunk.payload["zotero"]["annotation"]["comment"] == "Test comment"
-        assert chunk.payload["zotero"]["annotation"]["color"] == "#FF0000"
-        assert chunk.payload["zotero"]["annotation"]["tags"] == ["important"]
+        assert "zotero" in payload
+        assert payload["zotero"]["item_key"] == "ITEM1"
+        assert payload["zotero"]["attachment_key"] == "ATTACH1"
+        assert "annotation" in payload["zotero"]
+        assert payload["zotero"]["annotation"]["page"] == 1
+        assert payload["zotero"]["annotation"]["quote"] == "Test quote"
+        assert payload["zotero"]["annotation"]["comment"] == "Test comment"
+        assert payload["zotero"]["annotation"]["color"] == "#FF0000"
+        assert payload["zotero"]["annotation"]["tags"] == ["important"]
+
+        # Verify resolved citation metadata is carried into the payload
+        assert payload["citekey"] == "test2024"
+        assert payload["authors"] == ["Author 1"]
 
         # Verify type tag
-        assert chunk.payload.get("type") == "annotation"
+        assert payload.get("type") == "annotation"
+
+    @pytest.mark.parametrize(
+        ("batch_size", "expected_calls"),
+        [(256, 1), (10, 4)],
+    )
+    def test_index_annotations_embeds_in_batches(self, batch_size, expected_calls):
+        """Test that annotation texts are embedded in bulk, not one embed() call each."""
+        embedder = Mock()
+        embedder.embed.side_effect = lambda texts, model_id=None: [[0.1] * 384 for _ in texts]
+        mock_vector_index = Mock()
+
+        resolver = ZoteroAnnotationResolverAdapter(embedder=embedder)
+        annotations = [Annotation(page=i, quote=f"Quote {i}") for i in range(32)]
+
+        indexed_count = resolver.index_annotations(
+            annotations=annotations,
+            item_key="ITEM1",
+            attachment_key="ATTACH1",
+            project_id="test-project",
+            vector_index=mock_vector_index,
+            embedding_model="fastembed/all-MiniLM-L6-v2",
+            embedding_batch_size=batch_size,
+        )
+
+        assert indexed_count == 32
+        assert embedder.embed.call_count == expected_calls
+        assert sum(len(call.args[0]) for call in embedder.embed.call_args_list) == 32
+        mock_vector_index.upsert.assert_called_once()
+        items = mock_vector_index.upsert.call_args.kwargs["items"]
+        assert [item["payload"]["page_start"] for item in items] == list(range(32))
 
     def test_index_annotations_empty_list(self, mock_embedder):
         """Test that indexing empty list returns 0."""
@@ -208,4 +289,4 @@ class TestAnnotationResolverIndexing:
         )
 
         assert indexed_count == 0
-        mock_vector_index.upsert_chunks.assert_not_called()
+        mock_vector_index.upsert.assert_not_called()
@@ -2,53 +2,163 @@
 
 from __future__ import annotations
 
+import gc
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Callable
+
 import pytest
 
-# Performance test: Collection browsing should be < 2 seconds (SC-001)
-# This test may be skipped if Zotero database is not available
+pytest.importorskip("pytest_benchmark")
+
+from src.infrastructure.adapters.zotero_local_db import LocalZoteroDbAdapter
 
+# Performance test: Collection browsing should be < 2 seconds (SC-001)
+# Runs against a synthetic local DB at several library sizes so the scaling curve is visible
+
+# Coverage tracing inflates timings many times over; pytest-cov pauses it for no_cover tests.
+# Deselected by the default xdist run (pytest.ini); run with: pytest -n0 -m benchmark
+pytestmark = [pytest.mark.no_cover, pytest.mark.benchmark]
+
+_SC001_SECONDS = 2.0
+_ITEMS_PER_COLLECTION = 10
+_TAG_COUNT = 50
+
+
+def _build_zotero_db(db_path: Path, collection_count: int) -> None:
+    """Write a Zotero-like SQLite DB with collection_count collections and their items/tags."""
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript("""
+        CREATE TABLE collections (
+            collectionID INTEGER PRIMARY KEY,
+            collectionName TEXT,
+            parentCollectionID INTEGER,
+            key TEXT UNIQUE
+        );
+        CREATE TABLE items (
+            itemID INTEGER PRIMARY KEY,
+            itemTypeID INTEGER,
+            key TEXT UNIQUE,
+            dateAdded TEXT,
+            dateModified TEXT,
+            data TEXT
+        );
+        CREATE TABLE collectionItems (
+            collectionID INTEGER,
+            itemID INTEGER,
+            PRIMARY KEY (collectionID, itemID)
+        );
+        CREATE TABLE tags (
+            tagID INTEGER PRIMARY KEY,
+            name TEXT UNIQUE
+        );
+        CREATE TABLE itemTags (
+            itemID INTEGER,
+            tagID INTEGER,
+            PRIMARY KEY (itemID, tagID)
+        );
+    """)
+
+    conn.executemany(
+        "INSERT INTO collections VALUES (?, ?, ?, ?)",
+        (
+            # Every tenth collection is top-level; the rest nest under it
+            (cid, f"Collection {cid}", None if cid % 10 == 1 else (cid - 1) // 10 * 10 + 1, f"COL{cid}")
+            for cid in range(1, collection_count + 1)
+        ),
+    )
+    item_count = collection_count * _ITEMS_PER_COLLECTION
+    conn.executemany(
+        "INSERT INTO items (itemID, itemTypeID, key, dateAdded, data) VALUES (?, 2, ?, '2024-01-01T00:00:00Z', ?)",
+        (
+            (
+                iid,
+                f"ITEM{iid}",
+                json.dumps({
+                    "itemType": "journalArticle",
+                    "title": f"Title {iid}",
+                    "creators": [{"firstName": "Ada", "lastName": "Author", "creatorType": "author"}],
+                    "date": "2024",
+                }),
+            )
+            for iid in range(1, item_count + 1)
+        ),
+    )
+    conn.executemany(
+        "INSERT INTO collectionItems VALUES (?, ?)",
+        ((1 + (iid - 1) // _ITEMS_PER_COLLECTION, iid) for iid in range(1, item_count + 1)),
+    )
+    conn.executemany("INSERT INTO tags VALUES (?, ?)", ((tid, f"tag-{tid}") for tid in range(1, _TAG_COUNT + 1)))
+    conn.executemany(
+        "INSERT INTO itemTags VALUES (?, ?)",
+        ((iid, 1 + iid % _TAG_COUNT) for iid in range(1, item_count + 1)),
+    )
+    conn.commit()
+    conn.close()
+
+
+@pytest.fixture(scope="module", params=[10, 100, 1000], ids=lambda n: f"{n}-collections")
+def adapter(request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory) -> LocalZoteroDbAdapter:
+    """Local DB adapter over a synthetic library, built once per library size."""
+    directory = tmp_path_factory.mktemp("zotero")
+    db_path = directory / "zotero.sqlite"
+    _build_zotero_db(db_path, request.param)
+    return LocalZoteroDbAdapter(db_path=db_path, storage_dir=directory / "storage")
+
+
+@pytest.fixture
+def measure(benchmark: Any) -> Callable[[Callable[[], Any]], float]:
+    """
+    Return a function that benchmarks a call and gives its median time in seconds.
 
-@pytest.mark.skip(reason="Requires Zotero database accessible")
-def test_collection_listing_performance():
+    Two warmup rounds then ten measured rounds, with GC paused so collection
+    pauses don't land in the measurement.
+    """
+    def _measure(func: Callable[[], Any]) -> float:
+        gc.collect()
+        gc.disable()
+        try:
+            benchmark.pedantic(func, rounds=10, warmup_rounds=2)
+        finally:
+            gc.enable()
+        if benchmark.stats is None:
+            # pytest-benchmark disables itself under xdist; a silent pass would hide regressions
+            pytest.fail("benchmarks disabled (run with -n0 -m benchmark)")
+        return benchmark.stats.stats.median
+
+    return _measure
+
+
+def test_collection_listing_performance(adapter: LocalZoteroDbAdapter, measure):
     """
     Performance test for collection listing operations.
 
     SC-001: Collection browsing: < 2 seconds using local DB.
-
-    This test requires:
-    - Local Zotero database accessible
-    - LocalZoteroDbAdapter configured
     """
-    import time
-
-    # TODO: Create adapter with real database
-    # adapter = LocalZoteroDbAdapter()
-
-    start_time = time.time()
-    # collections = adapter.list_collections()
-    elapsed = time.time() - start_time
+    median = measure(adapter.list_collections)
 
-    # Assert performance target
-    assert elapsed < 2.0, f"Collection listing took {elapsed:.3f}s, expected < 2.0s"
+    assert median < _SC001_SECONDS, f"Collection listing took {median:.3f}s, expected < 2.0s"
 
-    pytest.skip("Test infrastructure not yet implemented")
 
-
-@pytest.mark.skip(reason="Requires Zotero database accessible")
-def test_collection_items_browsing_performance():
+def test_collection_items_browsing_performance(adapter: LocalZoteroDbAdapter, measure):
     """
     Performance test for browsing collection items.
 
-    Similar to test_collection_listing_performance but tests get_collection_items().
+    Similar to test_collection_listing_performance but tests get_collection_items()
+    on a top-level collection, including its subcollections.
     """
-    pytest.skip("Test infrastructure not yet implemented")
+    median = measure(lambda: list(adapter.get_collection_items("1", include_subcollections=True)))
+
+    assert median < _SC001_SECONDS, f"Collection items browsing took {median:.3f}s, expected < 2.0s"
 
 
-@pytest.mark.skip(reason="Requires Zotero database accessible")
-def test_tags_listing_performance():
+def test_tags_listing_performance(adapter: LocalZoteroDbAdapter, measure):
     """
     Performance test for listing tags with usage counts.
 
     Tests list_tags() performance.
     """
-    pytest.skip("Test infrastructure not yet implemented")
+    median = measure(adapter.list_tags)
+
+    assert median < _SC001_SECONDS, f"Tag listing took {median:.3f}s, expected < 2.0s"
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import hashlib
+from dataclasses import replace
 from pathlib import Path
+from unittest.mock import Mock
 
 import pytest
 
@@ -11,24 +14,37 @@ from src.domain.models.download_manifest import DownloadManifestAttachment
 from src.domain.services.content_fingerprint import ContentFingerprintService
 
 
-@pytest.fixture
-def sample_file(tmp_path: Path) -> Path:
-    """Create a sample file for testing."""
-    test_file = tmp_path / "test.pdf"
-    content = b"Test document content for fingerprinting " * 100
-    test_file.write_bytes(content)
+_SAMPLE_CONTENT = b"Test document content for fingerprinting " * 100
+_MODIFIED_CONTENT = b"Modified test document content " * 100
+
+
+@pytest.fixture(scope="module")
+def sample_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a sample file for testing (written once per module; tests only read it)."""
+    test_file = tmp_path_factory.mktemp("dedup") / "test.pdf"
+    test_file.write_bytes(_SAMPLE_CONTENT)
     return test_file
 
 
-@pytest.fixture
-def modified_file(tmp_path: Path) -> Path:
+@pytest.fixture(scope="module")
+def modified_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Create a modified version of the file."""
-    test_file = tmp_path / "test_modified.pdf"
-    content = b"Modified test document content " * 100
-    test_file.write_bytes(content)
+    test_file = tmp_path_factory.mktemp("dedup") / "test_modified.pdf"
+    test_file.write_bytes(_MODIFIED_CONTENT)
     return test_file
 
 
+@pytest.fixture(scope="module")
+def baseline_fp(sample_file: Path) -> ContentFingerprint:
+    """Fingerprint of the sample file under the default model and policies, computed once."""
+    return ContentFingerprintService.compute_fingerprint(
+        file_path=sample_file,
+        embedding_model="fastembed/all-MiniLM-L6-v2",
+        chunking_policy_version="1.0",
+        embedding_policy_version="1.0",
+    )
+
+
 class TestIncrementalDeduplication:
     """Test incremental deduplication logic."""
 
@@ -81,84 +97,61 @@ class TestIncrementalDeduplication:
         assert fp1.matches(fp2) is False
         assert ContentFingerprintService.is_unchanged(fp1, fp2) is False
 
-    def test_fingerprint_invalidated_by_policy_change(self, sample_file: Path):
-        """Test that fingerprints are invalidated when policy changes."""
-        embedding_model = "fastembed/all-MiniLM-L6-v2"
-
-        # Original fingerprint with policy 1.0
-        fp_old = ContentFingerprintService.compute_fingerprint(
-            file_path=sample_file,
-            embedding_model=embedding_model,
-            chunking_policy_version="1.0",
-            embedding_policy_version="1.0",
-        )
-
-        # New fingerprint with policy 2.0
-        fp_new = ContentFingerprintService.compute_fingerprint(
-            file_path=sample_file,
-            embedding_model=embedding_model,
-            chunking_policy_version="2.0",  # Policy changed
-            embedding_policy_version="1.0",
-        )
-
-        # Should not match (policy version differs)
-        assert fp_old.chunking_policy_version != fp_new.chunking_policy_version
-        # Hash should be different due to policy version in hash
-        assert fp_old.content_hash != fp_new.content_hash
-
-    def test_fingerprint_invalidated_by_embedding_model_change(self, sample_file: Path):
-        """Test that fingerprints are invalidated when embedding model changes."""
-        chunking_policy = "1.0"
-        embedding_policy = "1.0"
-
-        # Original fingerprint with model A
-        fp_old = ContentFingerprintService.compute_fingerprint(
-            file_path=sample_file,
-            embedding_model="fastembed/all-MiniLM-L6-v2",
-            chunking_policy_version=chunking_policy,
-            embedding_policy_version=embedding_policy,
-        )
+    @pytest.mark.parametrize(
+        ("field", "new_value"),
+        [
+            # Policy and model versions are part of the hash, so they force a re-hash
+            ("chunking_policy_version", "2.0"),
+            ("embedding_model", "openai/text-embedding-ada-002"),
+            # Same hash, different mtime: a hypothetical collision that metadata must catch
+            ("file_mtime", "2020-01-01T00:00:00"),
+        ],
+    )
+    def test_fingerprint_invalidated(
+        self,
+        sample_file: Path,
+        baseline_fp: ContentFingerprint,
+        field: str,
+        new_value: str,
+    ):
+        """Test that changing policy, model, or file metadata invalidates a fingerprint."""
+        if field == "file_mtime":
+            fp_new = replace(baseline_fp, **{field: new_value})
+            assert fp_new.content_hash == baseline_fp.content_hash
+        else:
+            params = {
+                "embedding_model": baseline_fp.embedding_model,
+                "chunking_policy_version": baseline_fp.chunking_policy_version,
+                "embedding_policy_version": baseline_fp.embedding_policy_version,
+            }
+            params[field] = new_value
+            fp_new = ContentFingerprintService.compute_fingerprint(file_path=sample_file, **params)
+            # Hash should be different due to the field being part of the hash
+            assert fp_new.content_hash != baseline_fp.content_hash
+
+        assert getattr(fp_new, field) != getattr(baseline_fp, field)
+        assert baseline_fp.matches(fp_new) is False
+
+    def test_is_unchanged_uses_stat_fast_path(
+        self,
+        sample_file: Path,
+        baseline_fp: ContentFingerprint,
+        monkeypatch,
+    ):
+        """Test that re-checking an unchanged file costs a stat, not a read and re-hash."""
+        sha256 = Mock(wraps=hashlib.sha256)
+        monkeypatch.setattr(hashlib, "sha256", sha256)
+        monkeypatch.setattr("builtins.open", Mock(side_effect=AssertionError("file re-read")))
 
-        # New fingerprint with model B
-        fp_new = ContentFingerprintService.compute_fingerprint(
-            file_path=sample_file,
-            embedding_model="openai/text-embedding-ada-002",  # Different model
-            chunking_policy_version=chunking_policy,
-            embedding_policy_version=embedding_policy,
-        )
-
-        # Should not match (embedding model differs)
-        assert fp_old.embedding_model != fp_new.embedding_model
-        # Hash should be different due to model in hash
-        assert fp_old.content_hash != fp_new.content_hash
-
-    def test_collision_protection_with_metadata(self, sample_file: Path):
-        """Test that metadata matching prevents hash collisions."""
-        embedding_model = "fastembed/all-MiniLM-L6-v2"
-        chunking_policy = "1.0"
-        embedding_policy = "1.0"
-
-        fp1 = ContentFingerprintService.compute_fingerprint(
+        computed = ContentFingerprintService.compute_fingerprint(
             file_path=sample_file,
-            embedding_model=embedding_model,
-            chunking_policy_version=chunking_policy,
-            embedding_policy_version=embedding_policy,
-        )
-
-        # Create a fingerprint with same hash but different metadata (hypothetical collision)
-        # In practice, we test that matches() checks metadata too
-
-        fp_collision = ContentFingerprint(
-            content_hash=fp1.content_hash,  # Same hash
-            file_mtime="2020-01-01T00:00:00",  # Different mtime
-            file_size=fp1.file_size,
-            embedding_model=embedding_model,
-            chunking_policy_version=chunking_policy,
-            embedding_policy_version=embedding_policy,
+            embedding_model=baseline_fp.embedding_model,
+            chunking_policy_version=baseline_fp.chunking_policy_version,
+            embedding_policy_version=baseline_fp.embedding_policy_version,
         )
 
-        # Should not match even with same hash (metadata mismatch)
-        assert fp1.matches(fp_collision) is False
+        assert ContentFingerprintService.is_unchanged(baseline_fp, computed) is True
+        assert sha256.call_count == 0  # Stat matched the cached entry, so no re-hash
 
     def test_is_unchanged_with_none_stored(self, sample_file: Path):
         """Test that is_unchanged returns False when no stored fingerprint."""
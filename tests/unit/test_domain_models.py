@@ -447,6 +447,61 @@ def test_content_fingerprint_service_computation(tmp_path):
     assert fp.content_hash != fp4.content_hash  # Different model affects hash
 
 
+def test_content_fingerprint_service_cache_invalidated_on_edit(tmp_path):
+    """Repeat calls reuse the cached fingerprint until the file's mtime/size change."""
+    import os
+
+    from src.domain.services.content_fingerprint import ContentFingerprintService
+
+    test_file = tmp_path / "cached.pdf"
+    test_file.write_bytes(b"original content")
+
+    def compute() -> ContentFingerprint:
+        return ContentFingerprintService.compute_fingerprint(
+            file_path=test_file,
+            embedding_model="fastembed/all-MiniLM-L6-v2",
+            chunking_policy_version="1.0",
+            embedding_policy_version="1.0",
+        )
+
+    fp = compute()
+    assert compute() is fp  # Served from cache, file not re-hashed
+
+    # Same size, bumped mtime: must be re-read rather than served stale
+    test_file.write_bytes(b"modified content")
+    stat = test_file.stat()
+    os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    fp_edited = compute()
+    assert fp_edited.content_hash != fp.content_hash
+
+
+def test_content_fingerprint_service_policy_change_reuses_file_hash(tmp_path):
+    """A model/policy change re-hashes only the suffix, not the file preview."""
+    from unittest.mock import patch
+
+    from src.domain.services.content_fingerprint import ContentFingerprintService
+
+    test_file = tmp_path / "shared.pdf"
+    test_file.write_bytes(b"shared content " * 10)
+
+    fp = ContentFingerprintService.compute_fingerprint(
+        file_path=test_file,
+        embedding_model="fastembed/all-MiniLM-L6-v2",
+        chunking_policy_version="1.0",
+        embedding_policy_version="1.0",
+    )
+    with patch("builtins.open", side_effect=AssertionError("file re-read")):
+        fp_policy = ContentFingerprintService.compute_fingerprint(
+            file_path=test_file,
+            embedding_model="fastembed/all-MiniLM-L6-v2",
+            chunking_policy_version="2.0",
+            embedding_policy_version="1.0",
+        )
+
+    assert fp_policy.content_hash != fp.content_hash
+
+
 def test_content_fingerprint_service_is_unchanged():
     """Test ContentFingerprintService.is_unchanged() method."""
     from datetime import datetime